@@ -0,0 +1,94 @@
+"""Throughput benchmark for encoding ERC-20 transfer calldata.
+
+Encodes ERC-20 ``transfer`` calls with the cached encoders used by the transfer strategies
+and by ``send_user_operation``, and compares them with building a web3 contract for every
+call, which is what those paths did before. Building a contract is slow, so the web3
+baseline encodes fewer calls and its throughput is reported per second. The
+``encode_function_call`` modes are also run with the ERC-20 ABI padded with extra functions,
+as with a large contract ABI.
+
+Usage:
+    uv run python benchmarks/bench_abi_encoding.py [--transfers N] [--baseline-transfers N]
+        [--extra-functions N]
+"""
+
+import argparse
+import time
+
+from web3 import Web3
+
+from cdp.abi_encoder import encode_function_call
+from cdp.actions.evm.transfer.constants import ERC20_ABI
+from cdp.actions.evm.transfer.utils import encode_erc20_function_call
+
+USDC = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+
+
+def _large_abi(extra_functions: int) -> list[dict]:
+    return ERC20_ABI + [
+        {
+            "type": "function",
+            "name": f"extra{i}",
+            "inputs": [{"name": "value", "type": "uint256"}],
+            "outputs": [],
+            "stateMutability": "nonpayable",
+        }
+        for i in range(extra_functions)
+    ]
+
+
+def _recipient(i: int) -> str:
+    return Web3.to_checksum_address(f"0x{i + 1:040x}")
+
+
+def _web3_contract_per_call(i: int) -> str:
+    contract = Web3().eth.contract(address=USDC, abi=ERC20_ABI)
+    return contract.encode_abi("transfer", args=[_recipient(i), i])
+
+
+def _encode_function_call(i: int) -> str:
+    return encode_function_call(ERC20_ABI, "transfer", [_recipient(i), i])
+
+
+def _encode_erc20_function_call(i: int) -> str:
+    return encode_erc20_function_call("transfer", [_recipient(i), i])
+
+
+def main() -> None:
+    """Run the benchmark and print the encoding throughput of each mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transfers", type=int, default=100_000)
+    parser.add_argument("--baseline-transfers", type=int, default=2_000)
+    parser.add_argument("--extra-functions", type=int, default=500)
+    args = parser.parse_args()
+
+    large_abi = _large_abi(args.extra_functions)
+
+    def encode_large_abi(i: int) -> str:
+        return encode_function_call(large_abi, "transfer", [_recipient(i), i])
+
+    modes = {
+        "web3 contract per call": (_web3_contract_per_call, args.baseline_transfers),
+        "encode_function_call": (_encode_function_call, args.transfers),
+        "large ABI": (encode_large_abi, args.transfers),
+        "ERC-20 encoder": (_encode_erc20_function_call, args.transfers),
+    }
+
+    for i in range(10):
+        assert _web3_contract_per_call(i) == _encode_function_call(i)
+        assert _web3_contract_per_call(i) == _encode_erc20_function_call(i)
+        assert _web3_contract_per_call(i) == encode_large_abi(i)
+
+    for label, (encode, transfers) in modes.items():
+        start = time.perf_counter()
+        for i in range(transfers):
+            encode(i)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:>22}: {transfers:,} transfers in {elapsed:.2f} s, "
+            f"{transfers / elapsed:,.0f} transfers/s, {elapsed / transfers * 1e6:.1f} us each"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Throughput benchmark for batch signing against a local mock server.
+
+Starts an aiohttp server on localhost that answers the EVM sign hash endpoint after a fixed
+latency, then signs the same hashes one awaited call at a time with ``sign_hash`` and
+concurrently with ``sign_hash_many`` at several concurrency limits.
+
+Usage:
+    uv run python benchmarks/bench_batch_signing.py [--hashes N] [--latency MS]
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import time
+
+from aiohttp import web
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from cdp import CdpClient
+
+ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+def _api_key_secret() -> str:
+    return (
+        ec.generate_private_key(ec.SECP256R1())
+        .private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        .decode()
+    )
+
+
+def _wallet_secret() -> str:
+    der = ec.generate_private_key(ec.SECP256R1()).private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    return base64.b64encode(der).decode()
+
+
+async def _start_server(latency: float) -> tuple[web.AppRunner, str]:
+    async def sign_hash(request: web.Request) -> web.Response:
+        await request.json()
+        await asyncio.sleep(latency)
+        return web.json_response({"signature": "0x" + "ab" * 65})
+
+    app = web.Application()
+    app.router.add_post("/platform/v2/evm/accounts/{address}/sign", sign_hash)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}/platform"
+
+
+async def _run(hashes: int, latency: float, concurrencies: list[int]) -> None:
+    runner, base_path = await _start_server(latency)
+    items = [f"0x{i:064x}" for i in range(hashes)]
+    try:
+        async with CdpClient(
+            api_key_id="bench",
+            api_key_secret=_api_key_secret(),
+            wallet_secret=_wallet_secret(),
+            base_path=base_path,
+        ) as cdp:
+            start = time.perf_counter()
+            for item in items:
+                await cdp.evm.sign_hash(ADDRESS, item)
+            elapsed = time.perf_counter() - start
+            print(f"{'sequential':>16}: {hashes / elapsed:,.0f} signatures/s")
+
+            for concurrency in concurrencies:
+                operation = cdp.evm.sign_hash_many(ADDRESS, items, concurrency=concurrency)
+                start = time.perf_counter()
+                signatures = await operation.collect()
+                elapsed = time.perf_counter() - start
+                assert len(signatures) == hashes and not operation.errors
+                print(f"{f'concurrency {concurrency}':>16}: {hashes / elapsed:,.0f} signatures/s")
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    """Run the benchmark and print the signing throughput of each mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hashes", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=20, help="server latency in ms")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 100])
+    args = parser.parse_args()
+
+    os.environ.setdefault("DISABLE_CDP_ERROR_REPORTING", "true")
+    asyncio.run(_run(args.hashes, args.latency / 1000, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Micro-benchmark for JWT signing throughput.
+
+Compares signing with a freshly parsed API key on every call (the behavior before
+parsed keys were cached) against signing with the cached key object.
+
+Usage:
+    uv run python benchmarks/bench_jwt_signing.py [--iterations N]
+"""
+
+import argparse
+import base64
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from cdp.auth.utils.jwt import JwtOptions, _clear_key_cache, generate_jwt
+
+
+def _ec_key() -> str:
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+
+
+def _ed25519_key() -> str:
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    private_bytes = private_key.private_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PrivateFormat.Raw,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    public_bytes = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PublicFormat.Raw,
+    )
+    return base64.b64encode(private_bytes + public_bytes).decode()
+
+
+def _run(options: JwtOptions, iterations: int, cached: bool) -> float:
+    _clear_key_cache()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        if not cached:
+            _clear_key_cache()
+        generate_jwt(options)
+    return iterations / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print signatures per second for each key type."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    for label, secret in (("ES256", _ec_key()), ("EdDSA", _ed25519_key())):
+        options = JwtOptions(
+            api_key_id="benchmark-key-id",
+            api_key_secret=secret,
+            request_method="GET",
+            request_host="api.cdp.coinbase.com",
+            request_path="/platform/v2/evm/accounts",
+        )
+        before = _run(options, args.iterations, cached=False)
+        after = _run(options, args.iterations, cached=True)
+        print(
+            f"{label}: {before:,.0f} req/s uncached, {after:,.0f} req/s cached "
+            f"({after / before:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
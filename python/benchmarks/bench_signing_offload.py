@@ -0,0 +1,111 @@
+"""Concurrency benchmark for offloading auth token signing from the event loop.
+
+Runs many concurrent wallet-authenticated requests against a stubbed transport while a
+probe coroutine measures how late the event loop wakes it up. Compares signing on the
+event loop against signing in the default thread pool and in a process pool.
+
+Usage:
+    uv run python benchmarks/bench_signing_offload.py [--requests N] [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import base64
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from cdp.openapi_client.api_client import ApiClient
+from cdp.openapi_client.cdp_api_client import CdpApiClient
+
+PROBE_INTERVAL = 0.001
+
+
+def _api_key_secret() -> str:
+    return (
+        ec.generate_private_key(ec.SECP256R1())
+        .private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        .decode()
+    )
+
+
+def _wallet_secret() -> str:
+    der = ec.generate_private_key(ec.SECP256R1()).private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    return base64.b64encode(der).decode()
+
+
+async def _stub_call_api(self, method, url, header_params=None, body=None, *args, **kwargs):
+    # Simulate a fast network round trip.
+    await asyncio.sleep(0.002)
+
+
+async def _probe(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - PROBE_INTERVAL)
+
+
+async def _run(client: CdpApiClient, requests: int, concurrency: int) -> tuple[float, list[float]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    url = "https://api.cdp.coinbase.com/platform/v2/evm/accounts/0xabc/sign"
+
+    async def _request(i: int) -> None:
+        async with semaphore:
+            await client.call_api("POST", url, body={"hash": f"0x{i:064x}"})
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(_request(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    await client.close()
+    return elapsed, lags
+
+
+def main() -> None:
+    """Run the benchmark and print throughput and event-loop lag for each mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    secrets = {"api_key_secret": _api_key_secret(), "wallet_secret": _wallet_secret()}
+    process_pool = ProcessPoolExecutor()
+    modes = {
+        "event loop": lambda: CdpApiClient("bench", offload_signing=False, **secrets),
+        "thread pool": lambda: CdpApiClient("bench", **secrets),
+        "process pool": lambda: CdpApiClient("bench", signing_executor=process_pool, **secrets),
+    }
+
+    with patch.object(ApiClient, "call_api", _stub_call_api):
+        for label, create_client in modes.items():
+            elapsed, lags = asyncio.run(_run(create_client(), args.requests, args.concurrency))
+            lags_ms = sorted(lag * 1000 for lag in lags)
+            p99 = lags_ms[int(len(lags_ms) * 0.99) - 1] if lags_ms else 0.0
+            print(
+                f"{label:>12}: {args.requests / elapsed:,.0f} req/s, "
+                f"loop lag median {statistics.median(lags_ms or [0]):.2f} ms, "
+                f"p99 {p99:.2f} ms, max {max(lags_ms or [0]):.2f} ms"
+            )
+
+    process_pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,20 @@
 from cdp.__version__ import __version__
+from cdp.account_cache import AccountCache
 from cdp.cdp_client import CdpClient
 from cdp.evm_call_types import ContractCall, EncodedCall, FunctionCall
 from cdp.evm_local_account import EvmLocalAccount
 from cdp.evm_server_account import EvmServerAccount
 from cdp.evm_smart_account import EvmSmartAccount
 from cdp.evm_transaction_types import TransactionRequestEIP1559
+from cdp.nonce_manager import NonceManager
+from cdp.polling import poll_until
+from cdp.result_cache import InMemoryResultCache, ResultCache, SqliteResultCache
+from cdp.transport_types import RateLimitOptions, RetryOptions, TransportOptions
 from cdp.update_account_types import UpdateAccountOptions
 from cdp.utils import parse_units
 
 __all__ = [
+    "AccountCache",
     "CdpClient",
     "ContractCall",
     "EncodedCall",
@@ -16,8 +22,16 @@ __all__ = [
     "EvmSmartAccount",
     "EvmLocalAccount",
     "FunctionCall",
+    "InMemoryResultCache",
+    "NonceManager",
+    "RateLimitOptions",
+    "ResultCache",
+    "RetryOptions",
+    "SqliteResultCache",
     "TransactionRequestEIP1559",
+    "TransportOptions",
     "parse_units",
+    "poll_until",
     "UpdateAccountOptions",
     "__version__",
 ]
@@ -0,0 +1,163 @@
+import contextlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+from eth_abi.registry import registry
+from eth_typing import HexStr
+from eth_utils import is_checksum_address
+from eth_utils.abi import collapse_if_tuple, function_abi_to_4byte_selector
+from hexbytes import HexBytes
+from web3 import Web3
+
+# The fingerprints of recently used ABI objects, by id. Each entry keeps a reference to its
+# ABI, so the id can't be reused by another object while the entry exists.
+_FINGERPRINTS: OrderedDict[int, tuple[list[dict[str, Any]], str]] = OrderedDict()
+_FINGERPRINTS_MAX_SIZE = 256
+_FINGERPRINTS_LOCK = threading.Lock()
+
+
+class FunctionEncoder:
+    """Encodes the calldata of a contract function with a precomputed selector and types.
+
+    Encoding only runs the ``eth_abi`` tuple encoder of the argument types, built once, so it
+    avoids building a web3 contract, which parses the whole ABI, for every call.
+    """
+
+    __slots__ = ("_encoder", "components", "function_abi", "selector", "types")
+
+    def __init__(self, function_abi: dict[str, Any]) -> None:
+        """Initialize the encoder.
+
+        Args:
+            function_abi (dict[str, Any]): The ABI of the function.
+
+        """
+        self.function_abi = function_abi
+        self.selector = function_abi_to_4byte_selector(function_abi)
+        self.types = [collapse_if_tuple(abi_input) for abi_input in function_abi["inputs"]]
+        self.components = function_abi["inputs"]
+        self._encoder = registry.get_tuple_encoder(*self.types)
+
+    def encode(self, args: Sequence[Any]) -> HexStr:
+        """Encode a call of the function.
+
+        Args:
+            args (Sequence[Any]): The arguments of the call.
+
+        Returns:
+            HexStr: The 0x-prefixed calldata.
+
+        """
+        values = [
+            _normalize(component, arg) for component, arg in zip(self.components, args, strict=True)
+        ]
+        return HexStr("0x" + (self.selector + self._encoder(values)).hex())
+
+
+def get_function_encoder(
+    abi: list[dict[str, Any]], function_name: str, arg_count: int
+) -> FunctionEncoder | None:
+    """Get the cached encoder of a function of an ABI.
+
+    Encoders are cached by a fingerprint of the ABI, the function name and the number of
+    arguments, which selects between overloads. The fingerprint is remembered for the ABI
+    object, so an ABI must not be changed after it is first used.
+
+    Args:
+        abi (list[dict[str, Any]]): The contract ABI.
+        function_name (str): The name of the function.
+        arg_count (int): The number of arguments of the call.
+
+    Returns:
+        FunctionEncoder | None: The encoder, or None if no single function of the ABI matches.
+
+    """
+    return _get_function_encoder(_fingerprint(abi), function_name, arg_count)
+
+
+def encode_function_call(
+    abi: list[dict[str, Any]], function_name: str, args: Sequence[Any]
+) -> HexStr:
+    """Encode the calldata of a contract function call.
+
+    Uses a cached FunctionEncoder. Calls that it can't encode, such as ambiguous overloads or
+    arguments that need web3's normalization, fall back to a cached web3 contract, which also
+    raises web3's errors for invalid calls.
+
+    Args:
+        abi (list[dict[str, Any]]): The contract ABI.
+        function_name (str): The name of the function.
+        args (Sequence[Any]): The arguments of the call.
+
+    Returns:
+        HexStr: The 0x-prefixed calldata.
+
+    """
+    fingerprint = _fingerprint(abi)
+    encoder = _get_function_encoder(fingerprint, function_name, len(args))
+    if encoder is not None:
+        with contextlib.suppress(Exception):
+            return encoder.encode(args)
+    return _get_contract(fingerprint).encode_abi(function_name, args=list(args))
+
+
+def _fingerprint(abi: list[dict[str, Any]]) -> str:
+    # Serializing a large ABI costs more than encoding a call, so it's only done once per
+    # ABI object. Equal ABIs in different objects still share their encoders.
+    with _FINGERPRINTS_LOCK:
+        entry = _FINGERPRINTS.get(id(abi))
+        if entry is not None and entry[0] is abi:
+            _FINGERPRINTS.move_to_end(id(abi))
+            return entry[1]
+
+    fingerprint = json.dumps(abi, sort_keys=True, separators=(",", ":"))
+    with _FINGERPRINTS_LOCK:
+        _FINGERPRINTS[id(abi)] = (abi, fingerprint)
+        _FINGERPRINTS.move_to_end(id(abi))
+        if len(_FINGERPRINTS) > _FINGERPRINTS_MAX_SIZE:
+            _FINGERPRINTS.popitem(last=False)
+    return fingerprint
+
+
+@lru_cache(maxsize=256)
+def _get_function_encoder(
+    fingerprint: str, function_name: str, arg_count: int
+) -> FunctionEncoder | None:
+    matches = [
+        item
+        for item in json.loads(fingerprint)
+        if item.get("type", "function") == "function"
+        and item.get("name") == function_name
+        and len(item.get("inputs", [])) == arg_count
+    ]
+    if len(matches) != 1:
+        return None
+    return FunctionEncoder({"type": "function", "inputs": [], **matches[0]})
+
+
+@lru_cache(maxsize=32)
+def _get_contract(fingerprint: str):
+    return Web3().eth.contract(abi=json.loads(fingerprint))
+
+
+def _normalize(component: dict[str, Any], value: Any) -> Any:
+    """Convert a value to what eth_abi expects for an ABI input, as web3 does."""
+    abi_type = component["type"]
+    if abi_type.endswith("]"):
+        element = {**component, "type": abi_type[: abi_type.rindex("[")]}
+        return [_normalize(element, item) for item in value]
+    if abi_type == "tuple":
+        components = component["components"]
+        if isinstance(value, dict):
+            value = [value[item["name"]] for item in components]
+        return tuple(_normalize(item, arg) for item, arg in zip(components, value, strict=True))
+    if abi_type == "address" and isinstance(value, str) and not is_checksum_address(value):
+        # Leave the error to the web3 fallback, which rejects non-checksummed addresses.
+        raise ValueError(f"Address {value} is not checksummed")
+    if abi_type.startswith("bytes") and isinstance(value, str):
+        return bytes(HexBytes(value))
+    return value
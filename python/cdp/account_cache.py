@@ -0,0 +1,114 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+
+class _Entry:
+    """A cached value and the keys it is stored under."""
+
+    __slots__ = ("expires_at", "keys", "value")
+
+    def __init__(self, value: Any, keys: tuple[Hashable, ...], expires_at: float) -> None:
+        self.value = value
+        self.keys = keys
+        self.expires_at = expires_at
+
+
+class AccountCache:
+    """An in-process TTL and LRU cache for account lookups.
+
+    Accounts are cached under both their address and their name, so a lookup by either
+    one is served from the cache. Creating or updating accounts through the SDK refreshes
+    the cache, and updating or deleting policies clears it.
+    """
+
+    def __init__(self, ttl: float = 60, max_size: int = 1024) -> None:
+        """Initialize the account cache.
+
+        Args:
+            ttl (float): How long, in seconds, an account is cached. Defaults to 60.
+            max_size (int): The maximum number of cache keys. The least recently used
+                accounts are evicted first. Defaults to 1024.
+
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cache keys."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached value.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Any | None: The cached value, or None if it isn't cached or has expired.
+
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(entry)
+            self.misses += 1
+            return None
+
+        for entry_key in entry.keys:
+            self._entries.move_to_end(entry_key)
+        self.hits += 1
+        return entry.value
+
+    def set(self, keys: Iterable[Hashable], value: Any) -> None:
+        """Cache a value under one or more keys.
+
+        Any value previously cached under one of the keys is removed first.
+
+        Args:
+            keys (Iterable[Hashable]): The cache keys.
+            value (Any): The value to cache.
+
+        """
+        keys = tuple(keys)
+        for key in keys:
+            self.invalidate(key)
+
+        entry = _Entry(value, keys, time.monotonic() + self.ttl)
+        for key in keys:
+            self._entries[key] = entry
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries.values())))
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a cached value, along with the other keys it is cached under.
+
+        Args:
+            key (Hashable): The cache key.
+
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._remove(entry)
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
+
+    def _remove(self, entry: _Entry) -> None:
+        for key in entry.keys:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
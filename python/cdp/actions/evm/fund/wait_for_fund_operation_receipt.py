@@ -1,6 +1,6 @@
-import time
-
 from cdp.api_clients import ApiClients
+from cdp.constants import TRANSFER_FINAL_STATUSES
+from cdp.polling import poll_until
 
 
 async def wait_for_fund_operation_receipt(
@@ -8,14 +8,25 @@ async def wait_for_fund_operation_receipt(
     transfer_id: str,
     timeout_seconds: float = 900,
     interval_seconds: float = 1,
+    backoff_multiplier: float = 1.5,
+    max_interval_seconds: float = 10,
+    jitter: float = 0.1,
 ):
     """Wait for a fund operation to be processed.
 
+    Polling sleeps with asyncio, so other coroutines keep running while waiting, and the
+    wait can be cancelled by cancelling the awaiting task.
+
     Args:
         api_clients: The API clients object.
         transfer_id (str): The id of the transfer to wait for.
-        timeout_seconds (float, optional): Maximum time to wait in seconds. Defaults to 20.
-        interval_seconds (float, optional): Time between checks in seconds. Defaults to 0.2.
+        timeout_seconds (float, optional): Maximum time to wait in seconds. Defaults to 900.
+        interval_seconds (float, optional): Time between the first checks in seconds. Defaults to 1.
+        backoff_multiplier (float, optional): The factor the time between checks grows by after
+            every check. Defaults to 1.5.
+        max_interval_seconds (float, optional): Maximum time between checks in seconds. Defaults to 10.
+        jitter (float, optional): The fraction by which each wait is randomly lengthened or
+            shortened. Defaults to 0.1.
 
     Returns:
         Transfer: The final transfer object.
@@ -24,25 +35,15 @@ async def wait_for_fund_operation_receipt(
         TimeoutError: If the operation doesn't complete within the specified timeout.
 
     """
-    start_time = time.time()
-
-    # Get initial state - this matches what we see in the diff
-    transfer = await api_clients.payments.get_payment_transfer(
-        transfer_id,
-    )
-
-    # Use a regular while loop that explicitly checks the status
-    while transfer.status not in ["completed", "failed"]:
-        # Check timeout before making next API call
-        if time.time() - start_time > timeout_seconds:
-            raise TimeoutError("Transfer timed out")
-
-        # Wait before checking again
-        time.sleep(interval_seconds)
-
-        # Make API call to check status
-        transfer = await api_clients.payments.get_payment_transfer(
+    return await poll_until(
+        lambda: api_clients.payments.get_payment_transfer(
             transfer_id,
-        )
-
-    return transfer
+        ),
+        lambda transfer: transfer.status in TRANSFER_FINAL_STATUSES,
+        timeout_seconds=timeout_seconds,
+        interval_seconds=interval_seconds,
+        backoff_multiplier=backoff_multiplier,
+        max_interval_seconds=max_interval_seconds,
+        jitter=jitter,
+        timeout_message="Transfer timed out",
+    )
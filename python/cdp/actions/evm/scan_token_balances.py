@@ -0,0 +1,80 @@
+import contextlib
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+from cdp.actions.evm.list_token_balances import list_token_balances
+from cdp.bulk import run_workers
+from cdp.evm_token_balances import EvmTokenBalance, TokenBalanceScanError
+from cdp.openapi_client.api.evm_token_balances_api import EVMTokenBalancesApi
+from cdp.pagination import paginate
+
+
+class TokenBalanceScan:
+    """A concurrent scan of the token balances of many addresses on many networks.
+
+    Iterating over the scan lists the token balances of every address on every network,
+    following the pages of each, with at most ``concurrency`` listings in flight. Balances
+    are yielded as ``(address, network, balance)`` tuples as soon as they arrive, so their
+    order across addresses is not deterministic. A listing that fails is recorded in
+    ``errors`` and doesn't stop the rest of the scan.
+    """
+
+    def __init__(
+        self,
+        evm_token_balances: EVMTokenBalancesApi,
+        addresses: Iterable[str],
+        networks: Iterable[str],
+        concurrency: int = 10,
+        page_size: int | None = None,
+    ) -> None:
+        """Initialize the scan.
+
+        Args:
+            evm_token_balances (EVMTokenBalancesApi): The EVM token balances API.
+            addresses (Iterable[str]): The addresses to scan.
+            networks (Iterable[str]): The networks to scan each address on.
+            concurrency (int): The maximum number of listings in flight. Defaults to 10.
+            page_size (int, optional): The number of token balances to fetch per page.
+                Defaults to None.
+
+        """
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+
+        self.evm_token_balances = evm_token_balances
+        self.addresses = list(dict.fromkeys(addresses))
+        self.networks = list(dict.fromkeys(networks))
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.errors: list[TokenBalanceScanError] = []
+
+    async def __aiter__(self) -> AsyncIterator[tuple[str, str, EvmTokenBalance]]:
+        """Scan the token balances.
+
+        Yields:
+            tuple[str, str, EvmTokenBalance]: The address, the network and a token balance.
+
+        """
+        self.errors = []
+        listings = [(address, network) for address in self.addresses for network in self.networks]
+        # Closing the results closes the workers too, if the caller stops early.
+        results = run_workers(listings, self._scan_listing, self.concurrency)
+        async with contextlib.aclosing(results):
+            async for result in results:
+                yield result
+
+    async def _scan_listing(
+        self,
+        listing: tuple[str, str],
+        emit: Callable[[tuple[str, str, EvmTokenBalance]], Awaitable[None]],
+    ) -> None:
+        address, network = listing
+        try:
+            async for page in paginate(
+                lambda page_token: list_token_balances(
+                    self.evm_token_balances, address, network, self.page_size, page_token
+                )
+            ):
+                for balance in page.balances:
+                    await emit((address, network, balance))
+        except Exception as e:
+            self.errors.append(TokenBalanceScanError(address=address, network=network, error=e))
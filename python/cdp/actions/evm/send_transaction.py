@@ -1,9 +1,14 @@
 from eth_account.typed_transactions import DynamicFeeTransaction
 
 from cdp.evm_transaction_types import TransactionRequestEIP1559
+from cdp.nonce_manager import NonceManager
 from cdp.openapi_client.api.evm_accounts_api import EVMAccountsApi
 from cdp.openapi_client.models.send_evm_transaction_request import SendEvmTransactionRequest
-from cdp.utils import serialize_unsigned_transaction
+from cdp.utils import (
+    derive_idempotency_key,
+    serialize_eip1559_transaction,
+    serialize_unsigned_transaction,
+)
 
 
 async def send_transaction(
@@ -12,6 +17,7 @@ async def send_transaction(
     transaction: str | TransactionRequestEIP1559 | DynamicFeeTransaction,
     network: str,
     idempotency_key: str | None = None,
+    nonce_manager: NonceManager | None = None,
 ) -> str:
     """Send an EVM transaction.
 
@@ -42,6 +48,9 @@ async def send_transaction(
 
         network (str): The network.
         idempotency_key (str, optional): The idempotency key. Defaults to None.
+        nonce_manager (NonceManager, optional): The nonce manager that assigns the nonce of
+            a TransactionRequestEIP1559 without one. Defaults to None, which leaves it to
+            the API.
 
     Returns:
         str: The transaction hash.
@@ -58,8 +67,30 @@ async def send_transaction(
             )
         ).transaction_hash
     elif isinstance(transaction, TransactionRequestEIP1559):
-        typed_tx = DynamicFeeTransaction.from_dict(transaction.as_dict())
-        serialized_tx = serialize_unsigned_transaction(typed_tx)
+        if nonce_manager is not None and (
+            "nonce" not in transaction.model_fields_set or transaction.nonce is None
+        ):
+            attempts = 0
+
+            async def send_with_nonce(nonce: int) -> str:
+                nonlocal attempts
+                # A retry after the nonce was rejected is a different request, so it can't
+                # reuse the idempotency key of the rejected one.
+                key = idempotency_key
+                if key is not None and attempts > 0:
+                    key = derive_idempotency_key(key, attempts)
+                attempts += 1
+                return await send_transaction(
+                    evm_accounts,
+                    address,
+                    transaction.model_copy(update={"nonce": nonce}),
+                    network,
+                    key,
+                )
+
+            return await nonce_manager.send(address, network, send_with_nonce)
+
+        serialized_tx = serialize_eip1559_transaction(transaction)
 
         send_evm_transaction_request = SendEvmTransactionRequest(
             transaction=serialized_tx, network=network
@@ -1,6 +1,6 @@
 from eth_account.signers.base import BaseAccount
-from web3 import Web3
 
+from cdp.abi_encoder import encode_function_call
 from cdp.api_clients import ApiClients
 from cdp.evm_call_types import ContractCall, FunctionCall
 from cdp.openapi_client.models.evm_call import EvmCall
@@ -42,8 +42,7 @@ async def send_user_operation(
     encoded_calls = []
     for call in calls:
         if isinstance(call, FunctionCall):
-            contract = Web3().eth.contract(address=call.to, abi=call.abi)
-            data = contract.encode_abi(call.function_name, args=call.args)
+            data = encode_function_call(call.abi, call.function_name, call.args)
             value = "0" if call.value is None else str(call.value)
             encoded_calls.append(EvmCall(to=str(call.to), data=data, value=value))
         else:
@@ -1,20 +1,16 @@
 from typing import cast
 
-from eth_account.typed_transactions import DynamicFeeTransaction
 from eth_typing import HexStr
-from web3 import Web3
 
-from cdp.actions.evm.transfer.constants import ERC20_ABI
+from cdp.actions.evm.send_transaction import send_transaction
 from cdp.actions.evm.transfer.types import (
     TokenType,
     TransferExecutionStrategy,
 )
-from cdp.actions.evm.transfer.utils import get_erc20_address
+from cdp.actions.evm.transfer.utils import encode_erc20_function_call, get_erc20_address
 from cdp.api_clients import ApiClients
 from cdp.evm_server_account import EvmServerAccount
 from cdp.evm_transaction_types import TransactionRequestEIP1559
-from cdp.openapi_client.models.send_evm_transaction_request import SendEvmTransactionRequest
-from cdp.utils import serialize_unsigned_transaction
 
 
 class AccountTransferStrategy(TransferExecutionStrategy):
@@ -28,6 +24,7 @@ class AccountTransferStrategy(TransferExecutionStrategy):
         value: int,
         token: TokenType,
         network: str,
+        approve: bool = False,
     ) -> HexStr:
         """Execute a transfer from a server account.
 
@@ -38,87 +35,54 @@ class AccountTransferStrategy(TransferExecutionStrategy):
             value: The amount to transfer
             token: The token to transfer
             network: The network to transfer on
+            approve: Whether to send an ERC-20 approve of the value to the recipient before the
+                transfer. A transfer doesn't need an allowance, so this only adds a transaction.
 
         Returns:
             The transaction hash
 
         """
         if token == "eth":
-            transaction = TransactionRequestEIP1559(
-                to=to,
-                value=value,
+            return await self._send_transaction(
+                api_clients, from_account, TransactionRequestEIP1559(to=to, value=value), network
             )
 
-            typed_tx = DynamicFeeTransaction.from_dict(transaction.as_dict())
-            serialized_tx = serialize_unsigned_transaction(typed_tx)
+        erc20_address = get_erc20_address(token, network)
 
-            response = await api_clients.evm_accounts.send_evm_transaction(
-                address=from_account.address,
-                send_evm_transaction_request=SendEvmTransactionRequest(
-                    transaction=serialized_tx,
-                    network=network,
-                ),
+        if approve:
+            approve_data = encode_erc20_function_call("approve", [to, value])
+            await self._send_transaction(
+                api_clients,
+                from_account,
+                TransactionRequestEIP1559(to=erc20_address, data=approve_data),
+                network,
             )
 
-            return cast(HexStr, response.transaction_hash)
-        else:
-            erc20_address = get_erc20_address(token, network)
+        transfer_data = encode_erc20_function_call("transfer", [to, value])
+        return await self._send_transaction(
+            api_clients,
+            from_account,
+            TransactionRequestEIP1559(to=erc20_address, data=transfer_data),
+            network,
+        )
 
-            approve_data = _encode_erc20_function_call(erc20_address, "approve", [to, value])
-
-            approve_tx = TransactionRequestEIP1559(
-                to=erc20_address,
-                data=approve_data,
-            )
-
-            typed_tx = DynamicFeeTransaction.from_dict(approve_tx.as_dict())
-            serialized_tx = serialize_unsigned_transaction(typed_tx)
-
-            await api_clients.evm_accounts.send_evm_transaction(
-                address=from_account.address,
-                send_evm_transaction_request=SendEvmTransactionRequest(
-                    transaction=serialized_tx,
-                    network=network,
-                ),
-            )
-
-            transfer_data = _encode_erc20_function_call(erc20_address, "transfer", [to, value])
-
-            transfer_tx = TransactionRequestEIP1559(
-                to=erc20_address,
-                data=transfer_data,
-            )
-
-            typed_tx = DynamicFeeTransaction.from_dict(transfer_tx.as_dict())
-            serialized_tx = serialize_unsigned_transaction(typed_tx)
-
-            response = await api_clients.evm_accounts.send_evm_transaction(
-                address=from_account.address,
-                send_evm_transaction_request=SendEvmTransactionRequest(
-                    transaction=serialized_tx,
-                    network=network,
-                ),
-            )
-
-            return cast(HexStr, response.transaction_hash)
-
-
-def _encode_erc20_function_call(address: str, function_name: str, args: list) -> str:
-    """Encode an ERC20 function call.
-
-    Args:
-        address: The address of the contract
-        function_name: The function name
-        args: The function arguments
-
-    Returns:
-        The encoded function call
-
-    """
-    w3 = Web3()
-    contract = w3.eth.contract(address=address, abi=ERC20_ABI)
-
-    return contract.encode_abi(function_name, args=args)
+    async def _send_transaction(
+        self,
+        api_clients: ApiClients,
+        from_account: EvmServerAccount,
+        transaction: TransactionRequestEIP1559,
+        network: str,
+    ) -> HexStr:
+        # Go through the account's nonce manager, if any, so that transfers don't collide
+        # with the nonces it assigns to transactions sent concurrently.
+        transaction_hash = await send_transaction(
+            api_clients.evm_accounts,
+            from_account.address,
+            transaction,
+            network,
+            nonce_manager=from_account.nonce_manager,
+        )
+        return cast(HexStr, transaction_hash)
 
 
 # Create the instance for use by the transfer function
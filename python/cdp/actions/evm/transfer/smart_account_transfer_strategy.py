@@ -1,12 +1,11 @@
-from web3 import Web3
+from collections.abc import Iterable
 
 from cdp.actions.evm.send_user_operation import send_user_operation
-from cdp.actions.evm.transfer.constants import ERC20_ABI
 from cdp.actions.evm.transfer.types import (
     TokenType,
     TransferExecutionStrategy,
 )
-from cdp.actions.evm.transfer.utils import get_erc20_address
+from cdp.actions.evm.transfer.utils import encode_erc20_function_call, get_erc20_address
 from cdp.api_clients import ApiClients
 from cdp.evm_call_types import EncodedCall
 from cdp.evm_smart_account import EvmSmartAccount
@@ -25,6 +24,7 @@ class SmartAccountTransferStrategy(TransferExecutionStrategy):
         token: TokenType,
         network: str,
         paymaster_url: str | None,
+        approve: bool = False,
     ) -> EvmUserOperationModel:
         """Execute a transfer from a smart account.
 
@@ -36,6 +36,8 @@ class SmartAccountTransferStrategy(TransferExecutionStrategy):
             token: The token to transfer
             network: The network to transfer on
             paymaster_url: The paymaster URL
+            approve: Whether to include an ERC-20 approve of the value to the recipient before
+                the transfer. A transfer doesn't need an allowance, so this only adds a call.
 
         Returns:
             The transaction hash
@@ -55,29 +57,105 @@ class SmartAccountTransferStrategy(TransferExecutionStrategy):
             # For token transfers, we need to interact with the ERC20 contract
             erc20_address = get_erc20_address(token, network)
 
-            # Encode function calls using Web3
-            w3 = Web3()
-            contract = w3.eth.contract(abi=ERC20_ABI)
+            calls = []
 
-            # Create approve call
-            approve_data = contract.encode_abi("approve", args=[to, value])
+            # Create approve call, if requested
+            if approve:
+                approve_data = encode_erc20_function_call("approve", [to, value])
+                calls.append(EncodedCall(to=erc20_address, data=approve_data))
 
             # Create transfer call
-            transfer_data = contract.encode_abi("transfer", args=[to, value])
+            transfer_data = encode_erc20_function_call("transfer", [to, value])
+            calls.append(EncodedCall(to=erc20_address, data=transfer_data))
 
-            # Send user operation with both calls
             return await send_user_operation(
                 api_clients=api_clients,
                 address=from_account.address,
                 owner=from_account.owners[0],
-                calls=[
-                    EncodedCall(to=erc20_address, data=approve_data),
-                    EncodedCall(to=erc20_address, data=transfer_data),
-                ],
+                calls=calls,
                 network=network,
                 paymaster_url=paymaster_url,
             )
 
+    async def execute_transfer_many(
+        self,
+        api_clients: ApiClients,
+        from_account: EvmSmartAccount,
+        transfers: Iterable[tuple[str, int]],
+        token: TokenType,
+        network: str,
+        paymaster_url: str | None,
+        max_calls_per_user_operation: int = 50,
+        max_calldata_size: int | None = None,
+    ) -> dict[str, EvmUserOperationModel | Exception]:
+        """Execute many transfers from a smart account, packed into few user operations.
+
+        The user operations are submitted one after another: user operations of the same
+        smart account prepared concurrently could be given the same EntryPoint nonce.
+
+        Args:
+            api_clients: The API clients
+            from_account: The account to transfer from
+            transfers: The recipient addresses and the amounts to transfer to them
+            token: The token to transfer
+            network: The network to transfer on
+            paymaster_url: The paymaster URL
+            max_calls_per_user_operation: The maximum number of transfers in a user operation
+            max_calldata_size: The maximum total size, in bytes, of the calldata of the
+                transfers in a user operation, or None for no limit
+
+        Returns:
+            The user operation of each recipient, or the error it failed with
+
+        """
+        if max_calls_per_user_operation <= 0:
+            raise ValueError("max_calls_per_user_operation must be positive")
+
+        calls: dict[str, EncodedCall] = {}
+        recipients: set[str] = set()
+        erc20_address = None if token == "eth" else get_erc20_address(token, network)
+        for to, value in transfers:
+            # Addresses are case-insensitive, whatever their checksum casing.
+            if to.lower() in recipients:
+                raise ValueError(f"Duplicate recipient {to}")
+            recipients.add(to.lower())
+            if erc20_address is None:
+                calls[to] = EncodedCall(to=to, value=value, data="0x")
+            else:
+                transfer_data = encode_erc20_function_call("transfer", [to, value])
+                calls[to] = EncodedCall(to=erc20_address, data=transfer_data)
+
+        chunks: list[list[str]] = []
+        chunk_size = 0
+        for to, call in calls.items():
+            call_size = (len(call.data) - 2) // 2
+            if (
+                not chunks
+                or len(chunks[-1]) >= max_calls_per_user_operation
+                or (max_calldata_size is not None and chunk_size + call_size > max_calldata_size)
+            ):
+                chunks.append([])
+                chunk_size = 0
+            chunks[-1].append(to)
+            chunk_size += call_size
+
+        results: dict[str, EvmUserOperationModel | Exception] = {}
+        for chunk in chunks:
+            try:
+                user_operation = await send_user_operation(
+                    api_clients=api_clients,
+                    address=from_account.address,
+                    owner=from_account.owners[0],
+                    calls=[calls[to] for to in chunk],
+                    network=network,
+                    paymaster_url=paymaster_url,
+                )
+            except Exception as e:
+                user_operation = e
+            for to in chunk:
+                results[to] = user_operation
+        return results
+
 
 # Create the instance for use by the transfer function
 smart_account_transfer_strategy = SmartAccountTransferStrategy()
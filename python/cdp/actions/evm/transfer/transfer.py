@@ -23,6 +23,7 @@ async def transfer(
     network: str,
     transfer_strategy: TransferExecutionStrategy,
     paymaster_url: str | None = None,
+    approve: bool = False,
 ) -> HexStr | EvmUserOperationModel:
     """Transfer an amount of a token from an account to another account.
 
@@ -35,6 +36,8 @@ async def transfer(
         network: The network to transfer the token on
         transfer_strategy: The strategy to use to execute the transfer
         paymaster_url: The paymaster URL to use for the transfer. Only used for smart accounts.
+        approve: Whether to approve the recipient to spend the amount before an ERC-20 transfer.
+            A transfer doesn't need an allowance, so this only adds a call. Defaults to False.
 
     Returns:
         The result of the transfer
@@ -50,6 +53,7 @@ async def transfer(
         "value": amount,
         "token": token,
         "network": network,
+        "approve": approve,
     }
 
     if isinstance(from_account, EvmSmartAccount):
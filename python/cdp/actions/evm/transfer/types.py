@@ -22,6 +22,7 @@ class TransferExecutionStrategy(ABC):
         token: TokenType,
         network: str,
         paymaster_url: str | None,
+        approve: bool = False,
     ) -> HexStr | EvmUserOperationModel:
         """Execute the transfer.
 
@@ -33,6 +34,7 @@ class TransferExecutionStrategy(ABC):
             token: The token to transfer
             network: The network to transfer the token on
             paymaster_url: The paymaster URL to use for the transfer. Only used for smart accounts.
+            approve: Whether to approve the recipient to spend the value before an ERC-20 transfer.
 
         Returns:
             The transaction hash of the transfer
@@ -1,7 +1,11 @@
+import contextlib
 from typing import cast
 
 from eth_typing import HexStr
 
+from cdp.abi_encoder import encode_function_call, get_function_encoder
+from cdp.actions.evm.transfer.constants import ERC20_ABI
+
 # The address of an ERC20 token for a given network
 ADDRESS_MAP = {
     "base": {
@@ -29,3 +33,27 @@ def get_erc20_address(token: str, network: str) -> HexStr:
     network_addresses = ADDRESS_MAP.get(network, {})
     address = network_addresses.get(token, token)
     return cast(HexStr, address)
+
+
+_ERC20_ENCODERS = {
+    function_name: get_function_encoder(ERC20_ABI, function_name, 2)
+    for function_name in ("approve", "transfer")
+}
+
+
+def encode_erc20_function_call(function_name: str, args: list) -> HexStr:
+    """Encode a call of an ERC20 function.
+
+    Args:
+        function_name: The function name
+        args: The function arguments
+
+    Returns:
+        The encoded function call
+
+    """
+    encoder = _ERC20_ENCODERS.get(function_name)
+    if encoder is not None:
+        with contextlib.suppress(Exception):
+            return encoder.encode(args)
+    return encode_function_call(ERC20_ABI, function_name, args)
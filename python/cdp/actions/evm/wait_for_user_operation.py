@@ -1,6 +1,6 @@
-import time
-
 from cdp.api_clients import ApiClients
+from cdp.constants import USER_OPERATION_FINAL_STATUSES
+from cdp.polling import poll_until
 
 
 async def wait_for_user_operation(
@@ -9,15 +9,26 @@ async def wait_for_user_operation(
     user_op_hash: str,
     timeout_seconds: float = 20,
     interval_seconds: float = 0.2,
+    backoff_multiplier: float = 1.5,
+    max_interval_seconds: float = 2,
+    jitter: float = 0.1,
 ):
     """Wait for a user operation to be processed.
 
+    Polling sleeps with asyncio, so other coroutines keep running while waiting, and the
+    wait can be cancelled by cancelling the awaiting task.
+
     Args:
         api_clients: The API clients object.
         smart_account_address (str): The address of the smart account that sent the operation.
         user_op_hash (str): The hash of the user operation to wait for.
         timeout_seconds (float, optional): Maximum time to wait in seconds. Defaults to 20.
-        interval_seconds (float, optional): Time between checks in seconds. Defaults to 0.2.
+        interval_seconds (float, optional): Time between the first checks in seconds. Defaults to 0.2.
+        backoff_multiplier (float, optional): The factor the time between checks grows by after
+            every check. Defaults to 1.5.
+        max_interval_seconds (float, optional): Maximum time between checks in seconds. Defaults to 2.
+        jitter (float, optional): The fraction by which each wait is randomly lengthened or
+            shortened. Defaults to 0.1.
 
     Returns:
         EvmUserOperation: The final user operation object.
@@ -26,27 +37,16 @@ async def wait_for_user_operation(
         TimeoutError: If the operation doesn't complete within the specified timeout.
 
     """
-    start_time = time.time()
-
-    # Get initial state - this matches what we see in the diff
-    user_operation = await api_clients.evm_smart_accounts.get_user_operation(
-        smart_account_address,
-        user_op_hash,
-    )
-
-    # Use a regular while loop that explicitly checks the status
-    while user_operation.status not in ["complete", "failed"]:
-        # Check timeout before making next API call
-        if time.time() - start_time > timeout_seconds:
-            raise TimeoutError("User Operation timed out")
-
-        # Wait before checking again
-        time.sleep(interval_seconds)
-
-        # Make API call to check status
-        user_operation = await api_clients.evm_smart_accounts.get_user_operation(
+    return await poll_until(
+        lambda: api_clients.evm_smart_accounts.get_user_operation(
             smart_account_address,
             user_op_hash,
-        )
-
-    return user_operation
+        ),
+        lambda user_operation: user_operation.status in USER_OPERATION_FINAL_STATUSES,
+        timeout_seconds=timeout_seconds,
+        interval_seconds=interval_seconds,
+        backoff_multiplier=backoff_multiplier,
+        max_interval_seconds=max_interval_seconds,
+        jitter=jitter,
+        timeout_message="User Operation timed out",
+    )
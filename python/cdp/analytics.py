@@ -119,7 +119,7 @@ def wrap_with_error_tracking(func):
 
 
 def wrap_class_with_error_tracking(cls):
-    """Wrap all methods of a class with error tracking.
+    """Wrap all async methods of a class with error tracking.
 
     Args:
         cls: The class to wrap.
@@ -131,7 +131,7 @@ def wrap_class_with_error_tracking(cls):
     if os.getenv("DISABLE_CDP_ERROR_REPORTING") == "true":
         return cls
 
-    for name, method in inspect.getmembers(cls, inspect.isfunction):
+    for name, method in inspect.getmembers(cls, inspect.iscoroutinefunction):
         if not name.startswith("__"):
             setattr(cls, name, wrap_with_error_tracking(method))
     return cls
@@ -6,6 +6,7 @@ from cdp.openapi_client.api.payments_alpha_api import PaymentsAlphaApi
 from cdp.openapi_client.api.policy_engine_api import PolicyEngineApi
 from cdp.openapi_client.api.solana_accounts_api import SolanaAccountsApi
 from cdp.openapi_client.cdp_api_client import CdpApiClient
+from cdp.result_cache import CachedEVMSmartAccountsApi, CachedPaymentsAlphaApi, ResultCache
 
 
 class ApiClients:
@@ -21,17 +22,22 @@ class ApiClients:
         _evm_token_balances (Optional[EVMTokenBalancesApi]): The EVMTokenBalancesApi client instance.
         _faucets (Optional[FaucetsApi]): The FaucetsApi client instance.
         _solana_accounts (Optional[SolanaAccountsApi]): The SolanaAccountsApi client instance.
+        result_cache (Optional[ResultCache]): The cache for finished user operations and
+            payment transfers.
 
     """
 
-    def __init__(self, cdp_client: CdpApiClient) -> None:
+    def __init__(self, cdp_client: CdpApiClient, result_cache: ResultCache | None = None) -> None:
         """Initialize the ApiClients instance.
 
         Args:
             cdp_client (CdpApiClient): The CDP API client to use for initializing individual API clients.
+            result_cache (ResultCache, optional): A cache for finished user operations and
+                payment transfers. Defaults to no caching.
 
         """
         self._cdp_client: CdpApiClient = cdp_client
+        self.result_cache = result_cache
 
         self._evm_accounts: EVMAccountsApi | None = None
         self._evm_smart_accounts: EVMSmartAccountsApi | None = None
@@ -68,7 +74,12 @@ class ApiClients:
 
         """
         if self._evm_smart_accounts is None:
-            self._evm_smart_accounts = EVMSmartAccountsApi(api_client=self._cdp_client)
+            if self.result_cache is not None:
+                self._evm_smart_accounts = CachedEVMSmartAccountsApi(
+                    self._cdp_client, self.result_cache
+                )
+            else:
+                self._evm_smart_accounts = EVMSmartAccountsApi(api_client=self._cdp_client)
         return self._evm_smart_accounts
 
     @property
@@ -143,7 +154,10 @@ class ApiClients:
 
         """
         if self._payments is None:
-            self._payments = PaymentsAlphaApi(api_client=self._cdp_client)
+            if self.result_cache is not None:
+                self._payments = CachedPaymentsAlphaApi(self._cdp_client, self.result_cache)
+            else:
+                self._payments = PaymentsAlphaApi(api_client=self._cdp_client)
         return self._payments
 
     async def close(self):
@@ -4,7 +4,12 @@ This package provides authentication utilities and JWT token handling functional
 """
 
 from .clients.urllib3.client import Urllib3AuthClient, Urllib3AuthClientOptions
-from .utils.http import GetAuthHeadersOptions, get_auth_headers
+from .utils.http import (
+    AuthContext,
+    BearerTokenCache,
+    GetAuthHeadersOptions,
+    get_auth_headers,
+)
 from .utils.jwt import (
     JwtOptions,
     WalletJwtOptions,
@@ -28,6 +33,8 @@ __all__ = [
     # HTTP utils exports
     "get_auth_headers",
     "GetAuthHeadersOptions",
+    "BearerTokenCache",
+    "AuthContext",
     # WebSocket utils exports
     "get_websocket_auth_headers",
     "GetWebSocketAuthHeadersOptions",
@@ -6,7 +6,7 @@ from urllib.parse import urlparse
 import urllib3
 from pydantic import BaseModel, Field
 
-from cdp.auth.utils.http import GetAuthHeadersOptions, get_auth_headers
+from cdp.auth.utils.http import BearerTokenCache, GetAuthHeadersOptions, get_auth_headers
 
 # Add logger
 logger = logging.getLogger(__name__)
@@ -52,6 +52,7 @@ class Urllib3AuthClient:
         options: Urllib3AuthClientOptions,
         base_url: str,
         debug: bool = False,
+        token_cache: BearerTokenCache | None = None,
     ):
         """Initialize the authenticated HTTP client.
 
@@ -59,12 +60,14 @@ class Urllib3AuthClient:
             options: The authentication configuration options
             base_url: The base URL for all requests
             debug: Whether to enable debug logging
+            token_cache: Optional cache used to reuse bearer tokens for repeated requests
 
         """
         self.options = options
         self.base_url = base_url.rstrip("/")
         self.client = urllib3.PoolManager()
         self.debug = debug
+        self.token_cache = token_cache
 
     def request(
         self,
@@ -110,7 +113,8 @@ class Urllib3AuthClient:
                 source=self.options.source,
                 source_version=self.options.source_version,
                 expires_in=self.options.expires_in,
-            )
+            ),
+            token_cache=self.token_cache,
         )
 
         # Merge headers
@@ -1,8 +1,15 @@
+import base64
+import pickle
 from unittest.mock import patch
 
+import jwt as jwt_lib
 import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
 
 from cdp.auth.utils.http import (
+    AuthContext,
+    BearerTokenCache,
     _get_correlation_data,
     _requires_wallet_auth,
     get_auth_headers,
@@ -63,6 +70,202 @@ def test_get_auth_headers_missing_wallet_auth(mock_jwt, auth_options_factory):
         get_auth_headers(options)
 
 
+@patch("cdp.auth.utils.http.generate_jwt")
+def test_bearer_token_cache_reuses_token(mock_jwt, jwt_options_factory):
+    """Test that the token cache reuses tokens for the same request URI."""
+    # Setup
+    mock_jwt.side_effect = ["token-1", "token-2"]
+    cache = BearerTokenCache()
+
+    # Execute
+    first = cache.get_token(jwt_options_factory())
+    second = cache.get_token(jwt_options_factory())
+
+    # Verify
+    assert first == second == "token-1"
+    mock_jwt.assert_called_once()
+
+
+@patch("cdp.auth.utils.http.generate_jwt")
+def test_bearer_token_cache_keys_on_uri(mock_jwt, jwt_options_factory):
+    """Test that tokens are not shared across methods or paths."""
+    # Setup
+    mock_jwt.side_effect = ["token-1", "token-2", "token-3"]
+    cache = BearerTokenCache()
+
+    # Execute
+    get_token = cache.get_token(jwt_options_factory(request_method="GET"))
+    post_token = cache.get_token(jwt_options_factory(request_method="POST"))
+    other_path_token = cache.get_token(jwt_options_factory(request_path="/v1/other"))
+
+    # Verify
+    assert [get_token, post_token, other_path_token] == ["token-1", "token-2", "token-3"]
+    assert len(cache) == 3
+
+
+@patch("cdp.auth.utils.http.time.time")
+@patch("cdp.auth.utils.http.generate_jwt")
+def test_bearer_token_cache_refreshes_before_expiry(mock_jwt, mock_time, jwt_options_factory):
+    """Test that cached tokens are refreshed ahead of expiry."""
+    # Setup
+    mock_jwt.side_effect = ["token-1", "token-2"]
+    cache = BearerTokenCache(refresh_margin=30)
+    options = jwt_options_factory(expires_in=120)
+
+    # Execute & Verify
+    mock_time.return_value = 1000.0
+    assert cache.get_token(options) == "token-1"
+    mock_time.return_value = 1089.0
+    assert cache.get_token(options) == "token-1"
+    mock_time.return_value = 1090.0
+    assert cache.get_token(options) == "token-2"
+
+
+@patch("cdp.auth.utils.http.generate_jwt")
+def test_bearer_token_cache_skips_websocket_tokens(mock_jwt, websocket_jwt_options_factory):
+    """Test that tokens without a uris claim are never cached."""
+    # Setup
+    mock_jwt.side_effect = ["token-1", "token-2"]
+    cache = BearerTokenCache()
+
+    # Execute & Verify
+    assert cache.get_token(websocket_jwt_options_factory()) == "token-1"
+    assert cache.get_token(websocket_jwt_options_factory()) == "token-2"
+    assert len(cache) == 0
+
+
+@patch("cdp.auth.utils.http.generate_jwt")
+@patch("cdp.auth.utils.http.generate_wallet_jwt")
+def test_get_auth_headers_with_token_cache(mock_wallet_jwt, mock_jwt, auth_options_factory):
+    """Test that the token cache applies to bearer tokens but never to wallet auth tokens."""
+    # Setup
+    mock_jwt.side_effect = ["jwt-1", "jwt-2"]
+    mock_wallet_jwt.side_effect = ["wallet-1", "wallet-2"]
+    cache = BearerTokenCache()
+    options = auth_options_factory(
+        request_method="POST",
+        request_path="/v2/evm/accounts",
+        wallet_secret="test-wallet-key",
+    )
+
+    # Execute
+    first = get_auth_headers(options, token_cache=cache)
+    second = get_auth_headers(options, token_cache=cache)
+
+    # Verify
+    assert first["Authorization"] == second["Authorization"] == "Bearer jwt-1"
+    assert first["X-Wallet-Auth"] == "wallet-1"
+    assert second["X-Wallet-Auth"] == "wallet-2"
+    assert mock_wallet_jwt.call_count == 2
+
+
+@pytest.fixture
+def wallet_secret():
+    """Fixture that generates a base64-encoded DER wallet secret for testing.
+
+    Returns:
+        str: Base64-encoded DER EC private key
+
+    """
+    der = ec.generate_private_key(ec.SECP256R1()).private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    return base64.b64encode(der).decode()
+
+
+def test_auth_context_get_headers(ed25519_private_key_factory, wallet_secret):
+    """Test that the auth context produces the same headers as get_auth_headers."""
+    # Setup
+    context = AuthContext(
+        api_key_id="test-key",
+        api_key_secret=ed25519_private_key_factory(),
+        wallet_secret=wallet_secret,
+        source="custom-source",
+        source_version="1.0.0",
+    )
+
+    # Execute
+    headers = context.get_headers(
+        "post", "api.example.com", "/v2/evm/accounts", {"name": "test-account"}
+    )
+
+    # Verify
+    assert headers["Content-Type"] == "application/json"
+    assert headers["Correlation-Context"] == _get_correlation_data("custom-source", "1.0.0")
+    bearer = jwt_lib.decode(
+        headers["Authorization"].removeprefix("Bearer "), options={"verify_signature": False}
+    )
+    assert bearer["sub"] == "test-key"
+    assert bearer["uris"] == ["POST api.example.com/v2/evm/accounts"]
+    wallet_auth = jwt_lib.decode(headers["X-Wallet-Auth"], options={"verify_signature": False})
+    assert wallet_auth["uris"] == ["POST api.example.com/v2/evm/accounts"]
+    assert wallet_auth["req"] == {"name": "test-account"}
+
+
+def test_auth_context_parses_keys_once(ed25519_private_key_factory, wallet_secret):
+    """Test that the auth context doesn't parse keys or build options per request."""
+    # Setup
+    context = AuthContext(
+        api_key_id="test-key",
+        api_key_secret=ed25519_private_key_factory(),
+        wallet_secret=wallet_secret,
+    )
+
+    # Execute
+    with (
+        patch("cdp.auth.utils.http._load_private_key") as mock_load_private_key,
+        patch("cdp.auth.utils.http._load_wallet_key") as mock_load_wallet_key,
+        patch("cdp.auth.utils.http.JwtOptions") as mock_jwt_options,
+    ):
+        context.get_headers("POST", "api.example.com", "/v2/evm/accounts", {})
+        context.get_headers("GET", "api.example.com", "/v2/evm/accounts")
+
+    # Verify
+    mock_load_private_key.assert_not_called()
+    mock_load_wallet_key.assert_not_called()
+    mock_jwt_options.assert_not_called()
+
+
+def test_auth_context_invalid_key_fails_on_use():
+    """Test that invalid keys are reported when headers are requested."""
+    # Setup
+    context = AuthContext(api_key_id="test-key", api_key_secret="invalid-key-data")
+
+    # Execute & Verify
+    with pytest.raises(ValueError, match="Failed to generate JWT"):
+        context.get_headers("GET", "api.example.com", "/test")
+
+
+def test_auth_context_missing_wallet_secret(ed25519_private_key_factory):
+    """Test error when wallet auth is required but not configured."""
+    # Setup
+    context = AuthContext(api_key_id="test-key", api_key_secret=ed25519_private_key_factory())
+
+    # Execute & Verify
+    with pytest.raises(ValueError, match="Wallet Secret not configured"):
+        context.get_headers("POST", "api.example.com", "/accounts")
+
+
+def test_auth_context_pickle_drops_keys_and_token_cache(ed25519_private_key_factory):
+    """Test that a pickled auth context can be used in another process."""
+    # Setup
+    context = AuthContext(
+        api_key_id="test-key",
+        api_key_secret=ed25519_private_key_factory(),
+        token_cache=BearerTokenCache(),
+    )
+
+    # Execute
+    restored = pickle.loads(pickle.dumps(context))
+
+    # Verify
+    assert restored.token_cache is None
+    assert restored._private_key is not None
+    assert restored.get_headers("GET", "api.example.com", "/test")["Authorization"]
+
+
 @pytest.mark.parametrize(
     "request_method,request_path,expected",
     [
@@ -1,4 +1,5 @@
 import base64
+from unittest.mock import patch
 from urllib.parse import urlparse
 
 import jwt as jwt_lib
@@ -8,10 +9,16 @@ from cryptography.hazmat.primitives.asymmetric import ec, ed25519
 from pydantic import ValidationError
 
 # Import JWT utilities from the utils package
+from cdp.auth.utils import jwt as jwt_utils
 from cdp.auth.utils.jwt import (
     JwtOptions,
+    _clear_key_cache,
     _generate_nonce,
+    _load_private_key,
+    _load_wallet_key,
     _parse_private_key,
+    _parse_wallet_key,
+    _sign_wallet_jwt,
     generate_jwt,
 )
 
@@ -108,6 +115,118 @@ def test_parse_private_key_invalid():
         _parse_private_key("invalid-key-data")
 
 
+def test_load_private_key_caches_parsed_key(ed25519_private_key_factory):
+    """Test that parsed keys are reused across loads."""
+    # Setup
+    _clear_key_cache()
+    key_data = ed25519_private_key_factory()
+
+    # Execute
+    with patch("cdp.auth.utils.jwt._parse_private_key", wraps=_parse_private_key) as mock_parse:
+        key1 = _load_private_key(key_data)
+        key2 = _load_private_key(key_data)
+
+    # Verify
+    assert key1 is key2
+    mock_parse.assert_called_once_with(key_data)
+    assert key_data.encode() not in jwt_utils._key_cache
+
+
+def test_load_private_key_evicts_least_recently_used(ed25519_private_key_factory):
+    """Test that the key cache is bounded."""
+    # Setup
+    _clear_key_cache()
+    first_key = ed25519_private_key_factory()
+    _load_private_key(first_key)
+
+    # Execute
+    with patch("cdp.auth.utils.jwt.KEY_CACHE_MAX_SIZE", 2):
+        _load_private_key(ed25519_private_key_factory())
+        _load_private_key(ed25519_private_key_factory())
+
+    # Verify
+    assert len(jwt_utils._key_cache) == 2
+    with patch("cdp.auth.utils.jwt._parse_private_key", wraps=_parse_private_key) as mock_parse:
+        _load_private_key(first_key)
+    mock_parse.assert_called_once()
+
+
+def test_load_private_key_invalid_not_cached():
+    """Test that invalid keys raise and are not cached."""
+    # Setup
+    _clear_key_cache()
+
+    # Execute & Verify
+    with pytest.raises(ValueError):
+        _load_private_key("invalid-key-data")
+    assert len(jwt_utils._key_cache) == 0
+
+
+@pytest.fixture
+def wallet_secret():
+    """Fixture that generates a base64-encoded DER wallet secret for testing.
+
+    Returns:
+        str: Base64-encoded DER EC private key
+
+    """
+    der = ec.generate_private_key(ec.SECP256R1()).private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    return base64.b64encode(der).decode()
+
+
+def test_load_wallet_key_caches_loaded_key(wallet_secret):
+    """Test that loaded wallet keys are reused across loads."""
+    # Setup
+    _clear_key_cache()
+
+    # Execute
+    with patch("cdp.auth.utils.jwt._parse_wallet_key", wraps=_parse_wallet_key) as mock_parse:
+        key1 = _load_wallet_key(wallet_secret)
+        key2 = _load_wallet_key(wallet_secret)
+
+    # Verify
+    assert isinstance(key1, ec.EllipticCurvePrivateKey)
+    assert key1 is key2
+    mock_parse.assert_called_once_with(wallet_secret)
+
+
+def test_sign_wallet_jwt_with_serialized_request_data(wallet_secret):
+    """Test that a pre-serialized body is embedded in the req claim as-is."""
+    # Setup
+    wallet_key = _load_wallet_key(wallet_secret)
+    request_data = {"name": "test", "nested": {"values": [1, 2, 3]}}
+    serialized = '{"name":"test","nested":{"values":[1,2,3]}}'
+
+    # Execute
+    with patch("cdp.auth.utils.jwt.jwt.encode") as mock_encode:
+        token = _sign_wallet_jwt(wallet_key, "POST host/path", request_data, serialized)
+
+    # Verify
+    mock_encode.assert_not_called()
+    decoded = jwt_lib.decode(token, wallet_key.public_key(), algorithms=["ES256"])
+    assert decoded["uris"] == ["POST host/path"]
+    assert decoded["req"] == request_data
+    payload = base64.urlsafe_b64decode(token.split(".")[1] + "==").decode()
+    assert payload.endswith(f',"req":{serialized}}}')
+
+
+def test_sign_wallet_jwt_omits_empty_request_data(wallet_secret):
+    """Test that an empty body is left out of the req claim."""
+    # Setup
+    wallet_key = _load_wallet_key(wallet_secret)
+
+    # Execute
+    token = _sign_wallet_jwt(wallet_key, "DELETE host/path", {}, "{}")
+
+    # Verify
+    decoded = jwt_lib.decode(token, options={"verify_signature": False})
+    assert "req" not in decoded
+
+
 def test_generate_nonce():
     """Test nonce generation."""
     # Execute
@@ -1,6 +1,11 @@
 """CDP SDK Auth Utils package."""
 
-from .http import GetAuthHeadersOptions, get_auth_headers
+from .http import (
+    AuthContext,
+    BearerTokenCache,
+    GetAuthHeadersOptions,
+    get_auth_headers,
+)
 from .jwt import JwtOptions, WalletJwtOptions, generate_jwt, generate_wallet_jwt
 from .ws import GetWebSocketAuthHeadersOptions, get_websocket_auth_headers
 
@@ -13,6 +18,8 @@ __all__ = [
     # HTTP utils
     "get_auth_headers",
     "GetAuthHeadersOptions",
+    "BearerTokenCache",
+    "AuthContext",
     # WebSocket utils
     "get_websocket_auth_headers",
     "GetWebSocketAuthHeadersOptions",
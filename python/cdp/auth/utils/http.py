@@ -1,3 +1,8 @@
+import functools
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -5,6 +10,11 @@ from pydantic import BaseModel, Field
 from cdp.auth.utils.jwt import (
     JwtOptions,
     WalletJwtOptions,
+    _build_request_uri,
+    _load_private_key,
+    _load_wallet_key,
+    _sign_jwt,
+    _sign_wallet_jwt,
     generate_jwt,
     generate_wallet_jwt,
 )
@@ -41,11 +51,249 @@ class GetAuthHeadersOptions(BaseModel):
     audience: list[str] | None = Field(None, description="Optional audience claim for the JWT")
 
 
-def get_auth_headers(options: GetAuthHeadersOptions) -> dict[str, str]:
+class BearerTokenCache:
+    """A cache of bearer tokens (JWTs) for repeated requests to the same endpoint.
+
+    A bearer token is scoped to a single ``METHOD host/path`` URI and is valid for
+    ``expires_in`` seconds, so repeated requests to the same URI can reuse a token
+    instead of signing a new one. Cached tokens are refreshed ``refresh_margin`` seconds
+    before they expire.
+
+    Wallet Auth (``X-Wallet-Auth``) tokens bind the request body and are never cached.
+
+    Args:
+        refresh_margin: Seconds before expiry at which a cached token is replaced. Defaults to 30.
+        max_size: The maximum number of tokens to keep. Defaults to 1024.
+
+    """
+
+    def __init__(self, refresh_margin: int = 30, max_size: int = 1024):
+        if refresh_margin < 0:
+            raise ValueError("refresh_margin must be non-negative")
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.refresh_margin = refresh_margin
+        self.max_size = max_size
+        self._tokens: OrderedDict[tuple, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_token(self, options: JwtOptions) -> str:
+        """Return a cached bearer token for the request, generating a new one if needed.
+
+        Args:
+            options: The configuration options for generating the JWT
+
+        Returns:
+            The JWT (Bearer token) string
+
+        """
+        if not all([options.request_method, options.request_host, options.request_path]):
+            # Tokens without a 'uris' claim are not scoped to a request, so don't share them.
+            return generate_jwt(options)
+
+        key = (
+            options.api_key_id,
+            _build_request_uri(options.request_method, options.request_host, options.request_path),
+            options.expires_in,
+            tuple(options.audience) if options.audience is not None else None,
+        )
+        return self._get_or_generate(key, options.expires_in, lambda: generate_jwt(options))
+
+    def _get_or_generate(
+        self, key: tuple, expires_in: int | None, generate: Callable[[], str]
+    ) -> str:
+        """Return the cached token for the key, calling generate to replace a missing or stale one.
+
+        Args:
+            key: The cache key, which must include the request URI the token is scoped to
+            expires_in: The expiration time in seconds of tokens returned by generate
+            generate: A function that signs a new token
+
+        Returns:
+            The JWT (Bearer token) string
+
+        """
+        now = time.time()
+
+        with self._lock:
+            cached = self._tokens.get(key)
+            if cached is not None and cached[1] - self.refresh_margin > now:
+                self._tokens.move_to_end(key)
+                return cached[0]
+
+        # JWT timestamps are whole seconds, so the token expires relative to int(now).
+        expires_at = int(now) + (expires_in or 120)
+        token = generate()
+
+        with self._lock:
+            self._tokens[key] = (token, expires_at)
+            self._tokens.move_to_end(key)
+            while len(self._tokens) > self.max_size:
+                self._tokens.popitem(last=False)
+
+        return token
+
+    def clear(self) -> None:
+        """Remove all cached tokens."""
+        with self._lock:
+            self._tokens.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached tokens."""
+        return len(self._tokens)
+
+
+class AuthContext:
+    """Precomputed authentication state for generating request headers.
+
+    ``get_auth_headers`` validates its options and parses keys on every call, which suits
+    one-off requests. An ``AuthContext`` does that work once: it holds the parsed API key,
+    the loaded wallet secret and the Correlation-Context header for a set of credentials,
+    and builds headers with plain function calls. Used by ``CdpApiClient`` for every request.
+
+    Keys that fail to parse are reported when headers are first requested, with the same
+    errors as ``get_auth_headers``.
+
+    Args:
+        api_key_id: The API key ID
+        api_key_secret: The API key secret
+        wallet_secret: Optional wallet secret for wallet authentication
+        source: Optional source identifier
+        source_version: Optional source version
+        expires_in: Optional JWT expiration time in seconds
+        audience: Optional audience claim for the JWT
+        token_cache: Optional cache used to reuse bearer tokens across requests
+
+    """
+
+    def __init__(
+        self,
+        api_key_id: str,
+        api_key_secret: str,
+        wallet_secret: str | None = None,
+        source: str | None = None,
+        source_version: str | None = None,
+        expires_in: int | None = None,
+        audience: list[str] | None = None,
+        token_cache: BearerTokenCache | None = None,
+    ):
+        self.api_key_id = api_key_id
+        self.api_key_secret = api_key_secret
+        self.wallet_secret = wallet_secret
+        self.expires_in = expires_in
+        self.audience = audience
+        self.token_cache = token_cache
+        self.correlation_context = _get_correlation_data(source, source_version)
+        self._audience_key = tuple(audience) if audience is not None else None
+        self._private_key = None
+        self._wallet_key = None
+        self._load_keys()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the picklable state, leaving out parsed keys and the token cache."""
+        state = self.__dict__.copy()
+        state.update(_private_key=None, _wallet_key=None, token_cache=None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the context and parse keys again in the receiving process."""
+        self.__dict__.update(state)
+        self._load_keys()
+
+    def get_headers(
+        self,
+        request_method: str,
+        request_host: str,
+        request_path: str,
+        request_body: dict[str, Any] | None = None,
+        serialized_body: str | None = None,
+    ) -> dict[str, str]:
+        """Get authentication headers for a request.
+
+        Args:
+            request_method: The HTTP method
+            request_host: The request host
+            request_path: The request path
+            request_body: Optional request body
+            serialized_body: Optional JSON serialization of request_body, exactly as it will be
+                sent. When provided, the Wallet Auth JWT embeds it instead of re-serializing the body.
+
+        Returns:
+            Dict with authentication headers
+
+        """
+        request_method = request_method.upper()
+        uri = _build_request_uri(request_method, request_host, request_path)
+
+        if self.token_cache is not None:
+            jwt_token = self.token_cache._get_or_generate(
+                (self.api_key_id, uri, self.expires_in, self._audience_key),
+                self.expires_in,
+                lambda: self._generate_jwt(uri),
+            )
+        else:
+            jwt_token = self._generate_jwt(uri)
+
+        headers = {
+            "Authorization": f"Bearer {jwt_token}",
+            "Content-Type": "application/json",
+        }
+
+        if _requires_wallet_auth(request_method, request_path):
+            if not self.wallet_secret:
+                raise ValueError(
+                    "Wallet Secret not configured. Please set the CDP_WALLET_SECRET environment variable, or pass it as an option to the CdpClient constructor.",
+                )
+            headers["X-Wallet-Auth"] = self._generate_wallet_jwt(
+                f"{request_method} {request_host}{request_path}",
+                request_body or {},
+                serialized_body,
+            )
+
+        headers["Correlation-Context"] = self.correlation_context
+
+        return headers
+
+    def _load_keys(self) -> None:
+        """Parse the API key and wallet secret, leaving invalid keys to fail on first use."""
+        try:
+            self._private_key = _load_private_key(self.api_key_secret)
+        except Exception:
+            self._private_key = None
+
+        try:
+            self._wallet_key = _load_wallet_key(self.wallet_secret) if self.wallet_secret else None
+        except Exception:
+            self._wallet_key = None
+
+    def _generate_jwt(self, uri: str) -> str:
+        try:
+            private_key = self._private_key or _load_private_key(self.api_key_secret)
+            return _sign_jwt(private_key, self.api_key_id, uri, self.expires_in, self.audience)
+        except Exception as error:
+            raise ValueError(f"Failed to generate JWT: {error!s}") from error
+
+    def _generate_wallet_jwt(
+        self, uri: str, request_data: dict[str, Any], serialized_request_data: str | None
+    ) -> str:
+        try:
+            wallet_key = self._wallet_key or _load_wallet_key(self.wallet_secret)
+            return _sign_wallet_jwt(wallet_key, uri, request_data, serialized_request_data)
+        except Exception as error:
+            raise ValueError(f"Could not create the EC key: {error!s}") from error
+
+
+def get_auth_headers(
+    options: GetAuthHeadersOptions,
+    token_cache: BearerTokenCache | None = None,
+) -> dict[str, str]:
     """Get authentication headers for a request.
 
     Args:
         options: The authentication header options
+        token_cache: Optional cache used to reuse bearer tokens across requests to the same
+            endpoint. Wallet Auth tokens are always generated fresh.
 
     Returns:
         Dict with authentication headers
@@ -65,7 +313,9 @@ def get_auth_headers(options: GetAuthHeadersOptions) -> dict[str, str]:
     )
 
     # Generate and add JWT token
-    jwt_token = generate_jwt(jwt_options)
+    jwt_token = (
+        token_cache.get_token(jwt_options) if token_cache is not None else generate_jwt(jwt_options)
+    )
     headers["Authorization"] = f"Bearer {jwt_token}"
     headers["Content-Type"] = "application/json"
 
@@ -121,12 +371,8 @@ def _get_correlation_data(source: str | None = None, source_version: str | None
         Encoded correlation data as a query string
 
     """
-    from importlib.metadata import version
-
-    sdk_version = version("cdp-sdk")
-
     data = {
-        "sdk_version": sdk_version,
+        "sdk_version": _get_sdk_version(),
         "sdk_language": "python",
         "source": source or "sdk-auth",
     }
@@ -134,3 +380,16 @@ def _get_correlation_data(source: str | None = None, source_version: str | None
         data["source_version"] = source_version
 
     return ",".join(f"{key}={value}" for key, value in data.items())
+
+
+@functools.cache
+def _get_sdk_version() -> str:
+    """Return the installed version of the SDK.
+
+    Returns:
+        The SDK version
+
+    """
+    from importlib.metadata import version
+
+    return version("cdp-sdk")
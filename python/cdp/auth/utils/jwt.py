@@ -1,7 +1,12 @@
 import base64
+import hashlib
+import json
 import random
+import threading
 import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 from urllib.parse import urlparse
@@ -9,8 +14,18 @@ from urllib.parse import urlparse
 import jwt
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from jwt import api_jws
 from pydantic import BaseModel, Field, field_validator
 
+# The maximum number of parsed API keys and wallet secrets kept in memory. Most processes use
+# a single set of credentials, so this only needs to cover clients that juggle a few projects.
+KEY_CACHE_MAX_SIZE = 32
+
+_key_cache: OrderedDict[bytes, ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey] = (
+    OrderedDict()
+)
+_key_cache_lock = threading.Lock()
+
 
 class JwtOptions(BaseModel):
     r"""Configuration options for JWT generation.
@@ -158,46 +173,17 @@ def generate_jwt(options: JwtOptions) -> str:
         )
 
     try:
-        # Parse the private key
-        private_key = _parse_private_key(options.api_key_secret)
-
-        # Determine algorithm based on key type
-        if isinstance(private_key, ec.EllipticCurvePrivateKey):
-            algorithm = "ES256"
-        elif isinstance(private_key, ed25519.Ed25519PrivateKey):
-            algorithm = "EdDSA"
-        else:
-            raise ValueError("Unsupported key type")
-
-        # Create header with nonce
-        header = {
-            "alg": algorithm,
-            "kid": options.api_key_id,
-            "typ": "JWT",
-            "nonce": _generate_nonce(),
-        }
-
-        # Create claims with timing
-        now = int(time.time())
-        expires_in = options.expires_in or 120  # Default to 120 seconds
-
-        claims = {
-            "sub": options.api_key_id,
-            "iss": "cdp",
-            "aud": options.audience if options.audience is not None else ["cdp_service"],
-            "nbf": now,
-            "exp": now + expires_in,
-        }
+        # Parse the private key, reusing a previously parsed key object when possible
+        private_key = _load_private_key(options.api_key_secret)
 
         # Add the uris claim only for JWTs intended for REST API requests, not for websocket connections
-        if has_all_uri_params:
-            # Build the URI claim
-            parsed_url = urlparse(f"{options.request_host}{options.request_path}")
-            uri = f"{options.request_method} {parsed_url.netloc}{parsed_url.path}"
-            claims["uris"] = [uri]
+        uri = (
+            _build_request_uri(options.request_method, options.request_host, options.request_path)
+            if has_all_uri_params
+            else None
+        )
 
-        # Generate the JWT
-        return jwt.encode(claims, private_key, algorithm=algorithm, headers=header)
+        return _sign_jwt(private_key, options.api_key_id, uri, options.expires_in, options.audience)
 
     except Exception as error:
         raise ValueError(f"Failed to generate JWT: {error!s}") from error
@@ -222,30 +208,204 @@ def generate_wallet_jwt(options: WalletJwtOptions) -> str:
         raise ValueError("Server Wallet Secret is not defined")
 
     uri = f"{options.request_method} {options.request_host}{options.request_path}"
+
+    try:
+        wallet_key = _load_wallet_key(options.wallet_auth_key)
+
+        return _sign_wallet_jwt(wallet_key, uri, options.request_data)
+
+    except Exception as error:
+        raise ValueError(f"Could not create the EC key: {error!s}") from error
+
+
+def _sign_jwt(
+    private_key: ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey,
+    api_key_id: str,
+    uri: str | None,
+    expires_in: int | None = None,
+    audience: list[str] | None = None,
+) -> str:
+    """Sign a JWT (Bearer token) with an already parsed API key.
+
+    Args:
+        private_key: The parsed API key
+        api_key_id: The API key ID
+        uri: The request URI for the 'uris' claim, or None for JWTs intended for websocket connections
+        expires_in: Optional expiration time in seconds (defaults to 120)
+        audience: Optional audience claim for the JWT
+
+    Returns:
+        The signed JWT (Bearer token) string
+
+    Raises:
+        ValueError: If the key type is unsupported
+
+    """
+    # Determine algorithm based on key type
+    if isinstance(private_key, ec.EllipticCurvePrivateKey):
+        algorithm = "ES256"
+    elif isinstance(private_key, ed25519.Ed25519PrivateKey):
+        algorithm = "EdDSA"
+    else:
+        raise ValueError("Unsupported key type")
+
+    # Create header with nonce
+    header = {
+        "alg": algorithm,
+        "kid": api_key_id,
+        "typ": "JWT",
+        "nonce": _generate_nonce(),
+    }
+
+    # Create claims with timing
+    now = int(time.time())
+    expires_in = expires_in or 120  # Default to 120 seconds
+
+    claims = {
+        "sub": api_key_id,
+        "iss": "cdp",
+        "aud": audience if audience is not None else ["cdp_service"],
+        "nbf": now,
+        "exp": now + expires_in,
+    }
+
+    if uri is not None:
+        claims["uris"] = [uri]
+
+    return jwt.encode(claims, private_key, algorithm=algorithm, headers=header)
+
+
+def _sign_wallet_jwt(
+    wallet_key: ec.EllipticCurvePrivateKey,
+    uri: str,
+    request_data: dict[str, Any] | None,
+    serialized_request_data: str | None = None,
+) -> str:
+    """Sign a Wallet Auth JWT with an already loaded wallet secret.
+
+    Args:
+        wallet_key: The loaded wallet secret
+        uri: The request URI for the 'uris' claim, e.g. 'POST api.cdp.coinbase.com/platform/v2/evm/accounts'
+        request_data: The request body
+        serialized_request_data: Optional JSON serialization of request_data. When provided, it is
+            embedded in the 'req' claim as-is instead of serializing request_data again.
+
+    Returns:
+        The signed Wallet Auth JWT string
+
+    """
     now = int(datetime.now().timestamp())
 
     claims = {"uris": [uri], "iat": now, "nbf": now, "jti": str(uuid.uuid4())}
 
-    if options.request_data:
-        claims["req"] = options.request_data
+    if not request_data or serialized_request_data is None:
+        if request_data:
+            claims["req"] = request_data
+        return jwt.encode(claims, wallet_key, algorithm="ES256", headers={"typ": "JWT"})
 
-    try:
-        der_bytes = serialization.load_der_private_key(
-            base64.b64decode(options.wallet_auth_key), password=None
-        )
+    # Splice the serialized body into the claims instead of letting PyJWT serialize it again.
+    payload = f'{json.dumps(claims, separators=(",", ":"))[:-1]},"req":{serialized_request_data}}}'
+    return api_jws.encode(payload.encode(), wallet_key, algorithm="ES256", headers={"typ": "JWT"})
 
-        # Generate and sign the token
-        token = jwt.encode(
-            claims,
-            der_bytes,  # Use the private key directly
-            algorithm="ES256",
-            headers={"typ": "JWT"},
-        )
 
-        return token
+def _build_request_uri(request_method: str, request_host: str, request_path: str) -> str:
+    """Build the value of the 'uris' claim for a REST API request.
 
-    except Exception as error:
-        raise ValueError(f"Could not create the EC key: {error!s}") from error
+    Args:
+        request_method: The HTTP method for the request
+        request_host: The host for the request
+        request_path: The path for the request
+
+    Returns:
+        The URI the JWT is scoped to, e.g. 'GET api.cdp.coinbase.com/platform/v2/evm/accounts'
+
+    """
+    parsed_url = urlparse(f"{request_host}{request_path}")
+    return f"{request_method} {parsed_url.netloc}{parsed_url.path}"
+
+
+def _load_private_key(
+    key_data: str,
+) -> ec.EllipticCurvePrivateKey | ed25519.Ed25519PrivateKey:
+    """Return the parsed private key for the given key data, using a bounded LRU cache.
+
+    Args:
+        key_data: The private key data in either PEM (EC) or base64 (Ed25519) format
+
+    Returns:
+        The parsed private key object
+
+    Raises:
+        ValueError: If the key cannot be parsed or is of an unsupported type
+
+    """
+    return _load_cached_key(b"api_key", key_data, _parse_private_key)
+
+
+def _load_wallet_key(wallet_secret: str) -> ec.EllipticCurvePrivateKey:
+    """Return the EC private key for a base64-encoded DER wallet secret, using a bounded LRU cache.
+
+    Args:
+        wallet_secret: The wallet secret
+
+    Returns:
+        The loaded EC private key
+
+    """
+    return _load_cached_key(b"wallet_secret", wallet_secret, _parse_wallet_key)
+
+
+def _load_cached_key(kind: bytes, key_data: str, parse: Callable[[str], Any]) -> Any:
+    """Return a parsed key from the key cache, parsing and caching it on a miss.
+
+    Cache entries are keyed by a SHA-256 digest of the key data so the raw secret is
+    never used as a dictionary key.
+
+    Args:
+        kind: The kind of key, to keep API keys and wallet secrets apart
+        key_data: The encoded key
+        parse: A function that parses the encoded key
+
+    Returns:
+        The parsed key object
+
+    """
+    digest = hashlib.sha256(kind + b":" + key_data.encode()).digest()
+
+    with _key_cache_lock:
+        key = _key_cache.get(digest)
+        if key is not None:
+            _key_cache.move_to_end(digest)
+            return key
+
+    key = parse(key_data)
+
+    with _key_cache_lock:
+        _key_cache[digest] = key
+        _key_cache.move_to_end(digest)
+        while len(_key_cache) > KEY_CACHE_MAX_SIZE:
+            _key_cache.popitem(last=False)
+
+    return key
+
+
+def _clear_key_cache() -> None:
+    """Remove all parsed private keys from the key cache."""
+    with _key_cache_lock:
+        _key_cache.clear()
+
+
+def _parse_wallet_key(wallet_secret: str) -> ec.EllipticCurvePrivateKey:
+    """Parse the EC private key from a base64-encoded DER wallet secret.
+
+    Args:
+        wallet_secret: The wallet secret
+
+    Returns:
+        The parsed EC private key
+
+    """
+    return serialization.load_der_private_key(base64.b64decode(wallet_secret), password=None)
 
 
 def _parse_private_key(
@@ -0,0 +1,321 @@
+import asyncio
+import contextlib
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from cdp.openapi_client.errors import ApiError
+from cdp.pagination import paginate
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DONE = object()
+
+
+class _WorkerError:
+    """An unexpected error a worker of ``run_workers`` stopped with."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+async def run_workers(
+    items: Iterable[T],
+    work: Callable[[T, Callable[[R], Awaitable[None]]], Awaitable[None]],
+    concurrency: int,
+) -> AsyncIterator[R]:
+    """Process items with a bounded number of workers, yielding their results as they come.
+
+    Each item is passed to ``work`` with an ``emit`` coroutine function, which it calls for
+    each of its results; it may emit any number of them. Results are buffered up to twice
+    ``concurrency``, so workers wait when the consumer falls behind. ``work`` is expected to
+    handle the errors of its items: any other error stops the iteration and is raised. The
+    workers are cancelled when the iteration stops, including when the consumer stops early.
+
+    Args:
+        items (Iterable[T]): The items.
+        work (Callable[[T, Callable[[R], Awaitable[None]]], Awaitable[None]]): A coroutine
+            function called with an item and the ``emit`` coroutine function.
+        concurrency (int): The maximum number of items processed at once.
+
+    Yields:
+        R: The results emitted by ``work``.
+
+    """
+    pending = deque(items)
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def worker() -> None:
+        try:
+            while pending:
+                await work(pending.popleft(), results.put)
+        except Exception as e:
+            await results.put(_WorkerError(e))
+        await results.put(_DONE)
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(pending)))]
+    try:
+        running = len(workers)
+        while running:
+            result = await results.get()
+            if result is _DONE:
+                running -= 1
+            elif isinstance(result, _WorkerError):
+                raise result.error
+            else:
+                yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+class BulkItemError(BaseModel):
+    """A failure of one item of a bulk operation."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int = Field(description="The position of the item in the bulk operation.")
+    item: Any = Field(description="The item that failed.")
+    error: Exception = Field(description="The error the item failed with.")
+
+
+class BulkOperation(Generic[T, R]):
+    """Runs an operation over many items concurrently, adapting the concurrency to throttling.
+
+    Iterating over the bulk operation runs it and yields ``(index, result)`` tuples as the
+    items finish, so their order is not deterministic. ``collect`` runs it and returns the
+    results in the order of the items instead. The number of items in flight starts
+    at ``concurrency``. It is halved, at most once a second, whenever the API responds with
+    429, and grows back by one after as many successes as the current concurrency. Throttled
+    items are retried after a backoff. Items that fail are recorded in ``errors`` and don't
+    stop the rest of the operation.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        operation: Callable[[int, T], Awaitable[R]],
+        concurrency: int = 10,
+        max_throttle_retries: int = 5,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 20,
+    ) -> None:
+        """Initialize the bulk operation.
+
+        Args:
+            items (Iterable[T]): The items.
+            operation (Callable[[int, T], Awaitable[R]]): A coroutine function called with the
+                index and the item.
+            concurrency (int): The maximum number of items in flight. Defaults to 10.
+            max_throttle_retries (int): How many times an item is retried after a 429 response.
+                Defaults to 5.
+            backoff_factor (float): The base, in seconds, of the exponential backoff between
+                retries of a throttled item. Defaults to 0.5.
+            backoff_max (float): The maximum backoff in seconds. Defaults to 20.
+
+        """
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+
+        self.items = list(items)
+        self.operation = operation
+        self.max_concurrency = concurrency
+        self.max_throttle_retries = max_throttle_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.errors: list[BulkItemError] = []
+
+        self._limit = float(concurrency)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition: asyncio.Condition | None = None
+
+    @property
+    def concurrency(self) -> int:
+        """Get the current concurrency.
+
+        Returns:
+            int: The number of items that may currently be in flight.
+
+        """
+        return int(self._limit)
+
+    async def __aiter__(self) -> AsyncIterator[tuple[int, R]]:
+        """Run the bulk operation.
+
+        Yields:
+            tuple[int, R]: The index of an item and its result.
+
+        """
+        self.errors = []
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        # Closing the results closes the workers too, if the caller stops early.
+        results = run_workers(enumerate(self.items), self._run_item, self.max_concurrency)
+        async with contextlib.aclosing(results):
+            async for result in results:
+                yield result
+
+    async def collect(self) -> list[R | None]:
+        """Run the bulk operation and return the results in the order of the items.
+
+        Returns:
+            list[R | None]: The result of each item, or None for the items that failed, which
+                are recorded in ``errors`` in the order of the items.
+
+        """
+        results: list[R | None] = [None] * len(self.items)
+        async for index, result in self:
+            results[index] = result
+        self.errors.sort(key=lambda error: error.index)
+        return results
+
+    async def _run_item(
+        self, entry: tuple[int, T], emit: Callable[[tuple[int, R]], Awaitable[None]]
+    ) -> None:
+        index, item = entry
+        attempt = 0
+        while True:
+            await self._acquire()
+            try:
+                result = await self.operation(index, item)
+            except ApiError as e:
+                throttled = e.http_code == 429
+                await self._release(throttled=throttled)
+                if throttled and attempt < self.max_throttle_retries:
+                    await asyncio.sleep(self._get_backoff(attempt))
+                    attempt += 1
+                    continue
+                self.errors.append(BulkItemError(index=index, item=item, error=e))
+            except Exception as e:
+                await self._release()
+                self.errors.append(BulkItemError(index=index, item=item, error=e))
+            else:
+                await self._release(succeeded=True)
+                await emit((index, result))
+            return
+
+    async def _acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+
+    async def _release(self, throttled: bool = False, succeeded: bool = False) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                now = time.monotonic()
+                if now - self._last_decrease >= 1:
+                    self._last_decrease = now
+                    self._limit = max(1.0, self._limit / 2)
+            elif succeeded:
+                self._limit = min(float(self.max_concurrency), self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+    def _get_backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_factor * 2**attempt))
+
+
+async def get_or_create_by_name(
+    names: Iterable[str],
+    in_flight: dict[str, asyncio.Future],
+    get_cached: Callable[[str], R | None],
+    fetch_page: Callable[[str | None], Awaitable[Any]],
+    create: Callable[[str], Awaitable[R]],
+    concurrency: int = 10,
+    get_by_name: Callable[[str], Awaitable[R | None]] | None = None,
+    max_lookups: int = 10,
+) -> dict[str, R]:
+    """Get many accounts by name, creating the ones that don't exist.
+
+    Names are first looked up with ``get_cached``. If at most ``max_lookups`` names remain,
+    they are looked up concurrently with ``get_by_name``, so each costs about one request
+    however many accounts exist. Otherwise the existing accounts are paged through until
+    every remaining name is found. Only the accounts still missing are created,
+    concurrently. A name that is already being resolved by another call, tracked in
+    ``in_flight``, is awaited instead of being looked up or created again.
+
+    Args:
+        names (Iterable[str]): The names of the accounts. Duplicates are resolved once.
+        in_flight (dict[str, asyncio.Future]): The futures of the names being resolved, shared
+            by all calls for the same kind of account.
+        get_cached (Callable[[str], R | None]): Returns the cached account for a name, if any.
+        fetch_page (Callable[[str | None], Awaitable[Any]]): Fetches a page of existing
+            accounts for a page token. The page must have ``accounts`` and ``next_page_token``.
+        create (Callable[[str], Awaitable[R]]): Creates the account with a name.
+        concurrency (int): The maximum number of accounts looked up or created at once.
+            Defaults to 10.
+        get_by_name (Callable[[str], Awaitable[R | None]] | None): Gets the account with a
+            name, or None if there is none. Defaults to None, to always page.
+        max_lookups (int): The maximum number of names looked up with ``get_by_name`` instead
+            of paging. Defaults to 10.
+
+    Returns:
+        dict[str, R]: The accounts by name.
+
+    """
+    loop = asyncio.get_running_loop()
+    futures: dict[str, asyncio.Future] = {}
+    owned: dict[str, asyncio.Future] = {}
+    for name in dict.fromkeys(names):
+        if name not in in_flight:
+            owned[name] = in_flight[name] = loop.create_future()
+        futures[name] = in_flight[name]
+
+    try:
+        missing = {}
+        for name, future in owned.items():
+            account = get_cached(name)
+            if account is None:
+                missing[name] = future
+            else:
+                future.set_result(account)
+
+        if missing and get_by_name is not None and len(missing) <= max_lookups:
+            lookup = BulkOperation(missing, lambda index, name: get_by_name(name), concurrency)
+            async for index, account in lookup:
+                if account is not None:
+                    missing.pop(lookup.items[index]).set_result(account)
+            for error in lookup.errors:
+                missing.pop(error.item).set_exception(error.error)
+        elif missing:
+            async with contextlib.aclosing(paginate(fetch_page)) as pages:
+                async for page in pages:
+                    for account in page.accounts:
+                        future = missing.pop(account.name, None)
+                        if future is not None:
+                            future.set_result(account)
+                    if not missing:
+                        break
+
+        if missing:
+            operation = BulkOperation(missing, lambda index, name: create(name), concurrency)
+            async for index, account in operation:
+                missing[operation.items[index]].set_result(account)
+            for error in operation.errors:
+                missing[error.item].set_exception(error.error)
+    except Exception as e:
+        for future in owned.values():
+            if not future.done():
+                future.set_exception(e)
+    finally:
+        for name, future in owned.items():
+            future.cancel()
+            if in_flight.get(name) is future:
+                del in_flight[name]
+
+    results = await asyncio.gather(
+        *(asyncio.shield(future) for future in futures.values()), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return dict(zip(futures, results, strict=True))
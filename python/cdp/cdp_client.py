@@ -1,13 +1,20 @@
 import os
+from concurrent.futures import Executor
 
 from cdp.__version__ import __version__
+from cdp.account_cache import AccountCache
 from cdp.analytics import Analytics, wrap_class_with_error_tracking
 from cdp.api_clients import ApiClients
 from cdp.constants import SDK_DEFAULT_SOURCE
 from cdp.evm_client import EvmClient
+from cdp.nonce_manager import NonceManager
 from cdp.openapi_client.cdp_api_client import CdpApiClient
 from cdp.policies_client import PoliciesClient
+from cdp.result_cache import ResultCache
 from cdp.solana_client import SolanaClient
+from cdp.transport.rate_limit import RateLimiter
+from cdp.transport.retry import RetryMetrics
+from cdp.transport_types import TransportOptions
 
 
 class CdpClient:
@@ -23,6 +30,15 @@ class CdpClient:
         max_network_retries: int = 3,
         source: str = SDK_DEFAULT_SOURCE,
         source_version: str = __version__,
+        cache_bearer_tokens: bool = False,
+        offload_signing: bool = True,
+        signing_executor: Executor | None = None,
+        transport_options: TransportOptions | None = None,
+        auto_idempotency_keys: bool = False,
+        coalesce_requests: bool = False,
+        account_cache: AccountCache | None = None,
+        result_cache: ResultCache | None = None,
+        nonce_manager: NonceManager | None = None,
     ):
         """Instantiate the CdpClient.
 
@@ -35,6 +51,31 @@ class CdpClient:
             max_network_retries (int, optional): The maximum number of network retries. Defaults to 3.
             source (str, optional): The source. Defaults to SDK_DEFAULT_SOURCE.
             source_version (str, optional): The source version. Defaults to __version__.
+            cache_bearer_tokens (bool, optional): Whether to reuse bearer tokens for repeated requests
+                to the same endpoint until shortly before they expire. Wallet Auth tokens are never
+                reused. Defaults to False.
+            offload_signing (bool, optional): Whether to sign auth tokens in an executor so that
+                signing doesn't block the event loop. Defaults to True.
+            signing_executor (Executor, optional): The executor used to sign auth tokens. Defaults
+                to a thread pool owned by the client. Pass a ProcessPoolExecutor to sign in
+                separate processes.
+            transport_options (TransportOptions, optional): Connection pool, keep-alive, DNS caching,
+                timeout and retry settings for the HTTP transport. Defaults to TransportOptions().
+            auto_idempotency_keys (bool, optional): Whether to generate an idempotency key for
+                operations that accept one, such as creating accounts, signing and sending
+                transactions, when none is passed, and to retry those operations on connection
+                errors and 502, 503 and 504 responses. Defaults to False.
+            coalesce_requests (bool, optional): Whether concurrent identical GET requests, such as
+                fetching the same account or polling the same user operation, share a single
+                in-flight request. Defaults to False.
+            account_cache (AccountCache, optional): A cache for account and smart account
+                lookups. Defaults to None, which disables caching.
+            result_cache (ResultCache, optional): A cache for user operations and payment
+                transfers that have finished, such as InMemoryResultCache or
+                SqliteResultCache. Defaults to None, which disables caching.
+            nonce_manager (NonceManager, optional): A nonce manager that assigns the nonces of
+                EVM transactions sent without one, so that many transactions from the same
+                account can be sent concurrently. Defaults to None, which leaves it to the API.
 
         """
         api_key_id = api_key_id or os.getenv("CDP_API_KEY_ID") or os.getenv("CDP_API_KEY_NAME")
@@ -85,12 +126,20 @@ For more information, see: https://github.com/coinbase/cdp-sdk/blob/main/python/
             max_network_retries,
             source,
             source_version,
+            cache_bearer_tokens,
+            offload_signing,
+            signing_executor,
+            transport_options,
+            auto_idempotency_keys,
+            coalesce_requests,
         )
-        self.api_clients = ApiClients(self.cdp_api_client)
+        self.api_clients = ApiClients(self.cdp_api_client, result_cache)
+        self.result_cache = result_cache
 
-        self._evm = EvmClient(self.api_clients)
-        self._solana = SolanaClient(self.api_clients)
-        self._policies = PoliciesClient(self.api_clients)
+        self.account_cache = account_cache
+        self._evm = EvmClient(self.api_clients, account_cache, nonce_manager)
+        self._solana = SolanaClient(self.api_clients, account_cache)
+        self._policies = PoliciesClient(self.api_clients, account_cache)
 
         if os.getenv("DISABLE_CDP_ERROR_REPORTING") != "true":
             Analytics["identifier"] = api_key_id
@@ -114,6 +163,16 @@ For more information, see: https://github.com/coinbase/cdp-sdk/blob/main/python/
         """Get the PoliciesClient instance."""
         return self._policies
 
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """Get the client-side rate limiter, or None if no rate limits are configured."""
+        return self.cdp_api_client.rate_limiter
+
+    @property
+    def retry_metrics(self) -> RetryMetrics:
+        """Get the metrics on retries taken by the client."""
+        return self.cdp_api_client.retry_metrics
+
     async def __aenter__(self):
         """Enter the context manager."""
         return self
@@ -122,7 +181,24 @@ For more information, see: https://github.com/coinbase/cdp-sdk/blob/main/python/
         """Exit the context manager."""
         await self.close()
 
+    async def warm_up(self, connections: int = 1) -> int:
+        """Open keep-alive connections to the CDP API ahead of the first request.
+
+        Creates the HTTP session, resolves the API host and completes the TLS handshakes for
+        the given number of pooled connections, so that the first requests don't pay for them.
+
+        Args:
+            connections (int): The number of connections to open. Defaults to 1.
+
+        Returns:
+            int: The number of connections that were opened.
+
+        """
+        return await self.cdp_api_client.warm_up(connections)
+
     async def close(self):
         """Close the CDP client."""
+        if self._evm._user_operation_tracker is not None:
+            await self._evm._user_operation_tracker.close()
         await self.api_clients.close()
         return None
@@ -3,6 +3,12 @@
 # SDK_DEFAULT_SOURCE (str): Denotes the default source for the Python SDK.
 SDK_DEFAULT_SOURCE = "sdk"
 
+# USER_OPERATION_FINAL_STATUSES (frozenset[str]): The statuses a user operation never leaves.
+USER_OPERATION_FINAL_STATUSES = frozenset({"complete", "failed"})
+
+# TRANSFER_FINAL_STATUSES (frozenset[str]): The statuses a payment transfer never leaves.
+TRANSFER_FINAL_STATUSES = frozenset({"completed", "failed"})
+
 """The public RSA key used to encrypt the private key when importing an EVM account."""
 ImportEvmAccountPublicRSAKey = """-----BEGIN PUBLIC KEY-----
 MIICIjANBgkqhkiG9w0BAQEFAAOCAg8AMIICCgKCAgEA2Fxydgm/ryYk0IexQIuL
@@ -1,5 +1,8 @@
+import asyncio
 import base64
 import re
+import uuid
+from collections.abc import AsyncIterator, Iterable
 from typing import Any
 
 from cryptography.hazmat.primitives import hashes
@@ -8,21 +11,26 @@ from cryptography.hazmat.primitives.serialization import load_pem_public_key
 from eth_account.signers.base import BaseAccount
 from eth_account.typed_transactions import DynamicFeeTransaction
 
+from cdp.account_cache import AccountCache
 from cdp.actions.evm.list_token_balances import list_token_balances
 from cdp.actions.evm.request_faucet import request_faucet
+from cdp.actions.evm.scan_token_balances import TokenBalanceScan
 from cdp.actions.evm.send_transaction import send_transaction
 from cdp.actions.evm.send_user_operation import send_user_operation
 from cdp.actions.evm.wait_for_user_operation import wait_for_user_operation
 from cdp.analytics import wrap_class_with_error_tracking
 from cdp.api_clients import ApiClients
+from cdp.bulk import BulkOperation, get_or_create_by_name
 from cdp.constants import ImportEvmAccountPublicRSAKey
 from cdp.evm_call_types import ContractCall, EncodedCall
 from cdp.evm_server_account import EvmServerAccount, ListEvmAccountsResponse
 from cdp.evm_smart_account import EvmSmartAccount, ListEvmSmartAccountsResponse
 from cdp.evm_token_balances import (
+    EvmTokenBalance,
     ListTokenBalancesResult,
 )
 from cdp.evm_transaction_types import TransactionRequestEIP1559
+from cdp.nonce_manager import NonceManager
 from cdp.openapi_client.errors import ApiError
 from cdp.openapi_client.models.create_evm_account_request import CreateEvmAccountRequest
 from cdp.openapi_client.models.create_evm_smart_account_request import (
@@ -31,6 +39,7 @@ from cdp.openapi_client.models.create_evm_smart_account_request import (
 from cdp.openapi_client.models.eip712_domain import EIP712Domain
 from cdp.openapi_client.models.eip712_message import EIP712Message
 from cdp.openapi_client.models.evm_call import EvmCall
+from cdp.openapi_client.models.evm_smart_account import EvmSmartAccount as EvmSmartAccountModel
 from cdp.openapi_client.models.evm_user_operation import EvmUserOperation as EvmUserOperationModel
 from cdp.openapi_client.models.import_evm_account_request import ImportEvmAccountRequest
 from cdp.openapi_client.models.prepare_user_operation_request import (
@@ -41,17 +50,41 @@ from cdp.openapi_client.models.sign_evm_message_request import SignEvmMessageReq
 from cdp.openapi_client.models.sign_evm_transaction_request import (
     SignEvmTransactionRequest,
 )
+from cdp.pagination import paginate
 from cdp.update_account_types import UpdateAccountOptions
+from cdp.user_operation_tracker import UserOperationTracker
+from cdp.utils import derive_idempotency_key
 
 
 class EvmClient:
     """The EvmClient class is responsible for CDP API calls for the EVM."""
 
-    def __init__(self, api_clients: ApiClients):
+    def __init__(
+        self,
+        api_clients: ApiClients,
+        account_cache: AccountCache | None = None,
+        nonce_manager: NonceManager | None = None,
+    ):
         self.api_clients = api_clients
+        self.account_cache = account_cache
+        self.nonce_manager = nonce_manager
+        self._get_or_create_in_flight: dict[str, asyncio.Future] = {}
+        self._user_operation_tracker: UserOperationTracker | None = None
         wrap_class_with_error_tracking(EvmServerAccount)
         wrap_class_with_error_tracking(EvmSmartAccount)
 
+    @property
+    def user_operation_tracker(self) -> UserOperationTracker:
+        """Get the shared tracker for pending user operations.
+
+        Returns:
+            UserOperationTracker: The tracker, created on first access.
+
+        """
+        if self._user_operation_tracker is None:
+            self._user_operation_tracker = UserOperationTracker(self.api_clients)
+        return self._user_operation_tracker
+
     async def create_account(
         self,
         name: str | None = None,
@@ -76,7 +109,68 @@ class EvmClient:
                 account_policy=account_policy,
             ),
         )
-        return EvmServerAccount(evm_account, self.api_clients.evm_accounts, self.api_clients)
+        self._cache_account(evm_account)
+        return EvmServerAccount(
+            evm_account, self.api_clients.evm_accounts, self.api_clients, self.nonce_manager
+        )
+
+    def create_accounts(
+        self,
+        names: Iterable[str] | None = None,
+        count: int | None = None,
+        account_policy: str | None = None,
+        concurrency: int = 10,
+        idempotency_namespace: str | None = None,
+    ) -> BulkOperation[str | None, EvmServerAccount]:
+        """Create many EVM accounts concurrently.
+
+        Pass either the names of the accounts or the number of unnamed accounts to create.
+        Each account is created with an idempotency key derived from its name, or its
+        position for unnamed accounts, so running the same creation again returns the same
+        accounts instead of creating new ones. Unnamed accounts are keyed by the
+        ``idempotency_namespace`` too, which is random for each call unless given, so separate
+        batches create distinct accounts. Pass the same namespace to resume a batch of unnamed
+        accounts, for example after a crash.
+
+        Iterate over the returned bulk operation to receive ``(index, account)`` tuples as the
+        accounts are created. Accounts that fail to be created are recorded in its ``errors``.
+
+        Args:
+            names (Iterable[str], optional): The names of the accounts.
+            count (int, optional): The number of unnamed accounts.
+            account_policy (str, optional): The ID of the account-level policy to apply to the
+                accounts. Defaults to None.
+            concurrency (int, optional): The maximum number of accounts created at once. It is
+                lowered automatically when the API responds with 429. Defaults to 10.
+            idempotency_namespace (str, optional): A value that distinguishes this batch from
+                others in the idempotency keys. Defaults to None, which is a random value for
+                each batch of unnamed accounts.
+
+        Returns:
+            BulkOperation[str | None, EvmServerAccount]: The bulk operation.
+
+        """
+        if (names is None) == (count is None):
+            raise ValueError("Either names or count must be provided")
+
+        items = list(names) if names is not None else [None] * count
+        if names is None and idempotency_namespace is None:
+            idempotency_namespace = str(uuid.uuid4())
+
+        async def create(index: int, name: str | None) -> EvmServerAccount:
+            return await self.create_account(
+                name=name,
+                account_policy=account_policy,
+                idempotency_key=derive_idempotency_key(
+                    "evm",
+                    "create_account",
+                    idempotency_namespace,
+                    name if name is not None else index,
+                    account_policy,
+                ),
+            )
+
+        return BulkOperation(items, create, concurrency)
 
     async def import_account(
         self,
@@ -118,7 +212,10 @@ class EvmClient:
                 ),
                 x_idempotency_key=idempotency_key,
             )
-            return EvmServerAccount(evm_account, self.api_clients.evm_accounts, self.api_clients)
+            self._cache_account(evm_account)
+            return EvmServerAccount(
+                evm_account, self.api_clients.evm_accounts, self.api_clients, self.nonce_manager
+            )
         except ApiError as e:
             raise e
         except Exception as e:
@@ -137,6 +234,7 @@ class EvmClient:
         evm_smart_account = await self.api_clients.evm_smart_accounts.create_evm_smart_account(
             CreateEvmSmartAccountRequest(owners=[owner.address]),
         )
+        self._cache_smart_account(evm_smart_account)
         return EvmSmartAccount(
             evm_smart_account.address, owner, evm_smart_account.name, self.api_clients
         )
@@ -155,12 +253,20 @@ class EvmClient:
 
         """
         if address:
-            evm_account = await self.api_clients.evm_accounts.get_evm_account(address)
+            evm_account = self._get_cached(_account_key(address))
+            if evm_account is None:
+                evm_account = await self.api_clients.evm_accounts.get_evm_account(address)
+                self._cache_account(evm_account)
         elif name:
-            evm_account = await self.api_clients.evm_accounts.get_evm_account_by_name(name)
+            evm_account = self._get_cached(_account_name_key(name))
+            if evm_account is None:
+                evm_account = await self.api_clients.evm_accounts.get_evm_account_by_name(name)
+                self._cache_account(evm_account)
         else:
             raise ValueError("Either address or name must be provided")
-        return EvmServerAccount(evm_account, self.api_clients.evm_accounts, self.api_clients)
+        return EvmServerAccount(
+            evm_account, self.api_clients.evm_accounts, self.api_clients, self.nonce_manager
+        )
 
     async def get_or_create_account(self, name: str | None = None) -> EvmServerAccount:
         """Get an EVM account, or create one if it doesn't exist.
@@ -187,6 +293,77 @@ class EvmClient:
                     raise e
             raise e
 
+    async def get_or_create_accounts(
+        self,
+        names: Iterable[str],
+        concurrency: int = 10,
+        page_size: int | None = None,
+        max_lookups: int = 10,
+    ) -> dict[str, EvmServerAccount]:
+        """Get many EVM accounts by name, creating the ones that don't exist.
+
+        Names found in the account cache are resolved without a request. If at most
+        ``max_lookups`` names remain, each is looked up by name, concurrently. Otherwise they are
+        looked up by paging through the existing accounts until all are found. Only the accounts
+        still missing are created, concurrently. Duplicate names, including names another call is already
+        resolving, are resolved once.
+
+        Args:
+            names (Iterable[str]): The names of the accounts.
+            concurrency (int, optional): The maximum number of accounts looked up or created
+                at once. Defaults to 10.
+            page_size (int, optional): The number of accounts to fetch per page while looking
+                up existing accounts. Defaults to None.
+            max_lookups (int, optional): The maximum number of names looked up one by one
+                instead of paging through the existing accounts. Defaults to 10.
+
+        Returns:
+            dict[str, EvmServerAccount]: The accounts by name.
+
+        """
+
+        def get_cached(name: str) -> EvmServerAccount | None:
+            model = self._get_cached(_account_name_key(name))
+            return (
+                None
+                if model is None
+                else EvmServerAccount(
+                    model, self.api_clients.evm_accounts, self.api_clients, self.nonce_manager
+                )
+            )
+
+        async def get_by_name(name: str) -> EvmServerAccount | None:
+            try:
+                return await self.get_account(name=name)
+            except ApiError as e:
+                if e.http_code == 404:
+                    return None
+                raise e
+
+        async def create(name: str) -> EvmServerAccount:
+            try:
+                return await self.create_account(
+                    name=name,
+                    idempotency_key=derive_idempotency_key(
+                        "evm", "create_account", None, name, None
+                    ),
+                )
+            except ApiError as e:
+                if e.http_code == 409:
+                    return await self.get_account(name=name)
+                raise e
+
+        return await get_or_create_by_name(
+            names,
+            self._get_or_create_in_flight,
+            get_cached,
+            lambda page_token: self.list_accounts(page_size, page_token),
+            create,
+            concurrency,
+            get_by_name,
+            max_lookups,
+        )
+
     async def get_smart_account(
         self, address: str, owner: BaseAccount | None = None
     ) -> EvmSmartAccount:
@@ -200,7 +377,12 @@ class EvmClient:
             EvmSmartAccount: The EVM smart account.
 
         """
-        evm_smart_account = await self.api_clients.evm_smart_accounts.get_evm_smart_account(address)
+        evm_smart_account = self._get_cached(_smart_account_key(address))
+        if evm_smart_account is None:
+            evm_smart_account = await self.api_clients.evm_smart_accounts.get_evm_smart_account(
+                address
+            )
+            self._cache_smart_account(evm_smart_account)
         return EvmSmartAccount(
             evm_smart_account.address, owner, evm_smart_account.name, self.api_clients
         )
@@ -237,7 +419,9 @@ class EvmClient:
             page_size=page_size, page_token=page_token
         )
         evm_server_accounts = [
-            EvmServerAccount(account, self.api_clients.evm_accounts, self.api_clients)
+            EvmServerAccount(
+                account, self.api_clients.evm_accounts, self.api_clients, self.nonce_manager
+            )
             for account in response.accounts
         ]
         return ListEvmAccountsResponse(
@@ -245,6 +429,20 @@ class EvmClient:
             next_page_token=response.next_page_token,
         )
 
+    async def iter_accounts(self, page_size: int | None = None) -> AsyncIterator[EvmServerAccount]:
+        """Iterate over all EVM accounts, fetching the next page while the current one is processed.
+
+        Args:
+            page_size (int, optional): The number of accounts to fetch per page. Defaults to None.
+
+        Yields:
+            EvmServerAccount: Each EVM account.
+
+        """
+        async for page in paginate(lambda page_token: self.list_accounts(page_size, page_token)):
+            for account in page.accounts:
+                yield account
+
     async def list_token_balances(
         self,
         address: str,
@@ -272,6 +470,57 @@ class EvmClient:
             page_token,
         )
 
+    async def iter_token_balances(
+        self,
+        address: str,
+        network: str,
+        page_size: int | None = None,
+    ) -> AsyncIterator[EvmTokenBalance]:
+        """Iterate over the token balances for an address on the given network.
+
+        The next page is fetched while the current one is processed.
+
+        Args:
+            address (str): The address to list the token balances for.
+            network (str): The network to list the token balances for.
+            page_size (int, optional): The number of token balances to fetch per page. Defaults to None.
+
+        Yields:
+            EvmTokenBalance: Each token balance.
+
+        """
+        async for page in paginate(
+            lambda page_token: self.list_token_balances(address, network, page_size, page_token)
+        ):
+            for balance in page.balances:
+                yield balance
+
+    def scan_token_balances(
+        self,
+        addresses: Iterable[str],
+        networks: Iterable[str],
+        concurrency: int = 10,
+        page_size: int | None = None,
+    ) -> TokenBalanceScan:
+        """Scan the token balances of many addresses on many networks concurrently.
+
+        Iterate over the returned scan to receive ``(address, network, balance)`` tuples as
+        they arrive. Listings that fail don't stop the scan and are recorded in its ``errors``.
+
+        Args:
+            addresses (Iterable[str]): The addresses to scan.
+            networks (Iterable[str]): The networks to scan each address on.
+            concurrency (int, optional): The maximum number of listings in flight. Defaults to 10.
+            page_size (int, optional): The number of token balances to fetch per page. Defaults to None.
+
+        Returns:
+            TokenBalanceScan: The scan.
+
+        """
+        return TokenBalanceScan(
+            self.api_clients.evm_token_balances, addresses, networks, concurrency, page_size
+        )
+
     async def list_smart_accounts(
         self,
         page_size: int | None = None,
@@ -297,6 +546,25 @@ class EvmClient:
             next_page_token=response.next_page_token,
         )
 
+    async def iter_smart_accounts(
+        self, page_size: int | None = None
+    ) -> AsyncIterator[EvmSmartAccountModel]:
+        """Iterate over all EVM smart accounts, fetching the next page while the current one is processed.
+
+        Args:
+            page_size (int, optional): The number of accounts to fetch per page. Defaults to None.
+
+        Yields:
+            EvmSmartAccountModel: Each EVM smart account model. Call get_smart_account with an
+            owner to get an EvmSmartAccount instance that can be used to send user operations.
+
+        """
+        async for page in paginate(
+            lambda page_token: self.list_smart_accounts(page_size, page_token)
+        ):
+            for account in page.accounts:
+                yield account
+
     async def prepare_user_operation(
         self,
         smart_account: EvmSmartAccount,
@@ -429,6 +697,133 @@ class EvmClient:
         )
         return response.signature
 
+    def sign_hash_many(
+        self,
+        address: str,
+        hashes: Iterable[str],
+        concurrency: int = 10,
+        idempotency_namespace: str | None = None,
+    ) -> BulkOperation[str, str]:
+        """Sign many EVM hashes concurrently.
+
+        Each hash is signed with an idempotency key derived from the address, its position and
+        the hash, so retrying the same batch doesn't sign anything twice. Call ``collect`` on the
+        returned bulk operation to get the signatures in the order of the hashes. Hashes that
+        fail to be signed are recorded in its ``errors``.
+
+        Args:
+            address (str): The address of the account.
+            hashes (Iterable[str]): The hashes to sign.
+            concurrency (int, optional): The maximum number of hashes signed at once. It is
+                lowered automatically when the API responds with 429. Defaults to 10.
+            idempotency_namespace (str, optional): A value mixed into the idempotency keys, to
+                sign the same hashes again as a separate batch. Defaults to None, so the keys
+                only depend on the address, position and hash, and a batch that repeats an
+                earlier one is deduplicated by the API.
+
+        Returns:
+            BulkOperation[str, str]: The bulk operation.
+
+        """
+
+        async def sign(index: int, hash: str) -> str:
+            return await self.sign_hash(
+                address,
+                hash,
+                derive_idempotency_key(
+                    "evm", "sign_hash", idempotency_namespace, address, index, hash
+                ),
+            )
+
+        return BulkOperation(hashes, sign, concurrency)
+
+    def sign_message_many(
+        self,
+        address: str,
+        messages: Iterable[str],
+        concurrency: int = 10,
+        idempotency_namespace: str | None = None,
+    ) -> BulkOperation[str, str]:
+        """Sign many EVM messages concurrently.
+
+        Each message is signed with an idempotency key derived from the address, its position
+        and the message. Call ``collect`` on the returned bulk operation to get the signatures
+        in the order of the messages. Messages that fail to be signed are recorded in its
+        ``errors``.
+
+        Args:
+            address (str): The address of the account.
+            messages (Iterable[str]): The messages to sign.
+            concurrency (int, optional): The maximum number of messages signed at once. It is
+                lowered automatically when the API responds with 429. Defaults to 10.
+            idempotency_namespace (str, optional): A value mixed into the idempotency keys, so
+                that signing the same messages again isn't deduplicated. Defaults to None: the
+                keys are then derived from the address, position and message alone, and the
+                same message at the same position of another batch reuses its key.
+
+        Returns:
+            BulkOperation[str, str]: The bulk operation.
+
+        """
+
+        async def sign(index: int, message: str) -> str:
+            return await self.sign_message(
+                address,
+                message,
+                derive_idempotency_key(
+                    "evm", "sign_message", idempotency_namespace, address, index, message
+                ),
+            )
+
+        return BulkOperation(messages, sign, concurrency)
+
+    def sign_typed_data_many(
+        self,
+        address: str,
+        messages: Iterable[EIP712Message],
+        concurrency: int = 10,
+        idempotency_namespace: str | None = None,
+    ) -> BulkOperation[EIP712Message, str]:
+        """Sign many EVM typed data messages concurrently.
+
+        Each message is signed with an idempotency key derived from the address, its position
+        and the message. Call ``collect`` on the returned bulk operation to get the signatures
+        in the order of the messages. Messages that fail to be signed are recorded in its
+        ``errors``.
+
+        Args:
+            address (str): The address of the account.
+            messages (Iterable[EIP712Message]): The typed data messages to sign.
+            concurrency (int, optional): The maximum number of messages signed at once. It is
+                lowered automatically when the API responds with 429. Defaults to 10.
+            idempotency_namespace (str, optional): A value mixed into the idempotency keys.
+                Defaults to None, which derives the keys from the address, position and
+                message only, so identical requests of different batches share their keys.
+
+        Returns:
+            BulkOperation[EIP712Message, str]: The bulk operation.
+
+        """
+
+        async def sign(index: int, message: EIP712Message) -> str:
+            return await self.sign_typed_data(
+                address,
+                message.domain,
+                message.types,
+                message.primary_type,
+                message.message,
+                derive_idempotency_key(
+                    "evm",
+                    "sign_typed_data",
+                    idempotency_namespace,
+                    address,
+                    index,
+                    message.to_json(),
+                ),
+            )
+
+        return BulkOperation(messages, sign, concurrency)
+
     async def sign_transaction(
         self, address: str, transaction: str, idempotency_key: str | None = None
     ) -> str:
@@ -496,6 +891,7 @@ class EvmClient:
             transaction,
             network,
             idempotency_key,
+            self.nonce_manager,
         )
 
     async def send_user_operation(
@@ -550,7 +946,10 @@ class EvmClient:
             ),
             x_idempotency_key=idempotency_key,
         )
-        return EvmServerAccount(account, self.api_clients.evm_accounts, self.api_clients)
+        self._cache_account(account)
+        return EvmServerAccount(
+            account, self.api_clients.evm_accounts, self.api_clients, self.nonce_manager
+        )
 
     async def wait_for_user_operation(
         self,
@@ -558,6 +957,9 @@ class EvmClient:
         user_op_hash: str,
         timeout_seconds: float = 20,
         interval_seconds: float = 0.2,
+        backoff_multiplier: float = 1.5,
+        max_interval_seconds: float = 2,
+        jitter: float = 0.1,
     ) -> EvmUserOperationModel:
         """Wait for a user operation to be processed.
 
@@ -565,7 +967,12 @@ class EvmClient:
             smart_account_address (str): The address of the smart account that sent the operation.
             user_op_hash (str): The hash of the user operation to wait for.
             timeout_seconds (float, optional): Maximum time to wait in seconds. Defaults to 20.
-            interval_seconds (float, optional): Time between checks in seconds. Defaults to 0.2.
+            interval_seconds (float, optional): Time between the first checks in seconds. Defaults to 0.2.
+            backoff_multiplier (float, optional): The factor the time between checks grows by
+                after every check. Defaults to 1.5.
+            max_interval_seconds (float, optional): Maximum time between checks in seconds. Defaults to 2.
+            jitter (float, optional): The fraction by which each wait is randomly lengthened or
+                shortened. Defaults to 0.1.
 
         Returns:
             EvmUserOperationModel: The user operation model.
@@ -577,4 +984,40 @@ class EvmClient:
             user_op_hash,
             timeout_seconds,
             interval_seconds,
+            backoff_multiplier,
+            max_interval_seconds,
+            jitter,
         )
+
+    def _get_cached(self, key: tuple) -> Any | None:
+        """Get an account model from the account cache, if enabled."""
+        if self.account_cache is None:
+            return None
+        return self.account_cache.get(key)
+
+    def _cache_account(self, evm_account: Any) -> None:
+        """Cache an EVM account model under its address and name, if the cache is enabled."""
+        if self.account_cache is None:
+            return
+        keys = [_account_key(evm_account.address)]
+        if evm_account.name:
+            keys.append(_account_name_key(evm_account.name))
+        self.account_cache.set(keys, evm_account)
+
+    def _cache_smart_account(self, evm_smart_account: Any) -> None:
+        """Cache an EVM smart account model under its address, if the cache is enabled."""
+        if self.account_cache is None:
+            return
+        self.account_cache.set([_smart_account_key(evm_smart_account.address)], evm_smart_account)
+
+
+def _account_key(address: str) -> tuple:
+    return ("evm", "address", address.lower())
+
+
+def _account_name_key(name: str) -> tuple:
+    return ("evm", "name", name)
+
+
+def _smart_account_key(address: str) -> tuple:
+    return ("evm_smart", "address", address.lower())
@@ -35,6 +35,7 @@ from cdp.actions.evm.send_transaction import send_transaction
 from cdp.api_clients import ApiClients
 from cdp.evm_token_balances import ListTokenBalancesResult
 from cdp.evm_transaction_types import TransactionRequestEIP1559
+from cdp.nonce_manager import NonceManager
 from cdp.openapi_client.api.evm_accounts_api import EVMAccountsApi
 from cdp.openapi_client.models.eip712_domain import EIP712Domain
 from cdp.openapi_client.models.eip712_message import EIP712Message
@@ -45,6 +46,7 @@ from cdp.openapi_client.models.sign_evm_transaction_request import (
     SignEvmTransactionRequest,
 )
 from cdp.openapi_client.models.transfer import Transfer
+from cdp.utils import serialize_eip1559_transaction_dict
 
 
 class EvmServerAccount(BaseAccount, BaseModel):
@@ -57,6 +59,7 @@ class EvmServerAccount(BaseAccount, BaseModel):
         evm_server_account_model: EvmServerAccountModel,
         evm_accounts_api: EVMAccountsApi,
         api_clients: ApiClients,
+        nonce_manager: NonceManager | None = None,
     ) -> None:
         """Initialize the EvmServerAccount class.
 
@@ -64,6 +67,8 @@ class EvmServerAccount(BaseAccount, BaseModel):
             evm_server_account_model (EvmServerAccountModel): The EVM server account model.
             evm_accounts_api (EVMAccountsApi): The EVM accounts API.
             api_clients (ApiClients): The API client.
+            nonce_manager (NonceManager, optional): The nonce manager that assigns the nonces
+                of transactions sent without one. Defaults to None, which leaves it to the API.
 
         """
         super().__init__()
@@ -73,6 +78,7 @@ class EvmServerAccount(BaseAccount, BaseModel):
         self.__policies = evm_server_account_model.policies
         self.__evm_accounts_api = evm_accounts_api
         self.__api_clients = api_clients
+        self.__nonce_manager = nonce_manager
 
     @property
     def address(self) -> str:
@@ -104,6 +110,27 @@ class EvmServerAccount(BaseAccount, BaseModel):
         """
         return self.__policies
 
+    @property
+    def nonce_manager(self) -> NonceManager | None:
+        """Get the nonce manager that assigns the nonces of transactions sent without one.
+
+        Returns:
+            NonceManager | None: The nonce manager, or None if the API assigns the nonces.
+
+        """
+        return self.__nonce_manager
+
+    @nonce_manager.setter
+    def nonce_manager(self, nonce_manager: NonceManager | None) -> None:
+        """Set the nonce manager that assigns the nonces of transactions sent without one.
+
+        Args:
+            nonce_manager (NonceManager | None): The nonce manager, or None to let the API
+                assign the nonces.
+
+        """
+        self.__nonce_manager = nonce_manager
+
     async def sign_message(
         self, signable_message: SignableMessage, idempotency_key: str | None = None
     ) -> SignedMessage:
@@ -199,16 +226,16 @@ class EvmServerAccount(BaseAccount, BaseModel):
             ValueError: If the signature response is missing required fields
 
         """
-        typed_tx = TypedTransaction.from_dict(transaction_dict)
-        typed_tx.transaction.dictionary["v"] = 0
-        typed_tx.transaction.dictionary["r"] = 0
-        typed_tx.transaction.dictionary["s"] = 0
-        payload = typed_tx.transaction.payload()
-        serialized_tx = bytes([typed_tx.transaction_type]) + payload
-
-        sign_evm_transaction_request = SignEvmTransactionRequest(
-            transaction="0x" + serialized_tx.hex()
-        )
+        serialized_tx = serialize_eip1559_transaction_dict(transaction_dict)
+        if serialized_tx is None:
+            typed_tx = TypedTransaction.from_dict(transaction_dict)
+            typed_tx.transaction.dictionary["v"] = 0
+            typed_tx.transaction.dictionary["r"] = 0
+            typed_tx.transaction.dictionary["s"] = 0
+            payload = typed_tx.transaction.payload()
+            serialized_tx = "0x" + (bytes([typed_tx.transaction_type]) + payload).hex()
+
+        sign_evm_transaction_request = SignEvmTransactionRequest(transaction=serialized_tx)
         signature_response = await self.__evm_accounts_api.sign_evm_transaction(
             address=self.address,
             sign_evm_transaction_request=sign_evm_transaction_request,
@@ -233,7 +260,14 @@ class EvmServerAccount(BaseAccount, BaseModel):
             v=v,
         )
 
-    async def transfer(self, to: str | BaseAccount, amount: int, token: str, network: str):
+    async def transfer(
+        self,
+        to: str | BaseAccount,
+        amount: int,
+        token: str,
+        network: str,
+        approve: bool = False,
+    ):
         """Transfer an amount of a token from an account to another account.
 
         Args:
@@ -243,6 +277,9 @@ class EvmServerAccount(BaseAccount, BaseModel):
             Otherwise, you can pass atomic units directly. See examples below.
             token: The token to transfer.
             network: The network to transfer the token on.
+            approve: Whether to send an ERC-20 approve of the amount to the recipient before the
+                transfer, as earlier versions did. A transfer doesn't need an allowance, so this
+                only adds a transaction. Defaults to False.
 
         Returns:
             The result of the transfer.
@@ -286,6 +323,7 @@ class EvmServerAccount(BaseAccount, BaseModel):
             token=token,
             network=network,
             transfer_strategy=account_transfer_strategy,
+            approve=approve,
         )
 
     async def request_faucet(
@@ -413,6 +451,7 @@ class EvmServerAccount(BaseAccount, BaseModel):
             transaction=transaction,
             network=network,
             idempotency_key=idempotency_key,
+            nonce_manager=self.__nonce_manager,
         )
 
     async def quote_fund(
@@ -493,13 +532,21 @@ class EvmServerAccount(BaseAccount, BaseModel):
         transfer_id: str,
         timeout_seconds: float = 900,
         interval_seconds: float = 1,
+        backoff_multiplier: float = 1.5,
+        max_interval_seconds: float = 10,
+        jitter: float = 0.1,
     ) -> Transfer:
         """Wait for a fund operation to complete.
 
         Args:
             transfer_id: The ID of the transfer to wait for.
             timeout_seconds: The maximum time to wait for completion in seconds. Defaults to 900 (15 minutes).
-            interval_seconds: The time between status checks in seconds. Defaults to 1.
+            interval_seconds: The time between the first status checks in seconds. Defaults to 1.
+            backoff_multiplier: The factor the time between status checks grows by after every
+                check. Defaults to 1.5.
+            max_interval_seconds: The maximum time between status checks in seconds. Defaults to 10.
+            jitter: The fraction by which each wait is randomly lengthened or shortened.
+                Defaults to 0.1.
 
         Returns:
             Transfer: The completed transfer object containing:
@@ -520,6 +567,9 @@ class EvmServerAccount(BaseAccount, BaseModel):
             transfer_id=transfer_id,
             timeout_seconds=timeout_seconds,
             interval_seconds=interval_seconds,
+            backoff_multiplier=backoff_multiplier,
+            max_interval_seconds=max_interval_seconds,
+            jitter=jitter,
         )
 
     def __str__(self) -> str:
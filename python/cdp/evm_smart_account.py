@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import Literal
 
 from eth_account.signers.base import BaseAccount
@@ -89,6 +90,7 @@ class EvmSmartAccount(BaseModel):
         token: str,
         network: str,
         paymaster_url: str | None = None,
+        approve: bool = False,
     ):
         """Transfer an amount of a token from an account to another account.
 
@@ -100,6 +102,9 @@ class EvmSmartAccount(BaseModel):
             token: The token to transfer.
             network: The network to transfer the token on.
             paymaster_url: The paymaster URL to use for the transfer.
+            approve: Whether to include an ERC-20 approve of the amount to the recipient in the
+                user operation before the transfer, as earlier versions did. A transfer doesn't
+                need an allowance, so this only adds a call. Defaults to False.
 
         Returns:
             The result of the transfer.
@@ -149,6 +154,65 @@ class EvmSmartAccount(BaseModel):
             network=network,
             transfer_strategy=smart_account_transfer_strategy,
             paymaster_url=paymaster_url,
+            approve=approve,
+        )
+
+    async def transfer_many(
+        self,
+        transfers: Iterable[tuple[str | BaseAccount, int]],
+        token: str,
+        network: str,
+        paymaster_url: str | None = None,
+        max_calls_per_user_operation: int = 50,
+        max_calldata_size: int | None = None,
+    ) -> dict[str, EvmUserOperationModel | Exception]:
+        """Transfer a token from the smart account to many recipients in few user operations.
+
+        The transfers are packed into user operations of at most ``max_calls_per_user_operation``
+        calls, and at most ``max_calldata_size`` bytes of calldata if set. The user operations
+        are submitted one after another, so that each is prepared with its own nonce. A user
+        operation that fails doesn't stop the others.
+
+        Args:
+            transfers: The accounts or 0x-prefixed addresses to transfer the token to and the
+                amounts to transfer to them, in atomic units. Each recipient may appear once,
+                whatever the casing of its address.
+            token: The token to transfer.
+            network: The network to transfer the token on.
+            paymaster_url: The paymaster URL to use for the transfers.
+            max_calls_per_user_operation: The maximum number of transfers in a user operation.
+                Defaults to 50.
+            max_calldata_size: The maximum total size, in bytes, of the calldata of the
+                transfers in a user operation. Defaults to None, for no limit.
+
+        Returns:
+            The user operation that carries the transfer to each recipient address, or the
+            error its user operation failed with, in the order of the transfers.
+
+        Examples:
+            >>> results = await sender.transfer_many(
+            ...     [
+            ...         ("0x9F663335Cd6Ad02a37B633602E98866CF944124d", 10000),
+            ...         ("0x2345678901234567890123456789012345678901", 20000),
+            ...     ],
+            ...     token="usdc",
+            ...     network="base-sepolia",
+            ... )
+
+        """
+        from cdp.actions.evm.transfer import smart_account_transfer_strategy
+
+        return await smart_account_transfer_strategy.execute_transfer_many(
+            api_clients=self.__api_clients,
+            from_account=self,
+            transfers=[
+                (to.address if hasattr(to, "address") else to, amount) for to, amount in transfers
+            ],
+            token=token,
+            network=network,
+            paymaster_url=paymaster_url,
+            max_calls_per_user_operation=max_calls_per_user_operation,
+            max_calldata_size=max_calldata_size,
         )
 
     async def list_token_balances(
@@ -229,13 +293,21 @@ class EvmSmartAccount(BaseModel):
         user_op_hash: str,
         timeout_seconds: float = 20,
         interval_seconds: float = 0.2,
+        backoff_multiplier: float = 1.5,
+        max_interval_seconds: float = 2,
+        jitter: float = 0.1,
     ) -> EvmUserOperationModel:
         """Wait for a user operation to be processed.
 
         Args:
             user_op_hash (str): The hash of the user operation to wait for.
             timeout_seconds (float, optional): Maximum time to wait in seconds. Defaults to 20.
-            interval_seconds (float, optional): Time between checks in seconds. Defaults to 0.2.
+            interval_seconds (float, optional): Time between the first checks in seconds. Defaults to 0.2.
+            backoff_multiplier (float, optional): The factor the time between checks grows by
+                after every check. Defaults to 1.5.
+            max_interval_seconds (float, optional): Maximum time between checks in seconds. Defaults to 2.
+            jitter (float, optional): The fraction by which each wait is randomly lengthened or
+                shortened. Defaults to 0.1.
 
         Returns:
             EvmUserOperationModel: The user operation model.
@@ -247,6 +319,9 @@ class EvmSmartAccount(BaseModel):
             user_op_hash,
             timeout_seconds,
             interval_seconds,
+            backoff_multiplier,
+            max_interval_seconds,
+            jitter,
         )
 
     async def get_user_operation(self, user_op_hash: str) -> EvmUserOperationModel:
@@ -341,13 +416,21 @@ class EvmSmartAccount(BaseModel):
         transfer_id: str,
         timeout_seconds: float = 900,
         interval_seconds: float = 1,
+        backoff_multiplier: float = 1.5,
+        max_interval_seconds: float = 10,
+        jitter: float = 0.1,
     ) -> Transfer:
         """Wait for a fund operation to complete.
 
         Args:
             transfer_id: The ID of the transfer to wait for.
             timeout_seconds: The maximum time to wait for completion in seconds. Defaults to 900 (15 minutes).
-            interval_seconds: The time between status checks in seconds. Defaults to 1.
+            interval_seconds: The time between the first status checks in seconds. Defaults to 1.
+            backoff_multiplier: The factor the time between status checks grows by after every
+                check. Defaults to 1.5.
+            max_interval_seconds: The maximum time between status checks in seconds. Defaults to 10.
+            jitter: The fraction by which each wait is randomly lengthened or shortened.
+                Defaults to 0.1.
 
         Returns:
             Transfer: The completed transfer object containing:
@@ -368,6 +451,9 @@ class EvmSmartAccount(BaseModel):
             transfer_id=transfer_id,
             timeout_seconds=timeout_seconds,
             interval_seconds=interval_seconds,
+            backoff_multiplier=backoff_multiplier,
+            max_interval_seconds=max_interval_seconds,
+            jitter=jitter,
         )
 
     def __str__(self) -> str:
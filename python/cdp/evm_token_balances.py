@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from cdp.openapi_client.models.list_evm_token_balances_network import ListEvmTokenBalancesNetwork
 
@@ -49,3 +49,13 @@ class ListTokenBalancesResult(BaseModel):
         description="The next page token to paginate through the token balances. "
         "If None, there are no more token balances to paginate through.",
     )
+
+
+class TokenBalanceScanError(BaseModel):
+    """A failure to list the token balances of one address on one network during a scan."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    address: str = Field(description="The address whose token balances couldn't be listed.")
+    network: str = Field(description="The network the token balances were listed on.")
+    error: Exception = Field(description="The error that stopped the listing.")
@@ -0,0 +1,203 @@
+import asyncio
+import heapq
+from collections.abc import Awaitable, Callable, Collection
+from typing import TypeVar
+
+from cdp.openapi_client.errors import ApiError
+from cdp.openapi_client.models.error_type import ErrorType
+
+T = TypeVar("T")
+
+# The API error types a transaction with a wrong nonce is rejected with
+NONCE_ERROR_TYPES = frozenset(
+    {ErrorType.INVALID_REQUEST.value, ErrorType.MALFORMED_TRANSACTION.value}
+)
+
+
+class _AccountNonces:
+    """The nonce state of an account on a network."""
+
+    __slots__ = ("generation", "lock", "next_nonce", "released")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.next_nonce: int | None = None
+        self.released: list[int] = []
+        self.generation = 0
+
+
+class NonceManager:
+    """Allocates EVM transaction nonces locally so that many sends can be pipelined.
+
+    Nonces start from the account's pending transaction count, fetched with
+    ``get_transaction_count`` on first use, and are then handed out locally without a round
+    trip. The nonce of a send that fails is released and handed out again first, so that it
+    doesn't leave a gap the following transactions would be stuck behind.
+
+    When the API rejects a send with one of the ``nonce_error_types``, the manager
+    resynchronizes from the pending transaction count. If the count no longer matches the
+    nonce, because another sender used it or an earlier nonce was never sent, the send is
+    retried with a new nonce. When a send fails without a response from the API, such as on
+    a timeout or a server error, the transaction may have been sent, so the nonce isn't
+    released: the pending transaction count is fetched again on the next allocation instead.
+    """
+
+    def __init__(
+        self,
+        get_transaction_count: Callable[[str, str], Awaitable[int]],
+        max_nonce_retries: int = 3,
+        nonce_error_types: Collection[str] = NONCE_ERROR_TYPES,
+    ) -> None:
+        """Initialize the nonce manager.
+
+        Args:
+            get_transaction_count (Callable[[str, str], Awaitable[int]]): A coroutine function
+                that returns the pending transaction count of an address on a network, for
+                example by calling ``eth_getTransactionCount`` with the ``pending`` block tag.
+            max_nonce_retries (int): How many times a send is retried with a new nonce after
+                the API rejects its nonce. Defaults to 3.
+            nonce_error_types (Collection[str]): The API error types that may mean the nonce
+                was wrong. Defaults to ``invalid_request`` and ``malformed_transaction``.
+
+        """
+        self.get_transaction_count = get_transaction_count
+        self.max_nonce_retries = max_nonce_retries
+        self.nonce_error_types = frozenset(nonce_error_types)
+        self._accounts: dict[tuple[str, str], _AccountNonces] = {}
+
+    async def send(self, address: str, network: str, send: Callable[[int], Awaitable[T]]) -> T:
+        """Send a transaction with a locally allocated nonce.
+
+        Args:
+            address (str): The address of the account sending the transaction.
+            network (str): The network.
+            send (Callable[[int], Awaitable[T]]): A coroutine function that sends the
+                transaction with the given nonce.
+
+        Returns:
+            T: The result of ``send``.
+
+        """
+        state = self._get_state(address, network)
+        attempt = 0
+        while True:
+            nonce, generation = await self._allocate(state, address, network)
+            try:
+                return await send(nonce)
+            except ApiError as e:
+                if e.error_type in self.nonce_error_types and attempt < self.max_nonce_retries:
+                    if await self._resync(state, address, network, generation, nonce):
+                        attempt += 1
+                        continue
+                    # The nonce was the expected one, so the error is about something else.
+                    raise
+                if _is_rejected(e):
+                    self._release(state, nonce, generation)
+                else:
+                    self._invalidate(state, generation)
+                raise
+            except BaseException:
+                self._invalidate(state, generation)
+                raise
+
+    async def allocate(self, address: str, network: str) -> int:
+        """Allocate the next nonce of an account.
+
+        Pass the nonce back to ``release`` if the transaction using it isn't sent.
+
+        Args:
+            address (str): The address of the account.
+            network (str): The network.
+
+        Returns:
+            int: The nonce.
+
+        """
+        nonce, _ = await self._allocate(self._get_state(address, network), address, network)
+        return nonce
+
+    def release(self, address: str, network: str, nonce: int) -> None:
+        """Release a nonce whose transaction wasn't sent, so that it is allocated again.
+
+        Args:
+            address (str): The address of the account.
+            network (str): The network.
+            nonce (int): The nonce.
+
+        """
+        state = self._get_state(address, network)
+        self._release(state, nonce, state.generation)
+
+    async def resync(self, address: str, network: str) -> None:
+        """Resynchronize the nonces of an account from its pending transaction count.
+
+        Args:
+            address (str): The address of the account.
+            network (str): The network.
+
+        """
+        state = self._get_state(address, network)
+        await self._resync(state, address, network, state.generation)
+
+    def reset(self) -> None:
+        """Forget the nonces of every account, so that they are fetched again on next use."""
+        self._accounts.clear()
+
+    def _get_state(self, address: str, network: str) -> _AccountNonces:
+        key = (address.lower(), network)
+        state = self._accounts.get(key)
+        if state is None:
+            state = self._accounts[key] = _AccountNonces()
+        return state
+
+    async def _allocate(self, state: _AccountNonces, address: str, network: str) -> tuple[int, int]:
+        async with state.lock:
+            if state.next_nonce is None:
+                state.next_nonce = await self.get_transaction_count(address, network)
+            if state.released:
+                nonce = heapq.heappop(state.released)
+            else:
+                nonce = state.next_nonce
+                state.next_nonce += 1
+            return nonce, state.generation
+
+    def _release(self, state: _AccountNonces, nonce: int, generation: int) -> None:
+        # Nonces allocated before a resync are meaningless after it.
+        if generation != state.generation or state.next_nonce is None:
+            return
+        if nonce == state.next_nonce - 1:
+            state.next_nonce -= 1
+        elif nonce < state.next_nonce:
+            heapq.heappush(state.released, nonce)
+
+    def _invalidate(self, state: _AccountNonces, generation: int) -> None:
+        # Whether the nonce was used is unknown, so neither reuse it nor skip it: fetch the
+        # pending transaction count again on the next allocation.
+        if generation != state.generation:
+            return
+        state.next_nonce = None
+        state.released = []
+        state.generation += 1
+
+    async def _resync(
+        self,
+        state: _AccountNonces,
+        address: str,
+        network: str,
+        generation: int,
+        nonce: int | None = None,
+    ) -> bool:
+        """Resynchronize the nonces, and return whether ``nonce`` may have been wrong."""
+        async with state.lock:
+            # Another send already resynchronized since this nonce was allocated.
+            if generation != state.generation:
+                return True
+            state.next_nonce = await self.get_transaction_count(address, network)
+            state.released = []
+            state.generation += 1
+            return nonce is None or state.next_nonce != nonce
+
+
+def _is_rejected(error: ApiError) -> bool:
+    """Whether the API answered that it didn't accept the request, rather than failing."""
+    return error.http_code is not None and 400 <= error.http_code < 500 and error.http_code != 408
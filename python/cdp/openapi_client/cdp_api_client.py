@@ -1,10 +1,13 @@
+import asyncio
+import functools
 import json
+import re
+import uuid
+from concurrent.futures import Executor, ThreadPoolExecutor
 from urllib.parse import urlparse
 
-from urllib3.util import Retry
-
 from cdp import __version__
-from cdp.auth.utils.http import GetAuthHeadersOptions, get_auth_headers
+from cdp.auth.utils.http import AuthContext, BearerTokenCache
 from cdp.openapi_client import rest
 from cdp.openapi_client.api_client import ApiClient
 from cdp.openapi_client.api_response import ApiResponse, T as ApiResponseT
@@ -12,6 +15,43 @@ from cdp.openapi_client.configuration import Configuration
 from cdp.openapi_client.constants import ERROR_DOCS_PAGE_URL, SDK_DEFAULT_SOURCE
 from cdp.openapi_client.errors import ApiError, is_openapi_error
 from cdp.openapi_client.exceptions import ApiException
+from cdp.transport import TransportRESTClientObject
+from cdp.transport.rate_limit import AdaptiveRateLimiter, RateLimiter
+from cdp.transport.retry import IDEMPOTENCY_KEY_HEADER, RetryMetrics, RetryPolicy
+from cdp.transport_types import RetryOptions, TransportOptions
+
+# The operations that accept an X-Idempotency-Key header, as (method, path pattern) pairs
+IDEMPOTENT_OPERATIONS = tuple(
+    (method, re.compile(f"{path}$"))
+    for method, path in (
+        ("POST", r"/v2/evm/accounts"),
+        ("POST", r"/v2/evm/accounts/import"),
+        ("PUT", r"/v2/evm/accounts/[^/]+"),
+        ("POST", r"/v2/evm/accounts/[^/]+/send/transaction"),
+        ("POST", r"/v2/evm/accounts/[^/]+/sign"),
+        ("POST", r"/v2/evm/accounts/[^/]+/sign/message"),
+        ("POST", r"/v2/evm/accounts/[^/]+/sign/transaction"),
+        ("POST", r"/v2/evm/accounts/[^/]+/sign/typed-data"),
+        ("POST", r"/v2/policy-engine/policies"),
+        ("PUT", r"/v2/policy-engine/policies/[^/]+"),
+        ("DELETE", r"/v2/policy-engine/policies/[^/]+"),
+        ("POST", r"/v2/solana/accounts"),
+        ("PUT", r"/v2/solana/accounts/[^/]+"),
+        ("POST", r"/v2/solana/accounts/[^/]+/sign/message"),
+        ("POST", r"/v2/solana/accounts/[^/]+/sign/transaction"),
+    )
+)
+
+
+def _copy_exception(error: BaseException) -> BaseException:
+    """Copy an exception without calling its constructor, which may take other arguments."""
+    copied = error.__class__.__new__(error.__class__, *error.args)
+    copied.args = error.args
+    copied.__dict__.update(getattr(error, "__dict__", {}))
+    copied.__cause__ = error.__cause__
+    copied.__context__ = error.__context__
+    copied.__suppress_context__ = error.__suppress_context__
+    return copied
 
 
 class CdpApiClient(ApiClient):
@@ -27,6 +67,12 @@ class CdpApiClient(ApiClient):
         max_network_retries: int = 3,
         source: str = SDK_DEFAULT_SOURCE,
         source_version: str = __version__,
+        cache_bearer_tokens: bool = False,
+        offload_signing: bool = True,
+        signing_executor: Executor | None = None,
+        transport_options: TransportOptions | None = None,
+        auto_idempotency_keys: bool = False,
+        coalesce_requests: bool = False,
     ):
         """Initialize the CDP API Client.
 
@@ -39,11 +85,40 @@ class CdpApiClient(ApiClient):
             max_network_retries (int): The maximum number of network retries. Defaults to 3.
             source (str): Specifies whether the sdk is being used directly or if it's an Agentkit extension.
             source_version (str): The version of the source package.
+            cache_bearer_tokens (bool): Whether to reuse bearer tokens for repeated requests to the
+                same endpoint until shortly before they expire. Defaults to False.
+            offload_signing (bool): Whether to sign auth tokens in an executor instead of on the
+                event loop. Defaults to True.
+            signing_executor (Executor, optional): The executor used to sign auth tokens. Defaults
+                to a thread pool owned by the client. A ProcessPoolExecutor may be passed to sign
+                outside of the GIL; bearer token caching is then bypassed.
+            transport_options (TransportOptions, optional): Connection pool, keep-alive, DNS
+                caching, timeout and retry settings for the HTTP transport.
+            auto_idempotency_keys (bool): Whether to generate an idempotency key for operations
+                that accept one when the caller didn't pass one, and to retry those operations
+                on connection errors and 502, 503 and 504 responses. Defaults to False.
+            coalesce_requests (bool): Whether concurrent identical GET requests share a single
+                in-flight request. Defaults to False.
 
         """
-        retry_strategy = self._get_retry_strategy(max_network_retries)
-        configuration = Configuration(host=base_path, retries=retry_strategy)
+        transport_options = transport_options or TransportOptions()
+        retry_strategy = self._get_retry_strategy(
+            max_network_retries, transport_options.retry_options, auto_idempotency_keys
+        )
+        configuration = Configuration(host=base_path)
         super().__init__(configuration)
+        self.rest_client = TransportRESTClientObject(
+            configuration,
+            retry_strategy,
+            self._get_rate_limiter(transport_options),
+            connection_pool_size=transport_options.connection_pool_size,
+            connections_per_host=transport_options.connections_per_host,
+            keepalive_timeout=transport_options.keepalive_timeout,
+            dns_cache_ttl=transport_options.dns_cache_ttl,
+            connect_timeout=transport_options.connect_timeout,
+            read_timeout=transport_options.read_timeout,
+            request_timeout=transport_options.request_timeout,
+        )
 
         self.api_key_id = api_key_id
         self.api_key_secret = api_key_secret
@@ -51,6 +126,20 @@ class CdpApiClient(ApiClient):
         self.source = source
         self.source_version = source_version
         self._debugging = debugging
+        self._auth_context = AuthContext(
+            api_key_id=api_key_id,
+            api_key_secret=api_key_secret,
+            wallet_secret=wallet_secret,
+            source=source,
+            source_version=source_version,
+            token_cache=BearerTokenCache() if cache_bearer_tokens else None,
+        )
+        self._auto_idempotency_keys = auto_idempotency_keys
+        self._coalesce_requests = coalesce_requests
+        self._in_flight: dict[tuple, asyncio.Task] = {}
+        self._offload_signing = offload_signing
+        self._signing_executor = signing_executor
+        self._owns_signing_executor = False
 
     async def call_api(
         self,
@@ -62,6 +151,82 @@ class CdpApiClient(ApiClient):
         _request_timeout=None,
     ) -> rest.RESTResponse:
         """Make the HTTP request (asynchronous)."""
+        if not self._coalesce_requests:
+            return await self._call_api(
+                method, url, header_params, body, post_params, _request_timeout
+            )
+
+        if method.upper() != "GET":
+            # Reads of the written resource that start after a write don't join requests
+            # started before it
+            self._invalidate_in_flight(url)
+            try:
+                return await self._call_api(
+                    method, url, header_params, body, post_params, _request_timeout
+                )
+            finally:
+                self._invalidate_in_flight(url)
+
+        key = (url, tuple(sorted((header_params or {}).items())))
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._call_api_and_read(url, header_params, _request_timeout)
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._remove_in_flight, key))
+
+        # A cancelled caller must not cancel the request shared with the other callers
+        await asyncio.wait({task})
+        error = task.exception()
+        if error is not None:
+            # Each caller gets its own exception, so one caller's traceback or changes
+            # don't show up in the others'
+            raise _copy_exception(error).with_traceback(error.__traceback__)
+        return task.result()
+
+    def _invalidate_in_flight(self, url: str) -> None:
+        """Forget the in-flight GET requests of the resources a write to a URL may change.
+
+        These are the requests to the written path, to the paths under it, and to its parent
+        paths, such as the list of the written resources.
+        """
+        path = self._get_path_segments(url)
+        for key in list(self._in_flight):
+            get_path = self._get_path_segments(key[0])
+            length = min(len(path), len(get_path))
+            if path[:length] == get_path[:length]:
+                del self._in_flight[key]
+
+    def _get_path_segments(self, url: str) -> tuple[str, ...]:
+        """Get the segments of the path of a URL."""
+        parsed_url = urlparse(url if url.startswith("http") else self.configuration.host + url)
+        return tuple(segment for segment in parsed_url.path.split("/") if segment)
+
+    async def _call_api_and_read(self, url, header_params, _request_timeout) -> rest.RESTResponse:
+        """Make a GET request and read its body so the response can be shared."""
+        response = await self._call_api("GET", url, header_params, None, None, _request_timeout)
+        await response.read()
+        return response
+
+    def _remove_in_flight(self, key: tuple, task: asyncio.Task) -> None:
+        """Forget a finished in-flight request."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the error as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> rest.RESTResponse:
+        """Sign and make the HTTP request, mapping errors to ApiError."""
         if self._debugging is True:
             print(f"CDP API REQUEST: {method} {url}")
 
@@ -70,32 +235,39 @@ class CdpApiClient(ApiClient):
             url if url.startswith("http") else self.configuration.host + url
         )
 
+        # Serialize the body once; the same JSON is sent and embedded in the Wallet Auth JWT
+        serialized_body = (
+            json.dumps(body, separators=(",", ":")) if isinstance(body, dict) else None
+        )
+
         # Get auth headers
-        auth_headers = get_auth_headers(
-            GetAuthHeadersOptions(
-                api_key_id=self.api_key_id,
-                api_key_secret=self.api_key_secret,
-                request_method=method,
-                request_host=parsed_url.netloc,
-                request_path=parsed_url.path,
-                request_body=body,
-                wallet_secret=self.wallet_secret,
-                source=self.source,
-                source_version=self.source_version,
-            )
+        auth_headers = await self._get_auth_headers(
+            method, parsed_url.netloc, parsed_url.path, body, serialized_body
         )
 
         # Merge headers
         request_headers = header_params or {}
         request_headers.update(auth_headers)
 
+        if (
+            self._auto_idempotency_keys
+            and not request_headers.get(IDEMPOTENCY_KEY_HEADER)
+            and self._accepts_idempotency_key(method, parsed_url.path)
+        ):
+            request_headers[IDEMPOTENCY_KEY_HEADER] = str(uuid.uuid4())
+
         if self._debugging is True:
             print(f"Request headers: {request_headers}")
 
         # Make request through parent class
         try:
             response = await super().call_api(
-                method, url, request_headers, body, post_params, _request_timeout
+                method,
+                url,
+                request_headers,
+                serialized_body if serialized_body is not None else body,
+                post_params,
+                _request_timeout,
             )
             return response
         except ApiException as e:
@@ -178,6 +350,94 @@ class CdpApiClient(ApiClient):
                 error_link=ERROR_DOCS_PAGE_URL,
             ) from None
 
+    async def warm_up(self, connections: int = 1) -> int:
+        """Open pooled keep-alive connections to the API host ahead of the first request.
+
+        Args:
+            connections (int): The number of connections to open. Defaults to 1. Capped at the
+                connection pool size.
+
+        Returns:
+            int: The number of connections that were opened.
+
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+
+        parsed_url = urlparse(self.configuration.host)
+        return await self.rest_client.warm_up(
+            f"{parsed_url.scheme}://{parsed_url.netloc}/", connections
+        )
+
+    async def close(self):
+        """Close the client and shut down the signing executor if the client owns it."""
+        await super().close()
+        if self._owns_signing_executor:
+            self._signing_executor.shutdown(wait=False)
+            self._signing_executor = None
+            self._owns_signing_executor = False
+
+    async def _get_auth_headers(
+        self,
+        method: str,
+        host: str,
+        path: str,
+        body: dict | None,
+        serialized_body: str | None = None,
+    ) -> dict[str, str]:
+        """Generate the auth headers for a request, signing in the executor if enabled.
+
+        Args:
+            method: The HTTP method.
+            host: The request host.
+            path: The request path.
+            body: The request body.
+            serialized_body: The JSON serialization of the body that will be sent.
+
+        Returns:
+            dict[str, str]: The authentication headers.
+
+        """
+        if not self._offload_signing:
+            return self._auth_context.get_headers(method, host, path, body, serialized_body)
+
+        # A process pool receives a copy of the auth context without the bearer token cache.
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_signing_executor(),
+            functools.partial(
+                self._auth_context.get_headers, method, host, path, body, serialized_body
+            ),
+        )
+
+    def _accepts_idempotency_key(self, method: str, path: str) -> bool:
+        """Check whether an operation accepts an idempotency key.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The request path.
+
+        Returns:
+            bool: True if the operation accepts an X-Idempotency-Key header.
+
+        """
+        method = method.upper()
+        return any(
+            method == operation_method and pattern.search(path)
+            for operation_method, pattern in IDEMPOTENT_OPERATIONS
+        )
+
+    def _get_signing_executor(self) -> Executor:
+        """Return the signing executor, creating the default thread pool on first use.
+
+        Returns:
+            Executor: The signing executor.
+
+        """
+        if self._signing_executor is None:
+            self._signing_executor = ThreadPoolExecutor(thread_name_prefix="cdp-signing")
+            self._owns_signing_executor = True
+        return self._signing_executor
+
     def response_deserialize(
         self,
         response_data: rest.RESTResponse,
@@ -219,19 +479,70 @@ class CdpApiClient(ApiClient):
                     error_link=f"{ERROR_DOCS_PAGE_URL}",
                 ) from None
 
-    def _get_retry_strategy(self, max_network_retries: int) -> Retry:
+    def _get_rate_limiter(self, transport_options: TransportOptions) -> RateLimiter | None:
+        """Build the client-side rate limiter from the transport options.
+
+        Args:
+            transport_options (TransportOptions): The transport options.
+
+        Returns:
+            RateLimiter | None: The rate limiter, or None if no rate limits are configured.
+
+        """
+        if not transport_options.rate_limits:
+            return None
+        return RateLimiter(
+            {
+                group: AdaptiveRateLimiter(**options.model_dump())
+                for group, options in transport_options.rate_limits.items()
+            }
+        )
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """Get the client-side rate limiter, to monitor the current rates.
+
+        Returns:
+            RateLimiter | None: The rate limiter, or None if no rate limits are configured.
+
+        """
+        return self.rest_client.rate_limiter
+
+    @property
+    def retry_metrics(self) -> RetryMetrics:
+        """Get the metrics on retries taken by the client.
+
+        Returns:
+            RetryMetrics: The retry metrics.
+
+        """
+        return self.rest_client.retries.metrics
+
+    def _get_retry_strategy(
+        self,
+        max_network_retries: int,
+        retry_options: RetryOptions,
+        retry_idempotent_requests: bool = False,
+    ) -> RetryPolicy:
         """Return the retry strategy for the CDP API Client.
 
         Args:
             max_network_retries (int): The maximum number of network retries.
+            retry_options (RetryOptions): The backoff and Retry-After settings.
+            retry_idempotent_requests (bool): Whether to retry requests with an idempotency key.
 
         Returns:
-            Retry: The retry strategy.
+            RetryPolicy: The retry strategy.
 
         """
-        return Retry(
-            total=max_network_retries,  # Number of total retries
-            status_forcelist=[500, 502, 503, 504],  # Retry on HTTP status code 500
-            allowed_methods=["GET"],  # Retry only on GET requests
-            backoff_factor=1,  # Exponential backoff factor
+        return RetryPolicy(
+            total=max_network_retries,
+            status_forcelist=retry_options.retry_statuses,
+            backoff_factor=retry_options.backoff_factor,
+            backoff_max=retry_options.backoff_max,
+            respect_retry_after=retry_options.respect_retry_after,
+            max_retry_after=retry_options.max_retry_after,
+            retry_budget=retry_options.retry_budget,
+            retry_on_connection_errors=retry_options.retry_on_connection_errors,
+            retry_idempotent_requests=retry_idempotent_requests,
         )
@@ -0,0 +1,39 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+async def paginate(
+    fetch_page: Callable[[str | None], Awaitable[T]],
+    page_token: str | None = None,
+) -> AsyncIterator[T]:
+    """Iterate over the pages of a list endpoint, following the next page tokens.
+
+    The next page is requested as soon as a page arrives, so it is fetched while the caller
+    processes the current one. If the caller stops early, the prefetch is cancelled.
+
+    Args:
+        fetch_page (Callable[[str | None], Awaitable[T]]): A coroutine function that fetches
+            the page for a page token. The page must have a ``next_page_token`` attribute.
+        page_token (str, optional): The token of the first page. Defaults to the first page.
+
+    Yields:
+        T: Each page, in order.
+
+    """
+    next_page: asyncio.Future[T] | None = asyncio.ensure_future(fetch_page(page_token))
+    try:
+        while next_page is not None:
+            page: Any = await next_page
+            next_page = None
+            if page.next_page_token:
+                next_page = asyncio.ensure_future(fetch_page(page.next_page_token))
+            yield page
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await next_page
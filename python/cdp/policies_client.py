@@ -1,6 +1,10 @@
+from collections.abc import AsyncIterator
+
+from cdp.account_cache import AccountCache
 from cdp.api_clients import ApiClients
 from cdp.openapi_client.models.create_policy_request import CreatePolicyRequest
 from cdp.openapi_client.models.update_policy_request import UpdatePolicyRequest
+from cdp.pagination import paginate
 from cdp.policies.types import (
     CreatePolicyOptions,
     ListPoliciesResult,
@@ -17,8 +21,9 @@ from cdp.policies.utils import (
 class PoliciesClient:
     """Client for managing policies."""
 
-    def __init__(self, api_clients: ApiClients):
+    def __init__(self, api_clients: ApiClients, account_cache: AccountCache | None = None):
         self.api_clients = api_clients
+        self.account_cache = account_cache
 
     async def create_policy(
         self,
@@ -79,6 +84,7 @@ class PoliciesClient:
             ),
             x_idempotency_key=idempotency_key,
         )
+        self._clear_account_cache()
         return Policy(
             id=openapi_policy.id,
             description=openapi_policy.description,
@@ -102,10 +108,12 @@ class PoliciesClient:
             idempotency_key (str | None, optional): The idempotency key. Defaults to None.
 
         """
-        return await self.api_clients.policies.delete_policy(
+        result = await self.api_clients.policies.delete_policy(
             policy_id=id,
             x_idempotency_key=idempotency_key,
         )
+        self._clear_account_cache()
+        return result
 
     async def get_policy_by_id(self, id: str) -> Policy:
         """Retrieve a policy by its unique identifier.
@@ -167,3 +175,31 @@ class PoliciesClient:
             ],
             next_page_token=openapi_policies.next_page_token,
         )
+
+    async def iter_policies(
+        self,
+        page_size: int | None = None,
+        scope: PolicyScope | None = None,
+    ) -> AsyncIterator[Policy]:
+        """Iterate over the policies belonging to the developer's CDP Project.
+
+        The next page is fetched while the current one is processed.
+
+        Args:
+            page_size (int | None, optional): The number of policies to fetch per page. Defaults to None.
+            scope (PolicyScope | None, optional): The scope of the policies to list. Defaults to None.
+
+        Yields:
+            Policy: Each policy.
+
+        """
+        async for page in paginate(
+            lambda page_token: self.list_policies(page_size, page_token, scope)
+        ):
+            for policy in page.policies:
+                yield policy
+
+    def _clear_account_cache(self) -> None:
+        """Clear the account cache, if enabled, since cached accounts reference policies."""
+        if self.account_cache is not None:
+            self.account_cache.clear()
@@ -0,0 +1,77 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def poll_until(
+    poll: Callable[[], Awaitable[T]],
+    is_done: Callable[[T], bool],
+    timeout_seconds: float,
+    interval_seconds: float,
+    backoff_multiplier: float = 1.0,
+    max_interval_seconds: float | None = None,
+    jitter: float = 0.0,
+    timeout_message: str = "Polling timed out",
+) -> T:
+    """Poll a resource until it reaches a final state, without blocking the event loop.
+
+    The interval between polls starts at ``interval_seconds`` and is multiplied by
+    ``backoff_multiplier`` after every poll, up to ``max_interval_seconds``. The wait is
+    never longer than the time left before the timeout, so the last poll happens at the
+    deadline. Cancelling the awaiting task stops polling immediately.
+
+    Args:
+        poll (Callable[[], Awaitable[T]]): A coroutine function that fetches the resource.
+        is_done (Callable[[T], bool]): Whether the fetched resource is in a final state.
+        timeout_seconds (float): Maximum time to wait in seconds.
+        interval_seconds (float): Time before the second poll in seconds.
+        backoff_multiplier (float, optional): The factor the interval grows by after every
+            poll. Defaults to 1.0, which polls at a fixed interval.
+        max_interval_seconds (float, optional): The maximum time between polls in seconds.
+            Defaults to no maximum.
+        jitter (float, optional): The fraction by which each interval is randomly lengthened
+            or shortened, so that many waiters don't poll in lockstep. Defaults to 0.0.
+        timeout_message (str, optional): The message of the TimeoutError.
+
+    Returns:
+        T: The resource in its final state.
+
+    Raises:
+        TimeoutError: If the resource doesn't reach a final state within the timeout.
+        ValueError: If an argument is out of range.
+
+    """
+    if interval_seconds < 0:
+        raise ValueError("interval_seconds must not be negative")
+    if backoff_multiplier < 1:
+        raise ValueError("backoff_multiplier must be at least 1")
+    if not 0 <= jitter < 1:
+        raise ValueError("jitter must be between 0 and 1")
+
+    deadline = time.monotonic() + timeout_seconds
+    interval = interval_seconds
+    if max_interval_seconds is not None:
+        interval = min(interval, max_interval_seconds)
+
+    result = await poll()
+    while not is_done(result):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(timeout_message)
+
+        delay = interval
+        if jitter:
+            delay *= random.uniform(1 - jitter, 1 + jitter)
+        await asyncio.sleep(min(delay, remaining))
+
+        interval *= backoff_multiplier
+        if max_interval_seconds is not None:
+            interval = min(interval, max_interval_seconds)
+
+        result = await poll()
+
+    return result
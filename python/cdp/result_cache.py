@@ -0,0 +1,284 @@
+import asyncio
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from cdp.constants import TRANSFER_FINAL_STATUSES, USER_OPERATION_FINAL_STATUSES
+from cdp.openapi_client.api.evm_smart_accounts_api import EVMSmartAccountsApi
+from cdp.openapi_client.api.payments_alpha_api import PaymentsAlphaApi
+from cdp.openapi_client.models.evm_user_operation import EvmUserOperation
+from cdp.openapi_client.models.transfer import Transfer
+
+
+class ResultCache(ABC):
+    """A cache for API results that never change again.
+
+    User operations that are ``complete`` or ``failed`` and payment transfers that are
+    ``completed`` or ``failed`` are final, so once the SDK has fetched them it stores them
+    here and serves repeat lookups without a network request. Entries are never expired.
+
+    Values are the JSON representation of the result, so a backend only has to store
+    strings by key. Subclass this to plug in another store. The SDK looks results up with
+    ``aget`` and ``aset``, which call ``get`` and ``set`` directly; a store that blocks on I/O
+    should override them so that it doesn't stall the event loop.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Get a cached result.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str | None: The JSON representation of the result, or None if it isn't cached.
+
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Cache a result.
+
+        Args:
+            key (str): The cache key.
+            value (str): The JSON representation of the result.
+
+        """
+
+    async def aget(self, key: str) -> str | None:
+        """Get a cached result from a coroutine.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str | None: The JSON representation of the result, or None if it isn't cached.
+
+        """
+        return self.get(key)
+
+    async def aset(self, key: str, value: str) -> None:
+        """Cache a result from a coroutine.
+
+        Args:
+            key (str): The cache key.
+            value (str): The JSON representation of the result.
+
+        """
+        self.set(key, value)
+
+    def close(self) -> None:
+        """Release any resources held by the cache."""
+        return None
+
+
+class InMemoryResultCache(ResultCache):
+    """A result cache that keeps results in process memory."""
+
+    def __init__(self, max_size: int | None = None) -> None:
+        """Initialize the result cache.
+
+        Args:
+            max_size (int, optional): The maximum number of results. The least recently used
+                results are evicted first. Defaults to no limit.
+
+        """
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.max_size = max_size
+        self._results: OrderedDict[str, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._results)
+
+    def get(self, key: str) -> str | None:
+        """Get a cached result.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str | None: The JSON representation of the result, or None if it isn't cached.
+
+        """
+        value = self._results.get(key)
+        if value is not None:
+            self._results.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Cache a result.
+
+        Args:
+            key (str): The cache key.
+            value (str): The JSON representation of the result.
+
+        """
+        self._results[key] = value
+        self._results.move_to_end(key)
+        if self.max_size is not None:
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+
+
+class SqliteResultCache(ResultCache):
+    """A result cache that persists results in a SQLite database.
+
+    Results survive restarts, so audit and reconciliation jobs can share them across runs.
+    SQLite calls block, so lookups made by the SDK run in a worker thread.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the result cache.
+
+        Args:
+            path (str): The path of the database file, created if it doesn't exist. Use
+                ``":memory:"`` for a database that lives only as long as the cache.
+
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def get(self, key: str) -> str | None:
+        """Get a cached result.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str | None: The JSON representation of the result, or None if it isn't cached.
+
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def set(self, key: str, value: str) -> None:
+        """Cache a result.
+
+        Args:
+            key (str): The cache key.
+            value (str): The JSON representation of the result.
+
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    async def aget(self, key: str) -> str | None:
+        """Get a cached result in a worker thread.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str | None: The JSON representation of the result, or None if it isn't cached.
+
+        """
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: str) -> None:
+        """Cache a result in a worker thread.
+
+        Args:
+            key (str): The cache key.
+            value (str): The JSON representation of the result.
+
+        """
+        await asyncio.to_thread(self.set, key, value)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class CachedEVMSmartAccountsApi(EVMSmartAccountsApi):
+    """An EVMSmartAccountsApi that serves finished user operations from a result cache."""
+
+    def __init__(self, api_client, result_cache: ResultCache) -> None:
+        """Initialize the API client.
+
+        Args:
+            api_client: The CDP API client.
+            result_cache (ResultCache): The cache for finished user operations.
+
+        """
+        super().__init__(api_client=api_client)
+        self.result_cache = result_cache
+
+    async def get_user_operation(
+        self, address: str, user_op_hash: str, **kwargs
+    ) -> EvmUserOperation:
+        """Get a user operation, from the result cache if it has finished.
+
+        Args:
+            address (str): The address of the smart account the user operation belongs to.
+            user_op_hash (str): The hash of the user operation.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            EvmUserOperation: The user operation.
+
+        """
+        key = f"evm_user_operation:{address.lower()}:{user_op_hash.lower()}"
+        cached = await self.result_cache.aget(key)
+        if cached is not None:
+            return EvmUserOperation.from_json(cached)
+
+        user_operation = await super().get_user_operation(address, user_op_hash, **kwargs)
+        if user_operation.status in USER_OPERATION_FINAL_STATUSES:
+            await self.result_cache.aset(key, user_operation.to_json())
+        return user_operation
+
+
+class CachedPaymentsAlphaApi(PaymentsAlphaApi):
+    """A PaymentsAlphaApi that serves finished transfers from a result cache."""
+
+    def __init__(self, api_client, result_cache: ResultCache) -> None:
+        """Initialize the API client.
+
+        Args:
+            api_client: The CDP API client.
+            result_cache (ResultCache): The cache for finished transfers.
+
+        """
+        super().__init__(api_client=api_client)
+        self.result_cache = result_cache
+
+    async def get_payment_transfer(self, transfer_id: str, **kwargs) -> Transfer:
+        """Get a payment transfer, from the result cache if it has finished.
+
+        Args:
+            transfer_id (str): The id of the transfer.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            Transfer: The transfer.
+
+        """
+        key = f"payment_transfer:{transfer_id}"
+        cached = await self.result_cache.aget(key)
+        if cached is not None:
+            return Transfer.from_json(cached)
+
+        transfer = await super().get_payment_transfer(transfer_id, **kwargs)
+        if transfer.status in TRANSFER_FINAL_STATUSES:
+            await self.result_cache.aset(key, transfer.to_json())
+        return transfer
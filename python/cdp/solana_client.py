@@ -1,8 +1,15 @@
+import asyncio
+import uuid
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+from cdp.account_cache import AccountCache
 from cdp.actions.solana.request_faucet import request_faucet
 from cdp.actions.solana.sign_message import sign_message
 from cdp.actions.solana.sign_transaction import sign_transaction
 from cdp.analytics import wrap_class_with_error_tracking
 from cdp.api_clients import ApiClients
+from cdp.bulk import BulkOperation, get_or_create_by_name
 from cdp.openapi_client.errors import ApiError
 from cdp.openapi_client.models.create_solana_account_request import (
     CreateSolanaAccountRequest,
@@ -17,15 +24,19 @@ from cdp.openapi_client.models.sign_solana_transaction200_response import (
     SignSolanaTransaction200Response as SignSolanaTransactionResponse,
 )
 from cdp.openapi_client.models.update_solana_account_request import UpdateSolanaAccountRequest
+from cdp.pagination import paginate
 from cdp.solana_account import ListSolanaAccountsResponse, SolanaAccount
 from cdp.update_account_types import UpdateAccountOptions
+from cdp.utils import derive_idempotency_key
 
 
 class SolanaClient:
     """The SolanaClient class is responsible for CDP API calls for Solana."""
 
-    def __init__(self, api_clients: ApiClients):
+    def __init__(self, api_clients: ApiClients, account_cache: AccountCache | None = None):
         self.api_clients = api_clients
+        self.account_cache = account_cache
+        self._get_or_create_in_flight: dict[str, asyncio.Future] = {}
         wrap_class_with_error_tracking(SolanaAccount)
 
     async def create_account(
@@ -52,12 +63,71 @@ class SolanaClient:
                 account_policy=account_policy,
             ),
         )
+        self._cache_account(response)
 
         return SolanaAccount(
             solana_account_model=response,
             api_clients=self.api_clients,
         )
 
+    def create_accounts(
+        self,
+        names: Iterable[str] | None = None,
+        count: int | None = None,
+        account_policy: str | None = None,
+        concurrency: int = 10,
+        idempotency_namespace: str | None = None,
+    ) -> BulkOperation[str | None, SolanaAccount]:
+        """Create many Solana accounts concurrently.
+
+        Pass either the names of the accounts or the number of unnamed accounts to create.
+        Each account is created with an idempotency key derived from its name, or its
+        position for unnamed accounts, so running the same creation again returns the same
+        accounts instead of creating new ones. Unnamed accounts are keyed by the
+        ``idempotency_namespace`` too, which is random for each call unless given, so separate
+        batches create distinct accounts. Pass the same namespace to resume a batch of unnamed
+        accounts, for example after a crash.
+
+        Iterate over the returned bulk operation to receive ``(index, account)`` tuples as the
+        accounts are created. Accounts that fail to be created are recorded in its ``errors``.
+
+        Args:
+            names (Iterable[str], optional): The names of the accounts.
+            count (int, optional): The number of unnamed accounts.
+            account_policy (str, optional): The ID of the account-level policy to apply to the
+                accounts. Defaults to None.
+            concurrency (int, optional): The maximum number of accounts created at once. It is
+                lowered automatically when the API responds with 429. Defaults to 10.
+            idempotency_namespace (str, optional): A value that distinguishes this batch from
+                others in the idempotency keys. Defaults to None, which is a random value for
+                each batch of unnamed accounts.
+
+        Returns:
+            BulkOperation[str | None, SolanaAccount]: The bulk operation.
+
+        """
+        if (names is None) == (count is None):
+            raise ValueError("Either names or count must be provided")
+
+        items = list(names) if names is not None else [None] * count
+        if names is None and idempotency_namespace is None:
+            idempotency_namespace = str(uuid.uuid4())
+
+        async def create(index: int, name: str | None) -> SolanaAccount:
+            return await self.create_account(
+                name=name,
+                account_policy=account_policy,
+                idempotency_key=derive_idempotency_key(
+                    "solana",
+                    "create_account",
+                    idempotency_namespace,
+                    name if name is not None else index,
+                    account_policy,
+                ),
+            )
+
+        return BulkOperation(items, create, concurrency)
+
     async def get_account(
         self, address: str | None = None, name: str | None = None
     ) -> SolanaAccount:
@@ -72,9 +142,15 @@ class SolanaClient:
 
         """
         if address:
-            response = await self.api_clients.solana_accounts.get_solana_account(address)
+            response = self._get_cached(_account_key(address))
+            if response is None:
+                response = await self.api_clients.solana_accounts.get_solana_account(address)
+                self._cache_account(response)
         elif name:
-            response = await self.api_clients.solana_accounts.get_solana_account_by_name(name)
+            response = self._get_cached(_account_name_key(name))
+            if response is None:
+                response = await self.api_clients.solana_accounts.get_solana_account_by_name(name)
+                self._cache_account(response)
         else:
             raise ValueError("Either address or name must be provided")
 
@@ -111,6 +187,75 @@ class SolanaClient:
                     raise e
             raise e
 
+    async def get_or_create_accounts(
+        self,
+        names: Iterable[str],
+        concurrency: int = 10,
+        page_size: int | None = None,
+        max_lookups: int = 10,
+    ) -> dict[str, SolanaAccount]:
+        """Get many Solana accounts by name, creating the ones that don't exist.
+
+        Names found in the account cache are resolved without a request. If at most
+        ``max_lookups`` names remain, each is looked up by name, concurrently. Otherwise they are
+        looked up by paging through the existing accounts until all are found. Only the accounts
+        still missing are created, concurrently. Duplicate names, including names another call is already
+        resolving, are resolved once.
+
+        Args:
+            names (Iterable[str]): The names of the accounts.
+            concurrency (int, optional): The maximum number of accounts looked up or created
+                at once. Defaults to 10.
+            page_size (int, optional): The number of accounts to fetch per page while looking
+                up existing accounts. Defaults to None.
+            max_lookups (int, optional): The maximum number of names looked up one by one
+                instead of paging through the existing accounts. Defaults to 10.
+
+        Returns:
+            dict[str, SolanaAccount]: The accounts by name.
+
+        """
+
+        def get_cached(name: str) -> SolanaAccount | None:
+            model = self._get_cached(_account_name_key(name))
+            return (
+                None
+                if model is None
+                else SolanaAccount(solana_account_model=model, api_clients=self.api_clients)
+            )
+
+        async def get_by_name(name: str) -> SolanaAccount | None:
+            try:
+                return await self.get_account(name=name)
+            except ApiError as e:
+                if e.http_code == 404:
+                    return None
+                raise e
+
+        async def create(name: str) -> SolanaAccount:
+            try:
+                return await self.create_account(
+                    name=name,
+                    idempotency_key=derive_idempotency_key(
+                        "solana", "create_account", None, name, None
+                    ),
+                )
+            except ApiError as e:
+                if e.http_code == 409:
+                    return await self.get_account(name=name)
+                raise e
+
+        return await get_or_create_by_name(
+            names,
+            self._get_or_create_in_flight,
+            get_cached,
+            lambda page_token: self.list_accounts(page_size, page_token),
+            create,
+            concurrency,
+            get_by_name,
+            max_lookups,
+        )
+
     async def list_accounts(
         self,
         page_size: int | None = None,
@@ -143,6 +288,20 @@ class SolanaClient:
             next_page_token=response.next_page_token,
         )
 
+    async def iter_accounts(self, page_size: int | None = None) -> AsyncIterator[SolanaAccount]:
+        """Iterate over all Solana accounts, fetching the next page while the current one is processed.
+
+        Args:
+            page_size (int, optional): The number of accounts to fetch per page. Defaults to None.
+
+        Yields:
+            SolanaAccount: Each Solana account.
+
+        """
+        async for page in paginate(lambda page_token: self.list_accounts(page_size, page_token)):
+            for account in page.accounts:
+                yield account
+
     async def sign_message(
         self, address: str, message: str, idempotency_key: str | None = None
     ) -> SignSolanaMessageResponse:
@@ -164,6 +323,46 @@ class SolanaClient:
             idempotency_key,
         )
 
+    def sign_message_many(
+        self,
+        address: str,
+        messages: Iterable[str],
+        concurrency: int = 10,
+        idempotency_namespace: str | None = None,
+    ) -> BulkOperation[str, SignSolanaMessageResponse]:
+        """Sign many Solana messages concurrently.
+
+        Each message is signed with an idempotency key derived from the address, its position
+        and the message. Call ``collect`` on the returned bulk operation to get the responses
+        in the order of the messages. Messages that fail to be signed are recorded in its
+        ``errors``.
+
+        Args:
+            address (str): The address of the account.
+            messages (Iterable[str]): The messages to sign.
+            concurrency (int, optional): The maximum number of messages signed at once. It is
+                lowered automatically when the API responds with 429. Defaults to 10.
+            idempotency_namespace (str, optional): A value mixed into the idempotency keys, to
+                keep this batch from being deduplicated against earlier ones. Defaults to None,
+                in which case a message is keyed by the address, its position and its contents
+                only, and resigning it in another batch returns the earlier signature.
+
+        Returns:
+            BulkOperation[str, SignSolanaMessageResponse]: The bulk operation.
+
+        """
+
+        async def sign(index: int, message: str) -> SignSolanaMessageResponse:
+            return await self.sign_message(
+                address,
+                message,
+                derive_idempotency_key(
+                    "solana", "sign_message", idempotency_namespace, address, index, message
+                ),
+            )
+
+        return BulkOperation(messages, sign, concurrency)
+
     async def sign_transaction(
         self, address: str, transaction: str, idempotency_key: str | None = None
     ) -> SignSolanaTransactionResponse:
@@ -227,8 +426,32 @@ class SolanaClient:
             ),
             x_idempotency_key=idempotency_key,
         )
+        self._cache_account(response)
 
         return SolanaAccount(
             solana_account_model=response,
             api_clients=self.api_clients,
         )
+
+    def _get_cached(self, key: tuple) -> Any | None:
+        """Get an account model from the account cache, if enabled."""
+        if self.account_cache is None:
+            return None
+        return self.account_cache.get(key)
+
+    def _cache_account(self, solana_account: Any) -> None:
+        """Cache a Solana account model under its address and name, if the cache is enabled."""
+        if self.account_cache is None:
+            return
+        keys = [_account_key(solana_account.address)]
+        if solana_account.name:
+            keys.append(_account_name_key(solana_account.name))
+        self.account_cache.set(keys, solana_account)
+
+
+def _account_key(address: str) -> tuple:
+    return ("solana", "address", address)
+
+
+def _account_name_key(name: str) -> tuple:
+    return ("solana", "name", name)
@@ -7,13 +7,21 @@ from cdp.openapi_client.exceptions import ApiException
 from cdp.openapi_client.models.transfer import Transfer
 
 
+@pytest.fixture
+def mock_sleep():
+    """Patch the asyncio sleep used while polling."""
+    with patch("cdp.polling.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        yield mock_sleep
+
+
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.fund.wait_for_fund_operation_receipt.time", create=True)
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_fund_operation_receipt_success_immediate(mock_api_clients, mock_time):
+async def test_wait_for_fund_operation_receipt_success_immediate(
+    mock_api_clients, mock_time, mock_sleep
+):
     """Test successful completion of a fund operation that is already complete."""
-    mock_time.time.return_value = 1000
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.return_value = 1000
 
     mock_transfer = MagicMock(spec=Transfer)
     mock_transfer.id = "transfer_123"
@@ -26,20 +34,23 @@ async def test_wait_for_fund_operation_receipt_success_immediate(mock_api_client
         transfer_id=mock_transfer.id,
         timeout_seconds=300,
         interval_seconds=1,
+        backoff_multiplier=1,
+        jitter=0,
     )
 
     assert result == mock_transfer
     mock_api_clients.payments.get_payment_transfer.assert_called_once_with(mock_transfer.id)
-    mock_time.sleep.assert_not_called()
+    mock_sleep.assert_not_called()
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.fund.wait_for_fund_operation_receipt.time", create=True)
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_fund_operation_receipt_success_after_poll(mock_api_clients, mock_time):
+async def test_wait_for_fund_operation_receipt_success_after_poll(
+    mock_api_clients, mock_time, mock_sleep
+):
     """Test successful completion of a fund operation after polling."""
-    mock_time.time.side_effect = [1000, 1001, 1002]
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.side_effect = [1000, 1001, 1002]
 
     mock_initial_transfer = MagicMock(spec=Transfer)
     mock_initial_transfer.id = "transfer_123"
@@ -58,20 +69,23 @@ async def test_wait_for_fund_operation_receipt_success_after_poll(mock_api_clien
         transfer_id=mock_initial_transfer.id,
         timeout_seconds=300,
         interval_seconds=1,
+        backoff_multiplier=1,
+        jitter=0,
     )
 
     assert result == mock_updated_transfer
     assert mock_api_clients.payments.get_payment_transfer.call_count == 2
-    mock_time.sleep.assert_called_once_with(1)
+    mock_sleep.assert_called_once_with(1)
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.fund.wait_for_fund_operation_receipt.time", create=True)
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_fund_operation_receipt_failed_status(mock_api_clients, mock_time):
+async def test_wait_for_fund_operation_receipt_failed_status(
+    mock_api_clients, mock_time, mock_sleep
+):
     """Test handling of a fund operation that completes with 'failed' status."""
-    mock_time.time.side_effect = [1000, 1001, 1002]
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.side_effect = [1000, 1001, 1002]
 
     mock_initial_transfer = MagicMock(spec=Transfer)
     mock_initial_transfer.id = "transfer_123"
@@ -90,17 +104,19 @@ async def test_wait_for_fund_operation_receipt_failed_status(mock_api_clients, m
         transfer_id=mock_initial_transfer.id,
         timeout_seconds=300,
         interval_seconds=1,
+        backoff_multiplier=1,
+        jitter=0,
     )
 
     assert result == mock_updated_transfer
     assert mock_api_clients.payments.get_payment_transfer.call_count == 2
-    mock_time.sleep.assert_called_once_with(1)
+    mock_sleep.assert_called_once_with(1)
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.fund.wait_for_fund_operation_receipt.time", create=True)
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_fund_operation_receipt_timeout(mock_api_clients, mock_time):
+async def test_wait_for_fund_operation_receipt_timeout(mock_api_clients, mock_time, mock_sleep):
     """Test timeout for a fund operation that never completes."""
     start_time = 1000
 
@@ -119,8 +135,7 @@ async def test_wait_for_fund_operation_receipt_timeout(mock_api_clients, mock_ti
         start_time + 300.5,
     ]
 
-    mock_time.time.side_effect = time_values
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.side_effect = time_values
 
     mock_pending_transfer = MagicMock(spec=Transfer)
     mock_pending_transfer.id = "transfer_123"
@@ -134,19 +149,20 @@ async def test_wait_for_fund_operation_receipt_timeout(mock_api_clients, mock_ti
             transfer_id=mock_pending_transfer.id,
             timeout_seconds=300,
             interval_seconds=1,
+            backoff_multiplier=1,
+            jitter=0,
         )
 
     assert mock_api_clients.payments.get_payment_transfer.call_count > 1
-    assert mock_time.sleep.call_count > 1
+    assert mock_sleep.call_count > 1
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.fund.wait_for_fund_operation_receipt.time", create=True)
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_fund_operation_receipt_api_error(mock_api_clients, mock_time):
+async def test_wait_for_fund_operation_receipt_api_error(mock_api_clients, mock_time, mock_sleep):
     """Test handling of API errors during polling."""
-    mock_time.time.side_effect = [1000, 1001]
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.side_effect = [1000, 1001]
 
     mock_initial_transfer = MagicMock(spec=Transfer)
     mock_initial_transfer.id = "transfer_123"
@@ -162,6 +178,8 @@ async def test_wait_for_fund_operation_receipt_api_error(mock_api_clients, mock_
             transfer_id=mock_initial_transfer.id,
             timeout_seconds=300,
             interval_seconds=1,
+            backoff_multiplier=1,
+            jitter=0,
         )
 
     assert exc_info.value.status == 500
@@ -171,21 +189,20 @@ async def test_wait_for_fund_operation_receipt_api_error(mock_api_clients, mock_
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.fund.wait_for_fund_operation_receipt.time", create=True)
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
 async def test_wait_for_fund_operation_receipt_custom_timeout_and_interval(
-    mock_api_clients, mock_time
+    mock_api_clients, mock_time, mock_sleep
 ):
     """Test using custom timeout and interval values."""
     start_time = 1000
-    mock_time.time.side_effect = [
+    mock_time.monotonic.side_effect = [
         start_time,
         start_time + 1,
         start_time + 2,
         start_time + 3,
         start_time + 11,
     ]
-    mock_time.sleep = MagicMock()
 
     mock_pending_transfer = MagicMock(spec=Transfer)
     mock_pending_transfer.id = "transfer_123"
@@ -199,18 +216,21 @@ async def test_wait_for_fund_operation_receipt_custom_timeout_and_interval(
             transfer_id=mock_pending_transfer.id,
             timeout_seconds=10,
             interval_seconds=1.0,
+            backoff_multiplier=1,
+            jitter=0,
         )
 
-    mock_time.sleep.assert_called_with(1.0)
+    mock_sleep.assert_called_with(1.0)
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.fund.wait_for_fund_operation_receipt.time", create=True)
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_fund_operation_receipt_multiple_status_changes(mock_api_clients, mock_time):
+async def test_wait_for_fund_operation_receipt_multiple_status_changes(
+    mock_api_clients, mock_time, mock_sleep
+):
     """Test handling of a fund operation that goes through multiple status changes."""
-    mock_time.time.side_effect = [1000, 1001, 1002, 1003]
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.side_effect = [1000, 1001, 1002, 1003]
 
     mock_initial_transfer = MagicMock(spec=Transfer)
     mock_initial_transfer.id = "transfer_123"
@@ -233,20 +253,23 @@ async def test_wait_for_fund_operation_receipt_multiple_status_changes(mock_api_
         transfer_id=mock_initial_transfer.id,
         timeout_seconds=300,
         interval_seconds=1,
+        backoff_multiplier=1,
+        jitter=0,
     )
 
     assert result == mock_complete_transfer
     assert mock_api_clients.payments.get_payment_transfer.call_count == 3
-    assert mock_time.sleep.call_count == 2
+    assert mock_sleep.call_count == 2
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.fund.wait_for_fund_operation_receipt.time", create=True)
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_fund_operation_receipt_invalid_transfer_id(mock_api_clients, mock_time):
+async def test_wait_for_fund_operation_receipt_invalid_transfer_id(
+    mock_api_clients, mock_time, mock_sleep
+):
     """Test handling of an API error when transfer_id is invalid."""
-    mock_time.time.return_value = 1000
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.return_value = 1000
 
     mock_transfer = MagicMock(spec=Transfer)
     mock_transfer.id = "invalid-transfer-id"
@@ -262,6 +285,8 @@ async def test_wait_for_fund_operation_receipt_invalid_transfer_id(mock_api_clie
             transfer_id=mock_transfer.id,
             timeout_seconds=300,
             interval_seconds=1,
+            backoff_multiplier=1,
+            jitter=0,
         )
 
     assert exc_info.value.status == 404
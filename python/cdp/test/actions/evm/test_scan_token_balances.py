@@ -0,0 +1,120 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from cdp.actions.evm.scan_token_balances import TokenBalanceScan
+from cdp.evm_client import EvmClient
+from cdp.openapi_client.exceptions import ApiException
+
+ADDRESSES = [
+    "0x1234567890123456789012345678901234567890",
+    "0x2345678901234567890123456789012345678901",
+    "0x3456789012345678901234567890123456789012",
+]
+
+
+@pytest.mark.asyncio
+async def test_scan_yields_balances_for_every_address_and_network(
+    evm_token_balances_model_factory,
+):
+    """Test that the scan lists every address on every network, following pagination."""
+    pages = {}
+
+    async def list_evm_token_balances(address, network, page_size, page_token):
+        pages.setdefault((address, network), []).append(page_token)
+        next_page_token = "next-page-token" if page_token is None else None
+        return evm_token_balances_model_factory(next_page_token=next_page_token)
+
+    api = MagicMock()
+    api.list_evm_token_balances = AsyncMock(side_effect=list_evm_token_balances)
+
+    scan = TokenBalanceScan(api, ADDRESSES, ["base", "base-sepolia"], concurrency=2, page_size=5)
+    results = [result async for result in scan]
+
+    assert len(results) == 12
+    assert {(address, network) for address, network, _ in results} == set(pages)
+    assert all(tokens == [None, "next-page-token"] for tokens in pages.values())
+    assert all(balance.token.symbol == "TEST" for _, _, balance in results)
+    assert scan.errors == []
+
+
+@pytest.mark.asyncio
+async def test_scan_bounds_concurrency(evm_token_balances_model_factory):
+    """Test that no more than the given number of listings are in flight at once."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def list_evm_token_balances(address, network, page_size, page_token):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return evm_token_balances_model_factory(next_page_token=None)
+
+    api = MagicMock()
+    api.list_evm_token_balances = AsyncMock(side_effect=list_evm_token_balances)
+
+    results = [result async for result in TokenBalanceScan(api, ADDRESSES, ["base"], 2)]
+
+    assert len(results) == 3
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_scan_reports_partial_failures(evm_token_balances_model_factory):
+    """Test that a failed listing is recorded without stopping the scan."""
+
+    async def list_evm_token_balances(address, network, page_size, page_token):
+        if address == ADDRESSES[1]:
+            raise ApiException(status=500, reason="Internal Server Error")
+        return evm_token_balances_model_factory(next_page_token=None)
+
+    api = MagicMock()
+    api.list_evm_token_balances = AsyncMock(side_effect=list_evm_token_balances)
+
+    scan = TokenBalanceScan(api, ADDRESSES, ["base"])
+    results = [result async for result in scan]
+
+    assert {address for address, _, _ in results} == {ADDRESSES[0], ADDRESSES[2]}
+    assert len(scan.errors) == 1
+    assert scan.errors[0].address == ADDRESSES[1]
+    assert scan.errors[0].network == "base"
+    assert isinstance(scan.errors[0].error, ApiException)
+
+
+@pytest.mark.asyncio
+async def test_scan_stops_workers_when_closed_early(evm_token_balances_model_factory):
+    """Test that stopping the iteration early cancels the remaining listings."""
+    api = MagicMock()
+    api.list_evm_token_balances = AsyncMock(
+        return_value=evm_token_balances_model_factory(next_page_token=None)
+    )
+
+    scan = TokenBalanceScan(api, ADDRESSES, ["base", "base-sepolia"], concurrency=1)
+    iterator = scan.__aiter__()
+    await iterator.__anext__()
+    await iterator.aclose()
+
+    assert api.list_evm_token_balances.call_count < 6
+
+
+def test_scan_rejects_invalid_concurrency():
+    """Test that the concurrency must be positive."""
+    with pytest.raises(ValueError, match="concurrency must be positive"):
+        TokenBalanceScan(MagicMock(), ADDRESSES, ["base"], concurrency=0)
+
+
+def test_evm_client_scan_token_balances():
+    """Test that the EVM client creates a scan over its token balances API."""
+    mock_api_clients = MagicMock()
+    client = EvmClient(api_clients=mock_api_clients)
+
+    scan = client.scan_token_balances(ADDRESSES, ["base"], concurrency=5, page_size=20)
+
+    assert scan.evm_token_balances is mock_api_clients.evm_token_balances
+    assert scan.addresses == ADDRESSES
+    assert scan.networks == ["base"]
+    assert scan.concurrency == 5
+    assert scan.page_size == 20
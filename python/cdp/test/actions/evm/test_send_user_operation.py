@@ -19,11 +19,11 @@ from cdp.openapi_client.models.send_user_operation_request import (
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.send_user_operation.Web3")
+@patch("cdp.actions.evm.send_user_operation.encode_function_call")
 @patch("cdp.actions.evm.send_user_operation.ensure_awaitable")
 @patch("cdp.cdp_client.ApiClients")
 async def test_send_user_operation_function_call(
-    mock_api_clients, mock_ensure_awaitable, mock_web3
+    mock_api_clients, mock_ensure_awaitable, mock_encode_function_call
 ):
     """Test sending a user operation with a FunctionCall."""
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
@@ -31,12 +31,7 @@ async def test_send_user_operation_function_call(
     mock_smart_account.owners = [mock_owner]
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
 
-    mock_contract = MagicMock()
-    mock_contract.encode_abi.return_value = "0x1234abcd"
-
-    mock_web3_instance = MagicMock()
-    mock_web3_instance.eth.contract.return_value = mock_contract
-    mock_web3.return_value = mock_web3_instance
+    mock_encode_function_call.return_value = "0x1234abcd"
 
     mock_user_op = MagicMock(spec=EvmUserOperation)
     mock_user_op.user_op_hash = "0xuserhash123"
@@ -68,9 +63,8 @@ async def test_send_user_operation_function_call(
     )
 
     assert result == mock_user_op
-    mock_contract.encode_abi.assert_called_once_with("transfer", args=function_call.args)
-    mock_web3_instance.eth.contract.assert_called_once_with(
-        address=function_call.to, abi=function_call.abi
+    mock_encode_function_call.assert_called_once_with(
+        function_call.abi, "transfer", function_call.args
     )
 
     expected_prepare_request = PrepareUserOperationRequest(
@@ -104,11 +98,11 @@ async def test_send_user_operation_function_call(
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.send_user_operation.Web3")
+@patch("cdp.actions.evm.send_user_operation.encode_function_call")
 @patch("cdp.actions.evm.send_user_operation.ensure_awaitable")
 @patch("cdp.cdp_client.ApiClients")
 async def test_send_user_operation_contract_call(
-    mock_api_clients, mock_ensure_awaitable, mock_web3
+    mock_api_clients, mock_ensure_awaitable, mock_encode_function_call
 ):
     """Test sending a user operation with a ContractCall."""
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
@@ -144,7 +138,7 @@ async def test_send_user_operation_contract_call(
     )
 
     assert result == mock_user_op
-    mock_web3.assert_not_called()
+    mock_encode_function_call.assert_not_called()
     expected_create_request = PrepareUserOperationRequest(
         network="base-sepolia",
         calls=[EvmCall(to=str(contract_call.to), data=contract_call.data, value="100")],
@@ -164,11 +158,11 @@ async def test_send_user_operation_contract_call(
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.send_user_operation.Web3")
+@patch("cdp.actions.evm.send_user_operation.encode_function_call")
 @patch("cdp.actions.evm.send_user_operation.ensure_awaitable")
 @patch("cdp.cdp_client.ApiClients")
 async def test_send_user_operation_multiple_calls(
-    mock_api_clients, mock_ensure_awaitable, mock_web3
+    mock_api_clients, mock_ensure_awaitable, mock_encode_function_call
 ):
     """Test sending a user operation with multiple calls (mix of FunctionCall and ContractCall)."""
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
@@ -176,12 +170,7 @@ async def test_send_user_operation_multiple_calls(
     mock_smart_account.owners = [mock_owner]
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
 
-    mock_contract = MagicMock()
-    mock_contract.encode_abi.return_value = "0x1234abcd"
-
-    mock_web3_instance = MagicMock()
-    mock_web3_instance.eth.contract.return_value = mock_contract
-    mock_web3.return_value = mock_web3_instance
+    mock_encode_function_call.return_value = "0x1234abcd"
 
     mock_signed_payload = MagicMock()
     mock_signed_payload.signature = bytes.fromhex("112233")
@@ -217,7 +206,9 @@ async def test_send_user_operation_multiple_calls(
     )
 
     assert result == mock_user_op
-    mock_contract.encode_abi.assert_called_once_with("transfer", args=function_call.args)
+    mock_encode_function_call.assert_called_once_with(
+        function_call.abi, "transfer", function_call.args
+    )
 
     mock_api_clients.evm_smart_accounts.prepare_user_operation.assert_called_once()
     actual_address, actual_request = (
@@ -393,21 +384,18 @@ async def test_send_user_operation_broadcast_api_error(mock_api_clients, mock_en
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.send_user_operation.Web3")
+@patch("cdp.actions.evm.send_user_operation.encode_function_call")
 @patch("cdp.cdp_client.ApiClients")
-async def test_send_user_operation_function_call_encoding_error(mock_api_clients, mock_web3):
+async def test_send_user_operation_function_call_encoding_error(
+    mock_api_clients, mock_encode_function_call
+):
     """Test handling error during function call encoding."""
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_owner = MagicMock(spec=EvmServerAccount)
     mock_smart_account.owners = [mock_owner]
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
 
-    mock_contract = MagicMock()
-    mock_contract.encode_abi.side_effect = ValueError("Invalid argument type")
-
-    mock_web3_instance = MagicMock()
-    mock_web3_instance.eth.contract.return_value = mock_contract
-    mock_web3.return_value = mock_web3_instance
+    mock_encode_function_call.side_effect = ValueError("Invalid argument type")
 
     function_call = FunctionCall(
         to="0x2345678901234567890123456789012345678901",
@@ -427,7 +415,9 @@ async def test_send_user_operation_function_call_encoding_error(mock_api_clients
             paymaster_url=None,
         )
 
-    mock_contract.encode_abi.assert_called_once_with("transfer", args=function_call.args)
+    mock_encode_function_call.assert_called_once_with(
+        function_call.abi, "transfer", function_call.args
+    )
 
 
 @pytest.mark.asyncio
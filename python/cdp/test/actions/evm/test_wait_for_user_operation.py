@@ -8,13 +8,19 @@ from cdp.openapi_client.exceptions import ApiException
 from cdp.openapi_client.models.evm_user_operation import EvmUserOperation
 
 
+@pytest.fixture
+def mock_sleep():
+    """Patch the asyncio sleep used while polling."""
+    with patch("cdp.polling.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        yield mock_sleep
+
+
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.wait_for_user_operation.time")
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_success_immediate(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_success_immediate(mock_api_clients, mock_time, mock_sleep):
     """Test successful completion of a user operation that is already complete."""
-    mock_time.time.return_value = 1000
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.return_value = 1000
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -31,22 +37,23 @@ async def test_wait_for_user_operation_success_immediate(mock_api_clients, mock_
         user_op_hash=mock_user_op.user_op_hash,
         timeout_seconds=20,
         interval_seconds=0.2,
+        backoff_multiplier=1,
+        jitter=0,
     )
 
     assert result == mock_user_op
     mock_api_clients.evm_smart_accounts.get_user_operation.assert_called_once_with(
         mock_smart_account.address, mock_user_op.user_op_hash
     )
-    mock_time.sleep.assert_not_called()
+    mock_sleep.assert_not_called()
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.wait_for_user_operation.time")
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_success_after_poll(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_success_after_poll(mock_api_clients, mock_time, mock_sleep):
     """Test successful completion of a user operation after polling."""
-    mock_time.time.side_effect = [1000, 1000.5, 1001]
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.side_effect = [1000, 1000.5, 1001]
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -69,20 +76,21 @@ async def test_wait_for_user_operation_success_after_poll(mock_api_clients, mock
         user_op_hash=mock_initial_op.user_op_hash,
         timeout_seconds=20,
         interval_seconds=0.2,
+        backoff_multiplier=1,
+        jitter=0,
     )
 
     assert result == mock_updated_op
     assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count == 2
-    mock_time.sleep.assert_called_once_with(0.2)
+    mock_sleep.assert_called_once_with(0.2)
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.wait_for_user_operation.time")
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_failed_status(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_failed_status(mock_api_clients, mock_time, mock_sleep):
     """Test handling of a user operation that completes with 'failed' status."""
-    mock_time.time.side_effect = [1000, 1000.5, 1001]
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.side_effect = [1000, 1000.5, 1001]
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -105,17 +113,19 @@ async def test_wait_for_user_operation_failed_status(mock_api_clients, mock_time
         user_op_hash=mock_initial_op.user_op_hash,
         timeout_seconds=20,
         interval_seconds=0.2,
+        backoff_multiplier=1,
+        jitter=0,
     )
 
     assert result == mock_updated_op
     assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count == 2
-    mock_time.sleep.assert_called_once_with(0.2)
+    mock_sleep.assert_called_once_with(0.2)
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.wait_for_user_operation.time")
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_timeout(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_timeout(mock_api_clients, mock_time, mock_sleep):
     """Test timeout for a user operation that never completes."""
     start_time = 1000
 
@@ -139,8 +149,7 @@ async def test_wait_for_user_operation_timeout(mock_api_clients, mock_time):
         start_time + 20.5,
     ]
 
-    mock_time.time.side_effect = time_values
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.side_effect = time_values
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -158,19 +167,20 @@ async def test_wait_for_user_operation_timeout(mock_api_clients, mock_time):
             user_op_hash=mock_pending_op.user_op_hash,
             timeout_seconds=20,
             interval_seconds=0.2,
+            backoff_multiplier=1,
+            jitter=0,
         )
 
     assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count > 1
-    assert mock_time.sleep.call_count > 1
+    assert mock_sleep.call_count > 1
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.wait_for_user_operation.time")
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_api_error(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_api_error(mock_api_clients, mock_time, mock_sleep):
     """Test handling of API errors during polling."""
-    mock_time.time.side_effect = [1000, 1000.5]
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.side_effect = [1000, 1000.5]
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -190,6 +200,8 @@ async def test_wait_for_user_operation_api_error(mock_api_clients, mock_time):
             user_op_hash=mock_initial_op.user_op_hash,
             timeout_seconds=20,
             interval_seconds=0.2,
+            backoff_multiplier=1,
+            jitter=0,
         )
 
     assert exc_info.value.status == 500
@@ -201,19 +213,20 @@ async def test_wait_for_user_operation_api_error(mock_api_clients, mock_time):
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.wait_for_user_operation.time")
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_custom_timeout_and_interval(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_custom_timeout_and_interval(
+    mock_api_clients, mock_time, mock_sleep
+):
     """Test using custom timeout and interval values."""
     start_time = 1000
-    mock_time.time.side_effect = [
+    mock_time.monotonic.side_effect = [
         start_time,
         start_time + 1,
         start_time + 2,
         start_time + 3,
         start_time + 11,
     ]
-    mock_time.sleep = MagicMock()
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -231,18 +244,21 @@ async def test_wait_for_user_operation_custom_timeout_and_interval(mock_api_clie
             user_op_hash=mock_pending_op.user_op_hash,
             timeout_seconds=10,
             interval_seconds=1.0,
+            backoff_multiplier=1,
+            jitter=0,
         )
 
-    mock_time.sleep.assert_called_with(1.0)
+    mock_sleep.assert_called_with(1.0)
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.wait_for_user_operation.time")
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_multiple_status_changes(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_multiple_status_changes(
+    mock_api_clients, mock_time, mock_sleep
+):
     """Test handling of a user operation that goes through multiple status changes."""
-    mock_time.time.side_effect = [1000, 1000.5, 1001, 1001.5]
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.side_effect = [1000, 1000.5, 1001, 1001.5]
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -269,20 +285,23 @@ async def test_wait_for_user_operation_multiple_status_changes(mock_api_clients,
         user_op_hash=mock_initial_op.user_op_hash,
         timeout_seconds=20,
         interval_seconds=0.2,
+        backoff_multiplier=1,
+        jitter=0,
     )
 
     assert result == mock_complete_op
     assert mock_api_clients.evm_smart_accounts.get_user_operation.call_count == 3
-    assert mock_time.sleep.call_count == 2
+    assert mock_sleep.call_count == 2
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.wait_for_user_operation.time")
+@patch("cdp.polling.time")
 @patch("cdp.cdp_client.ApiClients")
-async def test_wait_for_user_operation_invalid_user_op_hash(mock_api_clients, mock_time):
+async def test_wait_for_user_operation_invalid_user_op_hash(
+    mock_api_clients, mock_time, mock_sleep
+):
     """Test handling of an API error when user_op_hash is invalid."""
-    mock_time.time.return_value = 1000
-    mock_time.sleep = MagicMock()
+    mock_time.monotonic.return_value = 1000
 
     mock_smart_account = MagicMock(spec=EvmSmartAccount)
     mock_smart_account.address = "0x1234567890123456789012345678901234567890"
@@ -302,6 +321,8 @@ async def test_wait_for_user_operation_invalid_user_op_hash(mock_api_clients, mo
             user_op_hash=mock_op.user_op_hash,
             timeout_seconds=20,
             interval_seconds=0.2,
+            backoff_multiplier=1,
+            jitter=0,
         )
 
     assert exc_info.value.status == 404
@@ -0,0 +1,29 @@
+import pytest_asyncio
+from aiohttp import web
+
+
+@pytest_asyncio.fixture
+async def http_server_factory():
+    """Create and return a factory for local HTTP server fixtures."""
+    runners = []
+
+    async def _create_http_server(handler=None):
+        if handler is None:
+
+            async def handler(request):
+                return web.Response(status=404, text="Not Found")
+
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        runners.append(runner)
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/platform"
+
+    yield _create_http_server
+
+    for runner in runners:
+        await runner.cleanup()
@@ -0,0 +1,134 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from web3 import Web3
+from web3.exceptions import InvalidAddress
+
+from cdp.abi_encoder import FunctionEncoder, encode_function_call, get_function_encoder
+from cdp.actions.evm.transfer.constants import ERC20_ABI
+from cdp.actions.evm.transfer.utils import encode_erc20_function_call
+
+RECIPIENT = "0x2345678901234567890123456789012345678901"
+
+COMPLEX_ABI = [
+    {
+        "type": "function",
+        "name": "settle",
+        "inputs": [
+            {
+                "name": "order",
+                "type": "tuple",
+                "components": [
+                    {"name": "amount", "type": "uint256"},
+                    {"name": "id", "type": "bytes32"},
+                ],
+            },
+            {"name": "data", "type": "bytes"},
+            {"name": "recipients", "type": "address[]"},
+            {"name": "memo", "type": "string"},
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable",
+    },
+    {
+        "type": "function",
+        "name": "mint",
+        "inputs": [{"name": "to", "type": "address"}],
+        "outputs": [],
+        "stateMutability": "nonpayable",
+    },
+    {
+        "type": "function",
+        "name": "mint",
+        "inputs": [{"name": "to", "type": "address"}, {"name": "amount", "type": "uint256"}],
+        "outputs": [],
+        "stateMutability": "nonpayable",
+    },
+]
+
+
+def _web3_encode(abi, function_name, args):
+    return Web3().eth.contract(abi=abi).encode_abi(function_name, args=args)
+
+
+@pytest.mark.parametrize("function_name", ["transfer", "approve"])
+def test_encode_erc20_function_call_matches_web3(function_name):
+    """Test that ERC20 calldata is byte-identical to web3's."""
+    args = [RECIPIENT, 10**18]
+
+    assert encode_erc20_function_call(function_name, args) == _web3_encode(
+        ERC20_ABI, function_name, args
+    )
+
+
+@pytest.mark.parametrize(
+    ("function_name", "args"),
+    [
+        (
+            "settle",
+            [{"amount": 5, "id": "0x" + "11" * 32}, "0xdeadbeef", [RECIPIENT, RECIPIENT], "memo"],
+        ),
+        ("settle", [(5, b"\x11" * 32), b"\xde\xad", [], ""]),
+        ("mint", [RECIPIENT]),
+        ("mint", [RECIPIENT, 7]),
+    ],
+)
+def test_encode_function_call_matches_web3(function_name, args):
+    """Test that calldata with tuples, bytes, arrays and overloads matches web3's."""
+    assert encode_function_call(COMPLEX_ABI, function_name, args) == _web3_encode(
+        COMPLEX_ABI, function_name, args
+    )
+
+
+def test_get_function_encoder_is_cached_by_abi_contents():
+    """Test that equal ABIs share an encoder with a precomputed selector."""
+    encoder = get_function_encoder(ERC20_ABI, "transfer", 2)
+
+    assert isinstance(encoder, FunctionEncoder)
+    assert encoder.selector.hex() == "a9059cbb"
+    assert get_function_encoder([dict(item) for item in ERC20_ABI], "transfer", 2) is encoder
+    assert get_function_encoder(ERC20_ABI, "transfer", 3) is None
+    assert get_function_encoder(ERC20_ABI, "unknown", 2) is None
+
+
+def test_encode_function_call_serializes_each_abi_object_once():
+    """Test that the fingerprint of an ABI object is computed on its first call only."""
+    abi = [dict(item) for item in COMPLEX_ABI]
+
+    with patch("cdp.abi_encoder.json.dumps", wraps=json.dumps) as mock_dumps:
+        for i in range(3):
+            encode_function_call(abi, "mint", [RECIPIENT, i])
+        encode_function_call([dict(item) for item in abi], "mint", [RECIPIENT])
+
+    assert mock_dumps.call_count == 2
+
+
+def test_encode_function_call_raises_web3_errors_for_invalid_calls():
+    """Test that calls the encoder can't handle fall back to web3 and its errors."""
+    with pytest.raises(Exception) as cached_error:
+        encode_function_call(ERC20_ABI, "transfer", ["invalid-address", 1])
+    with pytest.raises(Exception) as web3_error:
+        _web3_encode(ERC20_ABI, "transfer", ["invalid-address", 1])
+
+    assert type(cached_error.value) is type(web3_error.value)
+
+
+@pytest.mark.parametrize(
+    "recipient",
+    [
+        "0xaBaBaBaBABabABABabaBAbabABAbAbaBaBABAbab",
+        RECIPIENT.lower().replace("0x23", "0xab"),
+        "0x9F663335CD6AD02A37B633602E98866CF944124D",
+    ],
+)
+def test_non_checksummed_addresses_raise_like_web3(recipient):
+    """Test that recipients with a missing or bad checksum are rejected as web3 rejects them."""
+    with pytest.raises(InvalidAddress):
+        encode_erc20_function_call("transfer", [recipient, 1])
+    with pytest.raises(InvalidAddress):
+        encode_function_call(COMPLEX_ABI, "mint", [recipient])
+    with pytest.raises(InvalidAddress):
+        encode_function_call(
+            COMPLEX_ABI, "settle", [(1, b"\x11" * 32), b"", [RECIPIENT, recipient], ""]
+        )
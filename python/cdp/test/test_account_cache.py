@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+import pytest
+
+from cdp.account_cache import AccountCache
+
+
+def test_get_counts_hits_and_misses():
+    """Test that lookups are counted as hits or misses."""
+    cache = AccountCache()
+    cache.set([("evm", "address", "0x1")], "account")
+
+    assert cache.get(("evm", "address", "0x1")) == "account"
+    assert cache.get(("evm", "address", "0x2")) is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_value_is_cached_under_every_key():
+    """Test that a value cached under several keys is found by any of them."""
+    cache = AccountCache()
+    cache.set([("evm", "address", "0x1"), ("evm", "name", "test")], "account")
+
+    assert cache.get(("evm", "name", "test")) == "account"
+    assert cache.get(("evm", "address", "0x1")) == "account"
+
+
+def test_entries_expire_after_ttl():
+    """Test that values are no longer returned once their TTL has passed."""
+    cache = AccountCache(ttl=10)
+    with patch("cdp.account_cache.time.monotonic", return_value=100):
+        cache.set([("evm", "address", "0x1")], "account")
+
+    with patch("cdp.account_cache.time.monotonic", return_value=109):
+        assert cache.get(("evm", "address", "0x1")) == "account"
+    with patch("cdp.account_cache.time.monotonic", return_value=110):
+        assert cache.get(("evm", "address", "0x1")) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted():
+    """Test that the least recently used value is evicted along with all of its keys."""
+    cache = AccountCache(max_size=4)
+    cache.set([("address", "0x1"), ("name", "one")], "one")
+    cache.set([("address", "0x2"), ("name", "two")], "two")
+    cache.get(("address", "0x1"))
+
+    cache.set([("address", "0x3")], "three")
+
+    assert cache.get(("name", "two")) is None
+    assert cache.get(("address", "0x2")) is None
+    assert cache.get(("name", "one")) == "one"
+    assert len(cache) == 3
+
+
+def test_invalidate_removes_all_keys_of_a_value():
+    """Test that invalidating one key also drops the other keys of the same value."""
+    cache = AccountCache()
+    cache.set([("address", "0x1"), ("name", "old")], "old")
+
+    cache.set([("address", "0x1"), ("name", "new")], "new")
+
+    assert cache.get(("name", "old")) is None
+    assert cache.get(("name", "new")) == "new"
+
+
+def test_clear():
+    """Test that clearing the cache removes all values."""
+    cache = AccountCache()
+    cache.set([("address", "0x1")], "account")
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("kwargs", [{"ttl": 0}, {"max_size": 0}])
+def test_init_rejects_invalid_options(kwargs):
+    """Test that the TTL and maximum size must be positive."""
+    with pytest.raises(ValueError, match="must be positive"):
+        AccountCache(**kwargs)
@@ -1,13 +1,18 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import rlp
 
+from cdp.actions.evm.send_transaction import send_transaction
 from cdp.actions.evm.transfer.account_transfer_strategy import (
     AccountTransferStrategy,
     account_transfer_strategy,
 )
 from cdp.api_clients import ApiClients
 from cdp.evm_server_account import EvmServerAccount
+from cdp.evm_transaction_types import TransactionRequestEIP1559
+from cdp.nonce_manager import NonceManager
 from cdp.openapi_client.models.send_evm_transaction200_response import (
     SendEvmTransaction200Response,
 )
@@ -29,6 +34,7 @@ async def test_execute_transfer_eth():
 
         mock_from_account = MagicMock(spec=EvmServerAccount)
         mock_from_account.address = "0x1234567890123456789012345678901234567890"
+        mock_from_account.nonce_manager = None
 
         to_address = "0x2345678901234567890123456789012345678901"
         value = 1000000000000000000  # 1 ETH
@@ -51,6 +57,7 @@ async def test_execute_transfer_eth():
                 transaction="0x02e88080808080942345678901234567890123456789012345678901880de0b6b3a764000080c0808080",
                 network="base-sepolia",
             ),
+            x_idempotency_key=None,
         )
         assert result == "0xabc123"
         mock_get_erc20_address.assert_not_called()
@@ -58,7 +65,46 @@ async def test_execute_transfer_eth():
 
 @pytest.mark.asyncio
 async def test_execute_transfer_erc20():
-    """Test executing ERC20 token transfer."""
+    """Test executing ERC20 token transfer sends only the transfer."""
+    # Arrange
+    mock_api_clients = MagicMock(spec=ApiClients)
+    mock_api_clients.evm_accounts = AsyncMock()
+    mock_api_clients.evm_accounts.send_evm_transaction = AsyncMock(
+        return_value=SendEvmTransaction200Response(transaction_hash="0xtransfer456")
+    )
+
+    mock_from_account = MagicMock(spec=EvmServerAccount)
+    mock_from_account.address = "0x1234567890123456789012345678901234567890"
+    mock_from_account.nonce_manager = None
+
+    to_address = "0x2345678901234567890123456789012345678901"
+    value = 1000000  # 1 USDC (6 decimals)
+
+    # Act
+    strategy = AccountTransferStrategy()
+    result = await strategy.execute_transfer(
+        api_clients=mock_api_clients,
+        from_account=mock_from_account,
+        to=to_address,
+        value=value,
+        token="usdc",
+        network="base-sepolia",
+    )
+
+    # Assert
+    mock_api_clients.evm_accounts.send_evm_transaction.assert_called_once()
+    transaction = mock_api_clients.evm_accounts.send_evm_transaction.call_args.kwargs[
+        "send_evm_transaction_request"
+    ].transaction
+    assert "a9059cbb" in transaction  # transfer(address,uint256)
+    assert "095ea7b3" not in transaction  # approve(address,uint256)
+
+    assert result == "0xtransfer456"
+
+
+@pytest.mark.asyncio
+async def test_execute_transfer_erc20_with_approve():
+    """Test executing ERC20 token transfer with the opt-in approve."""
     # Arrange
     mock_api_clients = MagicMock(spec=ApiClients)
     mock_api_clients.evm_accounts = AsyncMock()
@@ -71,6 +117,7 @@ async def test_execute_transfer_erc20():
 
     mock_from_account = MagicMock(spec=EvmServerAccount)
     mock_from_account.address = "0x1234567890123456789012345678901234567890"
+    mock_from_account.nonce_manager = None
 
     to_address = "0x2345678901234567890123456789012345678901"
     value = 1000000  # 1 USDC (6 decimals)
@@ -84,14 +131,71 @@ async def test_execute_transfer_erc20():
         value=value,
         token="usdc",
         network="base-sepolia",
+        approve=True,
     )
 
     # Assert
     assert mock_api_clients.evm_accounts.send_evm_transaction.call_count == 2
+    approve_call, transfer_call = mock_api_clients.evm_accounts.send_evm_transaction.call_args_list
+    assert "095ea7b3" in approve_call.kwargs["send_evm_transaction_request"].transaction
+    assert "a9059cbb" in transfer_call.kwargs["send_evm_transaction_request"].transaction
 
     assert result == "0xtransfer456"
 
 
+@pytest.mark.asyncio
+async def test_execute_transfer_uses_the_nonce_manager_of_the_account():
+    """Test that transfers interleaved with pipelined sends get distinct local nonces."""
+    sent_nonces = []
+
+    async def send_evm_transaction(address, send_evm_transaction_request, x_idempotency_key):
+        transaction = send_evm_transaction_request.transaction
+        sent_nonces.append(rlp.decode(bytes.fromhex(transaction[4:]))[1])
+        await asyncio.sleep(0)
+        return SendEvmTransaction200Response(transaction_hash=f"0x{len(sent_nonces):x}")
+
+    mock_api_clients = MagicMock(spec=ApiClients)
+    mock_api_clients.evm_accounts = AsyncMock()
+    mock_api_clients.evm_accounts.send_evm_transaction = AsyncMock(side_effect=send_evm_transaction)
+    nonce_manager = NonceManager(AsyncMock(return_value=3))
+    mock_from_account = MagicMock(spec=EvmServerAccount)
+    mock_from_account.address = "0x1234567890123456789012345678901234567890"
+    mock_from_account.nonce_manager = nonce_manager
+    to_address = "0x2345678901234567890123456789012345678901"
+
+    await asyncio.gather(
+        *(
+            send_transaction(
+                mock_api_clients.evm_accounts,
+                mock_from_account.address,
+                TransactionRequestEIP1559(to=to_address, value=i),
+                "base-sepolia",
+                nonce_manager=nonce_manager,
+            )
+            for i in range(3)
+        ),
+        account_transfer_strategy.execute_transfer(
+            api_clients=mock_api_clients,
+            from_account=mock_from_account,
+            to=to_address,
+            value=1000000,
+            token="usdc",
+            network="base-sepolia",
+            approve=True,
+        ),
+        account_transfer_strategy.execute_transfer(
+            api_clients=mock_api_clients,
+            from_account=mock_from_account,
+            to=to_address,
+            value=1,
+            token="eth",
+            network="base-sepolia",
+        ),
+    )
+
+    assert sorted(int.from_bytes(nonce, "big") for nonce in sent_nonces) == list(range(3, 9))
+
+
 def test_singleton_instance():
     """Test that account_transfer_strategy is an instance of AccountTransferStrategy."""
     assert isinstance(account_transfer_strategy, AccountTransferStrategy)
@@ -0,0 +1,303 @@
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from cdp.bulk import BulkOperation, get_or_create_by_name, run_workers
+from cdp.openapi_client.errors import ApiError
+from cdp.utils import derive_idempotency_key
+
+
+def test_derive_idempotency_key_is_deterministic_uuid4():
+    """Test that the same parts always derive the same UUID v4 idempotency key."""
+    key = derive_idempotency_key("evm", "create_account", None, "alice", None)
+
+    assert key == derive_idempotency_key("evm", "create_account", None, "alice", None)
+    assert key != derive_idempotency_key("evm", "create_account", None, "bob", None)
+    assert uuid.UUID(key).version == 4
+    assert len(key) == 36
+
+
+@pytest.mark.asyncio
+async def test_bulk_operation_yields_every_result():
+    """Test that every item is run and its result yielded with its index."""
+
+    async def double(index, item):
+        return item * 2
+
+    operation = BulkOperation([1, 2, 3], double, concurrency=2)
+    results = dict([result async for result in operation])
+
+    assert results == {0: 2, 1: 4, 2: 6}
+    assert operation.errors == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_operation_collects_results_in_item_order():
+    """Test that collect returns the results in the order of the items, with None for failures."""
+
+    async def run(index, item):
+        await asyncio.sleep(0.001 * (5 - index))
+        if item == "bad":
+            raise ApiError(400, "invalid_request", "Invalid item")
+        return item.upper()
+
+    operation = BulkOperation(["a", "bad", "c", "bad", "e"], run)
+    results = await operation.collect()
+
+    assert results == ["A", None, "C", None, "E"]
+    assert [error.index for error in operation.errors] == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_bulk_operation_bounds_concurrency():
+    """Test that no more than the given number of items are in flight at once."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def run(index, item):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return item
+
+    results = [result async for result in BulkOperation(range(10), run, concurrency=3)]
+
+    assert len(results) == 10
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_operation_collects_failures():
+    """Test that failed items are recorded without stopping the others."""
+
+    async def run(index, item):
+        if item == "bad":
+            raise ApiError(400, "invalid_request", "Invalid name")
+        return item
+
+    operation = BulkOperation(["a", "bad", "c"], run)
+    results = [result async for result in operation]
+
+    assert sorted(results) == [(0, "a"), (2, "c")]
+    assert len(operation.errors) == 1
+    assert operation.errors[0].index == 1
+    assert operation.errors[0].item == "bad"
+    assert operation.errors[0].error.http_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_operation_backs_off_on_throttling():
+    """Test that 429 responses halve the concurrency and the throttled item is retried."""
+    attempts = {}
+
+    async def run(index, item):
+        attempts[index] = attempts.get(index, 0) + 1
+        if index == 0 and attempts[index] == 1:
+            raise ApiError(429, "rate_limit_exceeded", "Rate limit exceeded")
+        return item
+
+    operation = BulkOperation(range(4), run, concurrency=8)
+
+    with patch("cdp.bulk.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        results = [result async for result in operation]
+
+    assert len(results) == 4
+    assert attempts[0] == 2
+    assert operation.errors == []
+    mock_sleep.assert_called_once()
+    assert operation.concurrency < 8
+
+
+@pytest.mark.asyncio
+async def test_bulk_operation_gives_up_after_max_throttle_retries():
+    """Test that an item that stays throttled is recorded as failed."""
+    run = AsyncMock(side_effect=ApiError(429, "rate_limit_exceeded", "Rate limit exceeded"))
+    operation = BulkOperation(["a"], run, max_throttle_retries=2)
+
+    with patch("cdp.bulk.asyncio.sleep", new_callable=AsyncMock):
+        results = [result async for result in operation]
+
+    assert results == []
+    assert run.call_count == 3
+    assert operation.errors[0].error.http_code == 429
+    assert operation.concurrency == 5
+
+
+def test_bulk_operation_rejects_invalid_concurrency():
+    """Test that the concurrency must be positive."""
+    with pytest.raises(ValueError, match="concurrency must be positive"):
+        BulkOperation([], AsyncMock(), concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_run_workers_yields_every_emitted_result():
+    """Test that every result a worker emits is yielded."""
+
+    async def work(item, emit):
+        for i in range(item):
+            await emit((item, i))
+
+    results = [result async for result in run_workers([1, 2, 3], work, concurrency=2)]
+
+    assert sorted(results) == [(1, 0), (2, 0), (2, 1), (3, 0), (3, 1), (3, 2)]
+
+
+@pytest.mark.asyncio
+async def test_run_workers_raises_unexpected_worker_errors():
+    """Test that an error a worker doesn't handle is raised instead of hanging."""
+
+    async def work(item, emit):
+        if item == 2:
+            raise RuntimeError("boom")
+        await emit(item)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async for _ in run_workers([1, 2, 3], work, concurrency=1):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_run_workers_cancels_workers_when_closed_early():
+    """Test that stopping the iteration early cancels the workers."""
+    cancelled = 0
+
+    async def work(item, emit):
+        nonlocal cancelled
+        try:
+            await emit(item)
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+
+    results = run_workers(range(10), work, concurrency=3)
+    async for _ in results:
+        break
+    await results.aclose()
+
+    assert cancelled == 3
+
+
+class _Account(BaseModel):
+    name: str
+
+
+class _Page(BaseModel):
+    accounts: list[_Account]
+    next_page_token: str | None = None
+
+
+_ACCOUNT_PAGES = {
+    None: _Page(accounts=[_Account(name="a"), _Account(name="b")], next_page_token="2"),
+    "2": _Page(accounts=[_Account(name="c")], next_page_token="3"),
+    "3": _Page(accounts=[_Account(name="d")]),
+}
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_by_name_creates_only_missing_names():
+    """Test that cached and listed accounts are reused and only the rest are created."""
+    fetch_page = AsyncMock(side_effect=lambda page_token: _ACCOUNT_PAGES[page_token])
+    create = AsyncMock(side_effect=lambda name: _Account(name=name))
+    cached = {"x": _Account(name="x")}
+
+    accounts = await get_or_create_by_name(
+        ["x", "a", "d", "new-1", "a", "new-2", "new-1"], {}, cached.get, fetch_page, create
+    )
+
+    assert list(accounts) == ["x", "a", "d", "new-1", "new-2"]
+    assert accounts["x"] is cached["x"]
+    assert accounts["a"] is _ACCOUNT_PAGES[None].accounts[0]
+    assert fetch_page.call_count == 3
+    assert sorted(call.args[0] for call in create.call_args_list) == ["new-1", "new-2"]
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_by_name_stops_paging_once_all_names_are_found():
+    """Test that no more pages are fetched once every name is found."""
+    fetch_page = AsyncMock(side_effect=lambda page_token: _ACCOUNT_PAGES[page_token])
+    create = AsyncMock()
+
+    accounts = await get_or_create_by_name(["b", "a"], {}, lambda name: None, fetch_page, create)
+
+    assert list(accounts) == ["b", "a"]
+    fetch_page.assert_awaited_once_with(None)
+    create.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_by_name_looks_up_few_names_without_paging():
+    """Test that few names are looked up one by one instead of paging through every account."""
+    fetch_page = AsyncMock()
+    create = AsyncMock(side_effect=lambda name: _Account(name=name))
+    get_by_name = AsyncMock(side_effect=lambda name: None if name == "new" else _Account(name=name))
+
+    accounts = await get_or_create_by_name(
+        ["a", "new"], {}, lambda name: None, fetch_page, create, get_by_name=get_by_name
+    )
+
+    assert {name: account.name for name, account in accounts.items()} == {"a": "a", "new": "new"}
+    fetch_page.assert_not_awaited()
+    assert sorted(call.args[0] for call in get_by_name.call_args_list) == ["a", "new"]
+    create.assert_awaited_once_with("new")
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_by_name_pages_for_many_names():
+    """Test that more names than max_lookups are looked up by paging."""
+    fetch_page = AsyncMock(side_effect=lambda page_token: _ACCOUNT_PAGES[page_token])
+    get_by_name = AsyncMock()
+
+    accounts = await get_or_create_by_name(
+        ["a", "b"],
+        {},
+        lambda name: None,
+        fetch_page,
+        AsyncMock(),
+        get_by_name=get_by_name,
+        max_lookups=1,
+    )
+
+    assert list(accounts) == ["a", "b"]
+    fetch_page.assert_awaited_once_with(None)
+    get_by_name.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_by_name_collapses_names_in_flight():
+    """Test that concurrent calls for the same name share one lookup and creation."""
+    in_flight = {}
+    fetch_page = AsyncMock(return_value=_Page(accounts=[]))
+
+    async def create(name):
+        await asyncio.sleep(0.01)
+        return _Account(name=name)
+
+    create = AsyncMock(side_effect=create)
+
+    first, second = await asyncio.gather(
+        get_or_create_by_name(["a", "b"], in_flight, lambda name: None, fetch_page, create),
+        get_or_create_by_name(["b", "c"], in_flight, lambda name: None, fetch_page, create),
+    )
+
+    assert first["b"] is second["b"]
+    assert sorted(call.args[0] for call in create.call_args_list) == ["a", "b", "c"]
+    assert in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_by_name_raises_creation_errors():
+    """Test that a failed creation is raised and the name is no longer in flight."""
+    in_flight = {}
+    fetch_page = AsyncMock(return_value=_Page(accounts=[]))
+    create = AsyncMock(side_effect=ApiError(400, "invalid_request", "Invalid name"))
+
+    with pytest.raises(ApiError, match="Invalid name"):
+        await get_or_create_by_name(["bad"], in_flight, lambda name: None, fetch_page, create)
+
+    assert in_flight == {}
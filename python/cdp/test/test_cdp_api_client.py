@@ -0,0 +1,482 @@
+import asyncio
+import base64
+import json
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from cdp.auth.utils.http import AuthContext
+from cdp.openapi_client.api_client import ApiClient
+from cdp.openapi_client.cdp_api_client import CdpApiClient
+from cdp.openapi_client.errors import ApiError
+from cdp.transport_types import RetryOptions, TransportOptions
+
+
+def _create_client(**kwargs) -> CdpApiClient:
+    return CdpApiClient(
+        api_key_id="test_api_key_id",
+        api_key_secret="test_api_key_secret",
+        wallet_secret="test_wallet_secret",
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+@patch.object(ApiClient, "call_api", new_callable=AsyncMock)
+@patch.object(AuthContext, "get_headers")
+async def test_call_api_signs_in_executor(mock_get_auth_headers, mock_call_api):
+    """Test that auth headers are generated off the event loop thread by default."""
+    signing_threads = []
+
+    def _get_auth_headers(*args):
+        signing_threads.append(threading.current_thread())
+        return {"Authorization": "Bearer mock.jwt.token"}
+
+    mock_get_auth_headers.side_effect = _get_auth_headers
+    client = _create_client()
+
+    await client.call_api("GET", "https://api.cdp.coinbase.com/platform/v2/evm/accounts")
+
+    assert signing_threads[0] is not threading.current_thread()
+    assert signing_threads[0].name.startswith("cdp-signing")
+    headers = mock_call_api.call_args[0][2]
+    assert headers["Authorization"] == "Bearer mock.jwt.token"
+    await client.close()
+
+
+@pytest.mark.asyncio
+@patch.object(ApiClient, "call_api", new_callable=AsyncMock)
+@patch.object(AuthContext, "get_headers")
+async def test_call_api_signs_inline_when_offload_disabled(mock_get_auth_headers, mock_call_api):
+    """Test that auth headers are generated on the event loop when offloading is disabled."""
+    signing_threads = []
+
+    def _get_auth_headers(*args):
+        signing_threads.append(threading.current_thread())
+        return {"Authorization": "Bearer mock.jwt.token"}
+
+    mock_get_auth_headers.side_effect = _get_auth_headers
+    client = _create_client(offload_signing=False)
+
+    await client.call_api("GET", "https://api.cdp.coinbase.com/platform/v2/evm/accounts")
+
+    assert signing_threads == [threading.current_thread()]
+    assert client._signing_executor is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        ("POST", "/platform/v2/evm/accounts"),
+        ("POST", "/platform/v2/evm/accounts/0x123/send/transaction"),
+        ("POST", "/platform/v2/evm/accounts/0x123/sign"),
+        ("PUT", "/platform/v2/policy-engine/policies/abc"),
+        ("POST", "/platform/v2/solana/accounts/abc/sign/transaction"),
+    ],
+)
+@patch.object(ApiClient, "call_api", new_callable=AsyncMock)
+@patch.object(AuthContext, "get_headers", return_value={})
+async def test_call_api_generates_idempotency_key(_, mock_call_api, method, path):
+    """Test that an idempotency key is generated for operations that accept one."""
+    client = _create_client(offload_signing=False, auto_idempotency_keys=True)
+
+    await client.call_api(method, f"https://api.cdp.coinbase.com{path}")
+
+    headers = mock_call_api.call_args[0][2]
+    assert uuid.UUID(headers["X-Idempotency-Key"]).version == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        ("GET", "/platform/v2/evm/accounts"),
+        ("POST", "/platform/v2/evm/smart-accounts"),
+        ("POST", "/platform/v2/evm/faucet"),
+    ],
+)
+@patch.object(ApiClient, "call_api", new_callable=AsyncMock)
+@patch.object(AuthContext, "get_headers", return_value={})
+async def test_call_api_skips_idempotency_key(_, mock_call_api, method, path):
+    """Test that no idempotency key is added to operations that don't accept one."""
+    client = _create_client(offload_signing=False, auto_idempotency_keys=True)
+
+    await client.call_api(method, f"https://api.cdp.coinbase.com{path}")
+
+    assert "X-Idempotency-Key" not in mock_call_api.call_args[0][2]
+
+
+@pytest.mark.asyncio
+@patch.object(ApiClient, "call_api", new_callable=AsyncMock)
+@patch.object(AuthContext, "get_headers", return_value={})
+async def test_call_api_keeps_caller_idempotency_key(_, mock_call_api):
+    """Test that an idempotency key passed by the caller is not replaced."""
+    client = _create_client(offload_signing=False, auto_idempotency_keys=True)
+
+    await client.call_api(
+        "POST",
+        "https://api.cdp.coinbase.com/platform/v2/evm/accounts",
+        {"X-Idempotency-Key": "caller-key"},
+    )
+
+    assert mock_call_api.call_args[0][2]["X-Idempotency-Key"] == "caller-key"
+
+
+@pytest.mark.asyncio
+@patch.object(ApiClient, "call_api", new_callable=AsyncMock)
+@patch.object(AuthContext, "get_headers", return_value={})
+async def test_call_api_idempotency_keys_disabled_by_default(_, mock_call_api):
+    """Test that idempotency keys are only generated when enabled."""
+    client = _create_client(offload_signing=False)
+
+    await client.call_api("POST", "https://api.cdp.coinbase.com/platform/v2/evm/accounts")
+
+    assert "X-Idempotency-Key" not in mock_call_api.call_args[0][2]
+    assert client.rest_client.retries.retry_idempotent_requests is False
+    assert _create_client(auto_idempotency_keys=True).rest_client.retries.retry_idempotent_requests
+
+
+@pytest.mark.asyncio
+@patch.object(ApiClient, "close", new_callable=AsyncMock)
+async def test_close_shuts_down_owned_executor(mock_close):
+    """Test that closing the client shuts down the executor it created."""
+    client = _create_client()
+    executor = client._get_signing_executor()
+
+    await client.close()
+
+    assert executor._shutdown is True
+    assert client._signing_executor is None
+
+
+@pytest.mark.asyncio
+@patch.object(ApiClient, "close", new_callable=AsyncMock)
+async def test_close_leaves_caller_executor_running(mock_close):
+    """Test that closing the client doesn't shut down an executor passed in by the caller."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    client = _create_client(signing_executor=executor)
+
+    await client.close()
+
+    assert executor._shutdown is False
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+@patch.object(ApiClient, "call_api", new_callable=AsyncMock)
+async def test_call_api_serializes_body_once(mock_call_api):
+    """Test that the sent body and the Wallet Auth req claim share one serialization."""
+    api_key_secret = base64.b64encode(
+        ed25519.Ed25519PrivateKey.generate().private_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PrivateFormat.Raw,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        + bytes(32)
+    ).decode()
+    wallet_secret = base64.b64encode(
+        ec.generate_private_key(ec.SECP256R1()).private_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    ).decode()
+    client = CdpApiClient(
+        api_key_id="test_api_key_id",
+        api_key_secret=api_key_secret,
+        wallet_secret=wallet_secret,
+        offload_signing=False,
+    )
+    body = {"hash": "0x" + "ab" * 32}
+
+    with patch("cdp.openapi_client.cdp_api_client.json.dumps", wraps=json.dumps) as mock_dumps:
+        await client.call_api(
+            "POST",
+            "https://api.cdp.coinbase.com/platform/v2/evm/accounts/0x123/sign",
+            body=body,
+        )
+
+    assert [call.args[0] for call in mock_dumps.call_args_list].count(body) == 1
+    _, _, headers, sent_body, *_ = mock_call_api.call_args[0]
+    assert isinstance(sent_body, str)
+    assert json.loads(sent_body) == body
+    wallet_auth = jwt.decode(headers["X-Wallet-Auth"], options={"verify_signature": False})
+    assert wallet_auth["req"] == body
+    assert (
+        sent_body
+        in base64.urlsafe_b64decode(headers["X-Wallet-Auth"].split(".")[1] + "==").decode()
+    )
+
+
+@pytest.mark.asyncio
+async def test_transport_options_configure_session():
+    """Test that transport options are applied to the aiohttp session."""
+    client = _create_client(
+        transport_options=TransportOptions(
+            connection_pool_size=500,
+            connections_per_host=250,
+            keepalive_timeout=60,
+            dns_cache_ttl=300,
+            connect_timeout=2,
+            read_timeout=10,
+            request_timeout=30,
+        )
+    )
+
+    session = client.rest_client._get_session()
+
+    assert session.connector.limit == 500
+    assert session.connector.limit_per_host == 250
+    assert session.connector._keepalive_timeout == 60
+    assert session.connector._cached_hosts._ttl == 300
+    assert session.timeout.total == 30
+    assert session.timeout.sock_connect == 2
+    assert session.timeout.sock_read == 10
+    await client.close()
+
+
+def test_retry_options_configure_retry_policy():
+    """Test that the retry options and max network retries build the transport retry policy."""
+    client = _create_client(
+        max_network_retries=5,
+        transport_options=TransportOptions(
+            retry_options=RetryOptions(
+                retry_statuses=[503],
+                backoff_factor=1,
+                backoff_max=4,
+                respect_retry_after=False,
+                retry_budget=None,
+            )
+        ),
+    )
+
+    policy = client.rest_client.retries
+    assert policy.total == 5
+    assert policy.status_forcelist == {503}
+    assert policy.backoff_factor == 1
+    assert policy.backoff_max == 4
+    assert policy.respect_retry_after is False
+    assert policy.retry_budget is None
+    assert client.retry_metrics is policy.metrics
+
+
+def test_transport_options_defaults():
+    """Test that the default transport options match the previous transport settings."""
+    client = _create_client()
+
+    assert client.rest_client.maxsize == 100
+    assert client.rest_client.timeout.total == 300
+    assert client.rest_client.timeout.sock_connect is None
+    assert client.rest_client.timeout.sock_read is None
+
+
+@pytest.mark.asyncio
+async def test_warm_up_opens_pooled_connections(http_server_factory):
+    """Test that warming up leaves the requested number of idle connections in the pool."""
+    client = _create_client(base_path=await http_server_factory())
+
+    opened = await client.warm_up(connections=3)
+
+    connector = client.rest_client.pool_manager.connector
+    assert opened == 3
+    assert sum(len(conns) for conns in connector._conns.values()) == 3
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_is_capped_by_pool_size(http_server_factory):
+    """Test that warming up never opens more connections than the pool allows."""
+    client = _create_client(
+        base_path=await http_server_factory(),
+        transport_options=TransportOptions(connection_pool_size=2),
+    )
+
+    opened = await client.warm_up(connections=10)
+
+    assert opened == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_reports_unreachable_host():
+    """Test that warming up an unreachable host opens no connections instead of raising."""
+    client = _create_client(
+        base_path="http://127.0.0.1:1/platform",
+        transport_options=TransportOptions(connect_timeout=1),
+    )
+
+    opened = await client.warm_up(connections=2)
+
+    assert opened == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_rejects_invalid_connections():
+    """Test that warming up requires at least one connection."""
+    client = _create_client()
+
+    with pytest.raises(ValueError, match="connections must be at least 1"):
+        await client.warm_up(connections=0)
+
+
+def _slow_call_api(release: asyncio.Event):
+    """Return a call_api side effect that waits for the event before responding."""
+
+    async def _call_api(method, url, *args, **kwargs):
+        await release.wait()
+        response = MagicMock()
+        response.url = url
+        response.read = AsyncMock(return_value=b"{}")
+        return response
+
+    return _call_api
+
+
+@pytest.mark.asyncio
+@patch.object(ApiClient, "call_api", new_callable=AsyncMock)
+@patch.object(AuthContext, "get_headers", return_value={})
+async def test_call_api_coalesces_identical_gets(_, mock_call_api):
+    """Test that concurrent identical GET requests share one in-flight request."""
+    release = asyncio.Event()
+    mock_call_api.side_effect = _slow_call_api(release)
+    client = _create_client(offload_signing=False, coalesce_requests=True)
+    url = "https://api.cdp.coinbase.com/platform/v2/evm/accounts/by-name/test"
+
+    tasks = [asyncio.create_task(client.call_api("GET", url, {"Accept": "a"})) for _ in range(10)]
+    other = asyncio.create_task(client.call_api("GET", url + "-2", {"Accept": "a"}))
+    await asyncio.sleep(0)
+    release.set()
+    responses = await asyncio.gather(*tasks)
+    await other
+
+    assert mock_call_api.call_count == 2
+    assert all(response is responses[0] for response in responses)
+    responses[0].read.assert_awaited_once()
+    assert client._in_flight == {}
+
+    await client.call_api("GET", url, {"Accept": "a"})
+    assert mock_call_api.call_count == 3
+
+
+@pytest.mark.asyncio
+@patch.object(ApiClient, "call_api", new_callable=AsyncMock)
+@patch.object(AuthContext, "get_headers", return_value={})
+async def test_call_api_coalesced_errors_reach_every_caller(_, mock_call_api):
+    """Test that an error from a shared request is raised to every caller."""
+    release = asyncio.Event()
+
+    async def _fail(*args, **kwargs):
+        await release.wait()
+        raise ConnectionError("Connection refused")
+
+    mock_call_api.side_effect = _fail
+    client = _create_client(offload_signing=False, coalesce_requests=True)
+    url = "https://api.cdp.coinbase.com/platform/v2/evm/accounts/0x123"
+
+    tasks = [asyncio.create_task(client.call_api("GET", url)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert mock_call_api.call_count == 1
+    assert all(isinstance(result, ApiError) for result in results)
+    assert all(result.http_code == 503 for result in results)
+    assert all(result.error_message == results[0].error_message for result in results)
+    assert len({id(result) for result in results}) == 3
+
+
+@pytest.mark.asyncio
+@patch.object(ApiClient, "call_api", new_callable=AsyncMock)
+@patch.object(AuthContext, "get_headers", return_value={})
+async def test_call_api_coalesced_caller_cancellation(_, mock_call_api):
+    """Test that cancelling one caller doesn't cancel the request shared with others."""
+    release = asyncio.Event()
+    mock_call_api.side_effect = _slow_call_api(release)
+    client = _create_client(offload_signing=False, coalesce_requests=True)
+    url = "https://api.cdp.coinbase.com/platform/v2/evm/accounts/0x123"
+
+    cancelled = asyncio.create_task(client.call_api("GET", url))
+    waiting = asyncio.create_task(client.call_api("GET", url))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+    response = await waiting
+
+    assert cancelled.cancelled()
+    assert response.url == url
+    assert mock_call_api.call_count == 1
+
+
+@pytest.mark.asyncio
+@patch.object(ApiClient, "call_api", new_callable=AsyncMock)
+@patch.object(AuthContext, "get_headers", return_value={})
+async def test_call_api_write_splits_coalesced_gets(_, mock_call_api):
+    """Test that GET requests made after a write don't join requests started before it."""
+    release = asyncio.Event()
+    mock_call_api.side_effect = _slow_call_api(release)
+    client = _create_client(offload_signing=False, coalesce_requests=True)
+    url = "https://api.cdp.coinbase.com/platform/v2/evm/accounts/0x123"
+
+    before = asyncio.create_task(client.call_api("GET", url))
+    await asyncio.sleep(0)
+    write = asyncio.create_task(client.call_api("PUT", url, body={"name": "new"}))
+    await asyncio.sleep(0)
+    after = asyncio.create_task(client.call_api("GET", url))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(before, write, after)
+
+    assert [call.args[0] for call in mock_call_api.call_args_list] == ["GET", "PUT", "GET"]
+
+
+@pytest.mark.asyncio
+@patch.object(ApiClient, "call_api", new_callable=AsyncMock)
+@patch.object(AuthContext, "get_headers", return_value={})
+async def test_call_api_write_only_splits_gets_of_related_paths(_, mock_call_api):
+    """Test that a write only splits GET requests of its path, its parents and its children."""
+    release = asyncio.Event()
+    mock_call_api.side_effect = _slow_call_api(release)
+    client = _create_client(offload_signing=False, coalesce_requests=True)
+    base_url = "https://api.cdp.coinbase.com/platform/v2"
+    related = [f"{base_url}/evm/accounts", f"{base_url}/evm/accounts/0x123/balances"]
+    unrelated = [f"{base_url}/evm/accounts/0x456", f"{base_url}/solana/accounts"]
+
+    before = [asyncio.create_task(client.call_api("GET", url)) for url in related + unrelated]
+    await asyncio.sleep(0)
+    write = asyncio.create_task(
+        client.call_api("PUT", f"{base_url}/evm/accounts/0x123", body={"name": "new"})
+    )
+    await asyncio.sleep(0)
+    after = [asyncio.create_task(client.call_api("GET", url)) for url in related + unrelated]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*before, write, *after)
+
+    gets = [call.args[1] for call in mock_call_api.call_args_list if call.args[0] == "GET"]
+    assert sorted(gets) == sorted(related * 2 + unrelated)
+
+
+@pytest.mark.asyncio
+@patch.object(ApiClient, "call_api", new_callable=AsyncMock)
+@patch.object(AuthContext, "get_headers", return_value={})
+async def test_call_api_coalescing_disabled_by_default(_, mock_call_api):
+    """Test that identical GET requests aren't coalesced unless enabled."""
+    release = asyncio.Event()
+    mock_call_api.side_effect = _slow_call_api(release)
+    client = _create_client(offload_signing=False)
+    url = "https://api.cdp.coinbase.com/platform/v2/evm/accounts/0x123"
+
+    tasks = [asyncio.create_task(client.call_api("GET", url)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert mock_call_api.call_count == 3
@@ -2,7 +2,7 @@ from unittest.mock import patch
 
 import pytest
 
-from cdp import CdpClient
+from cdp import AccountCache, CdpClient
 
 
 def test_init_with_default_params():
@@ -76,3 +76,28 @@ async def test_close(mock_close):
 
     mock_close.assert_called_once()
     assert result is None
+
+
+@pytest.mark.asyncio
+@patch("cdp.openapi_client.cdp_api_client.CdpApiClient.warm_up")
+async def test_warm_up(mock_warm_up):
+    """Test warming up the client's connections."""
+    mock_warm_up.return_value = 4
+
+    client = CdpClient("api_key_id", "api_key_secret", "wallet_secret")
+    result = await client.warm_up(connections=4)
+
+    mock_warm_up.assert_called_once_with(4)
+    assert result == 4
+
+
+def test_init_with_account_cache():
+    """Test that the account cache is shared by the EVM, Solana and policies clients."""
+    account_cache = AccountCache(ttl=30)
+
+    client = CdpClient("api_key_id", "api_key_secret", "wallet_secret", account_cache=account_cache)
+
+    assert client.account_cache is account_cache
+    assert client.evm.account_cache is account_cache
+    assert client.solana.account_cache is account_cache
+    assert client.policies.account_cache is account_cache
@@ -1,10 +1,11 @@
 import base64
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 from eth_account.typed_transactions import DynamicFeeTransaction
 from web3 import Web3
 
+from cdp.account_cache import AccountCache
 from cdp.api_clients import ApiClients
 from cdp.constants import ImportEvmAccountPublicRSAKey
 from cdp.evm_client import EvmClient
@@ -15,6 +16,7 @@ from cdp.evm_token_balances import (
     ListTokenBalancesResult,
 )
 from cdp.evm_transaction_types import TransactionRequestEIP1559
+from cdp.nonce_manager import NonceManager
 from cdp.openapi_client.cdp_api_client import CdpApiClient
 from cdp.openapi_client.errors import ApiError
 from cdp.openapi_client.models.create_evm_account_request import CreateEvmAccountRequest
@@ -34,6 +36,7 @@ from cdp.openapi_client.models.sign_evm_transaction_request import (
 )
 from cdp.openapi_client.models.sign_evm_typed_data200_response import SignEvmTypedData200Response
 from cdp.update_account_types import UpdateAccountOptions
+from cdp.utils import derive_idempotency_key
 
 
 def test_init():
@@ -79,6 +82,198 @@ async def test_create_account(server_account_model_factory):
     assert result.name == evm_server_account_model.name
 
 
+@pytest.mark.asyncio
+async def test_create_account_with_nonce_manager(server_account_model_factory):
+    """Test that accounts returned by the client share its nonce manager."""
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_accounts.create_evm_account = AsyncMock(
+        return_value=server_account_model_factory()
+    )
+    nonce_manager = NonceManager(AsyncMock(return_value=0))
+
+    client = EvmClient(api_clients=mock_api_clients, nonce_manager=nonce_manager)
+    account = await client.create_account()
+
+    assert account.nonce_manager is nonce_manager
+
+
+@pytest.mark.asyncio
+async def test_create_accounts(server_account_model_factory):
+    """Test creating many EVM accounts with deterministic idempotency keys."""
+    mock_evm_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_accounts = mock_evm_accounts_api
+
+    async def create_evm_account(x_idempotency_key, create_evm_account_request):
+        return server_account_model_factory(name=create_evm_account_request.name)
+
+    mock_evm_accounts_api.create_evm_account = AsyncMock(side_effect=create_evm_account)
+
+    client = EvmClient(api_clients=mock_api_clients)
+
+    operation = client.create_accounts(
+        names=["alice", "bob"], account_policy="123e4567-e89b-12d3-a456-426614174000"
+    )
+    results = dict([result async for result in operation])
+    keys = [
+        call.kwargs["x_idempotency_key"]
+        for call in mock_evm_accounts_api.create_evm_account.call_args_list
+    ]
+
+    assert results[0].name == "alice"
+    assert results[1].name == "bob"
+    assert operation.errors == []
+
+    rerun = [result async for result in client.create_accounts(names=["bob", "alice"])]
+    rerun_keys = [
+        call.kwargs["x_idempotency_key"]
+        for call in mock_evm_accounts_api.create_evm_account.call_args_list[2:]
+    ]
+
+    assert len(rerun) == 2
+    assert sorted(keys) == sorted(
+        derive_idempotency_key(
+            "evm", "create_account", None, name, "123e4567-e89b-12d3-a456-426614174000"
+        )
+        for name in ["alice", "bob"]
+    )
+    assert set(rerun_keys).isdisjoint(keys)
+
+
+@pytest.mark.asyncio
+async def test_create_accounts_by_count(server_account_model_factory):
+    """Test creating a number of unnamed EVM accounts."""
+    mock_evm_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_accounts = mock_evm_accounts_api
+    mock_evm_accounts_api.create_evm_account = AsyncMock(
+        return_value=server_account_model_factory()
+    )
+
+    client = EvmClient(api_clients=mock_api_clients)
+
+    results = [
+        result async for result in client.create_accounts(count=3, idempotency_namespace="batch-1")
+    ]
+    keys = {
+        call.kwargs["x_idempotency_key"]
+        for call in mock_evm_accounts_api.create_evm_account.call_args_list
+    }
+
+    assert len(results) == 3
+    assert keys == {
+        derive_idempotency_key("evm", "create_account", "batch-1", index, None)
+        for index in range(3)
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_accounts_with_count_uses_distinct_keys_per_batch(
+    server_account_model_factory,
+):
+    """Test that separate batches of unnamed accounts without a namespace don't share keys."""
+    mock_evm_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_accounts = mock_evm_accounts_api
+    mock_evm_accounts_api.create_evm_account = AsyncMock(
+        return_value=server_account_model_factory()
+    )
+    client = EvmClient(api_clients=mock_api_clients)
+
+    await client.create_accounts(count=2).collect()
+    await client.create_accounts(count=2).collect()
+
+    keys = [
+        call.kwargs["x_idempotency_key"]
+        for call in mock_evm_accounts_api.create_evm_account.call_args_list
+    ]
+    assert len(set(keys)) == 4
+
+
+def test_create_accounts_requires_names_or_count():
+    """Test that exactly one of names and count must be provided."""
+    client = EvmClient(api_clients=AsyncMock())
+
+    with pytest.raises(ValueError, match="Either names or count must be provided"):
+        client.create_accounts()
+    with pytest.raises(ValueError, match="Either names or count must be provided"):
+        client.create_accounts(names=["alice"], count=1)
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_accounts(server_account_model_factory):
+    """Test getting many EVM accounts by name, creating only the missing ones."""
+    mock_evm_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_accounts = mock_evm_accounts_api
+    lookups = []
+
+    async def get_evm_account_by_name(name):
+        lookups.append(name)
+        if name == "existing" or (name == "raced" and lookups.count(name) > 1):
+            return server_account_model_factory(name=name)
+        raise ApiError(404, "not_found", "Account not found")
+
+    async def create_evm_account(x_idempotency_key, create_evm_account_request):
+        if create_evm_account_request.name == "raced":
+            raise ApiError(409, "already_exists", "Account already exists")
+        return server_account_model_factory(name=create_evm_account_request.name)
+
+    mock_evm_accounts_api.create_evm_account = AsyncMock(side_effect=create_evm_account)
+    mock_evm_accounts_api.get_evm_account_by_name = AsyncMock(side_effect=get_evm_account_by_name)
+
+    client = EvmClient(api_clients=mock_api_clients)
+
+    accounts = await client.get_or_create_accounts(["existing", "new", "raced", "new"])
+
+    assert {name: account.name for name, account in accounts.items()} == {
+        "existing": "existing",
+        "new": "new",
+        "raced": "raced",
+    }
+    mock_evm_accounts_api.list_evm_accounts.assert_not_called()
+    assert sorted(lookups) == ["existing", "new", "raced", "raced"]
+    assert {
+        call.kwargs["x_idempotency_key"]
+        for call in mock_evm_accounts_api.create_evm_account.call_args_list
+    } == {
+        derive_idempotency_key("evm", "create_account", None, name, None)
+        for name in ["new", "raced"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_accounts_pages_for_many_names(server_account_model_factory):
+    """Test that more names than max_lookups are looked up by paging through the accounts."""
+    mock_evm_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_accounts = mock_evm_accounts_api
+    mock_evm_accounts_api.list_evm_accounts = AsyncMock(
+        return_value=MagicMock(
+            accounts=[server_account_model_factory(name="existing")], next_page_token=None
+        )
+    )
+    mock_evm_accounts_api.create_evm_account = AsyncMock(
+        side_effect=lambda x_idempotency_key, create_evm_account_request: (
+            server_account_model_factory(name=create_evm_account_request.name)
+        )
+    )
+
+    client = EvmClient(api_clients=mock_api_clients)
+
+    accounts = await client.get_or_create_accounts(
+        ["existing", "new"], page_size=100, max_lookups=1
+    )
+
+    assert {name: account.name for name, account in accounts.items()} == {
+        "existing": "existing",
+        "new": "new",
+    }
+    mock_evm_accounts_api.list_evm_accounts.assert_called_once_with(page_size=100, page_token=None)
+    mock_evm_accounts_api.get_evm_account_by_name.assert_not_called()
+    mock_evm_accounts_api.create_evm_account.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_create_account_with_policy(server_account_model_factory):
     """Test creating an EVM account with a policy."""
@@ -317,6 +512,39 @@ async def test_list_accounts(server_account_model_factory):
     assert result.next_page_token == "next-page-token"
 
 
+@pytest.mark.asyncio
+async def test_iter_accounts(server_account_model_factory):
+    """Test iterating over EVM accounts across pages."""
+    mock_evm_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_accounts = mock_evm_accounts_api
+
+    first_page = AsyncMock()
+    first_page.accounts = [
+        server_account_model_factory(address="0x1234567890123456789012345678901234567890")
+    ]
+    first_page.next_page_token = "next-page-token"
+    second_page = AsyncMock()
+    second_page.accounts = [
+        server_account_model_factory(address="0x2345678901234567890123456789012345678901")
+    ]
+    second_page.next_page_token = None
+    mock_evm_accounts_api.list_evm_accounts = AsyncMock(side_effect=[first_page, second_page])
+
+    client = EvmClient(api_clients=mock_api_clients)
+
+    accounts = [account async for account in client.iter_accounts(page_size=1)]
+
+    assert [account.address for account in accounts] == [
+        "0x1234567890123456789012345678901234567890",
+        "0x2345678901234567890123456789012345678901",
+    ]
+    assert mock_evm_accounts_api.list_evm_accounts.call_args_list == [
+        call(page_size=1, page_token=None),
+        call(page_size=1, page_token="next-page-token"),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_get_account(server_account_model_factory):
     """Test getting an EVM account by address."""
@@ -598,6 +826,9 @@ async def test_wait_for_user_operation(mock_wait_for_user_operation, smart_accou
         mock_user_operation["hash"],
         30,
         0.5,
+        1.5,
+        2,
+        0.1,
     )
 
     assert result == mock_wait_result
@@ -657,6 +888,104 @@ async def test_sign_message():
     assert result == "0x123"
 
 
+@pytest.mark.asyncio
+async def test_sign_hash_many():
+    """Test signing many EVM hashes, keeping the input order and per-item errors."""
+    mock_evm_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_accounts = mock_evm_accounts_api
+
+    test_address = "0x1234567890123456789012345678901234567890"
+    hashes = [f"0x{i:064x}" for i in range(5)]
+
+    async def sign_evm_hash(address, sign_evm_hash_request, x_idempotency_key):
+        if sign_evm_hash_request.hash == hashes[2]:
+            raise ApiError(400, "invalid_request", "Invalid hash")
+        return MagicMock(signature=f"sig-{sign_evm_hash_request.hash}")
+
+    mock_evm_accounts_api.sign_evm_hash = AsyncMock(side_effect=sign_evm_hash)
+
+    client = EvmClient(api_clients=mock_api_clients)
+
+    operation = client.sign_hash_many(test_address, hashes, concurrency=3)
+    signatures = await operation.collect()
+
+    assert signatures == [
+        f"sig-{hashes[0]}",
+        f"sig-{hashes[1]}",
+        None,
+        f"sig-{hashes[3]}",
+        f"sig-{hashes[4]}",
+    ]
+    assert [(error.index, error.item) for error in operation.errors] == [(2, hashes[2])]
+    assert {
+        call.kwargs["x_idempotency_key"]
+        for call in mock_evm_accounts_api.sign_evm_hash.call_args_list
+    } == {
+        derive_idempotency_key("evm", "sign_hash", None, test_address, index, hash)
+        for index, hash in enumerate(hashes)
+    }
+
+
+@pytest.mark.asyncio
+async def test_sign_message_many():
+    """Test signing many EVM messages in input order."""
+    mock_evm_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_accounts = mock_evm_accounts_api
+
+    async def sign_evm_message(address, sign_evm_message_request, x_idempotency_key):
+        return MagicMock(signature=f"sig-{sign_evm_message_request.message}")
+
+    mock_evm_accounts_api.sign_evm_message = AsyncMock(side_effect=sign_evm_message)
+
+    client = EvmClient(api_clients=mock_api_clients)
+
+    signatures = await client.sign_message_many(
+        "0x1234567890123456789012345678901234567890",
+        ["one", "two", "three"],
+        idempotency_namespace="batch-1",
+    ).collect()
+
+    assert signatures == ["sig-one", "sig-two", "sig-three"]
+
+
+@pytest.mark.asyncio
+async def test_sign_typed_data_many():
+    """Test signing many EVM typed data messages in input order."""
+    mock_evm_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_accounts = mock_evm_accounts_api
+
+    domain = EIP712Domain(name="Test", chain_id=1)
+    types = {
+        "EIP712Domain": [{"name": "name", "type": "string"}, {"name": "chainId", "type": "uint256"}]
+    }
+    messages = [
+        EIP712Message(
+            domain=domain,
+            types=types,
+            primary_type="EIP712Domain",
+            message={"name": f"Test {i}", "chainId": 1},
+        )
+        for i in range(3)
+    ]
+
+    async def sign_evm_typed_data(address, eip712_message, x_idempotency_key):
+        return MagicMock(signature=f"sig-{eip712_message.message['name']}")
+
+    mock_evm_accounts_api.sign_evm_typed_data = AsyncMock(side_effect=sign_evm_typed_data)
+
+    client = EvmClient(api_clients=mock_api_clients)
+
+    signatures = await client.sign_typed_data_many(
+        "0x1234567890123456789012345678901234567890", messages
+    ).collect()
+
+    assert signatures == ["sig-Test 0", "sig-Test 1", "sig-Test 2"]
+    assert mock_evm_accounts_api.sign_evm_typed_data.call_args.kwargs["eip712_message"] in messages
+
+
 @pytest.mark.asyncio
 async def test_sign_typed_data():
     """Test signing an EVM typed data."""
@@ -867,6 +1196,32 @@ async def test_list_smart_accounts(smart_account_model_factory):
     assert result.next_page_token == "next-page-token"
 
 
+@pytest.mark.asyncio
+async def test_iter_smart_accounts(smart_account_model_factory):
+    """Test iterating over EVM smart accounts across pages."""
+    mock_evm_smart_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_smart_accounts = mock_evm_smart_accounts_api
+
+    smart_account_model = smart_account_model_factory()
+    first_page = AsyncMock()
+    first_page.accounts = [smart_account_model]
+    first_page.next_page_token = "next-page-token"
+    second_page = AsyncMock()
+    second_page.accounts = [smart_account_model]
+    second_page.next_page_token = None
+    mock_evm_smart_accounts_api.list_evm_smart_accounts = AsyncMock(
+        side_effect=[first_page, second_page]
+    )
+
+    client = EvmClient(api_clients=mock_api_clients)
+
+    accounts = [account async for account in client.iter_smart_accounts()]
+
+    assert accounts == [smart_account_model, smart_account_model]
+    assert mock_evm_smart_accounts_api.list_evm_smart_accounts.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_prepare_user_operation():
     """Test preparing a user operation."""
@@ -999,3 +1354,114 @@ async def test_list_token_balances(evm_token_balances_model_factory):
     )
 
     assert result == expected_result
+
+
+@pytest.mark.asyncio
+async def test_get_account_uses_account_cache(server_account_model_factory):
+    """Test that account lookups by address or name are served from the account cache."""
+    mock_evm_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_accounts = mock_evm_accounts_api
+    evm_server_account_model = server_account_model_factory()
+    mock_evm_accounts_api.get_evm_account = AsyncMock(return_value=evm_server_account_model)
+    account_cache = AccountCache()
+    client = EvmClient(api_clients=mock_api_clients, account_cache=account_cache)
+
+    await client.get_account(address=evm_server_account_model.address.upper().replace("0X", "0x"))
+    result = await client.get_account(address=evm_server_account_model.address)
+    by_name = await client.get_account(name=evm_server_account_model.name)
+
+    mock_evm_accounts_api.get_evm_account.assert_called_once()
+    mock_evm_accounts_api.get_evm_account_by_name.assert_not_called()
+    assert result.address == evm_server_account_model.address
+    assert by_name.address == evm_server_account_model.address
+    assert account_cache.hits == 2
+    assert account_cache.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_update_account_refreshes_account_cache(server_account_model_factory):
+    """Test that updating an account replaces its cached address and name entries."""
+    mock_evm_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_accounts = mock_evm_accounts_api
+    old_model = server_account_model_factory(name="old-name")
+    new_model = server_account_model_factory(name="new-name")
+    mock_evm_accounts_api.get_evm_account_by_name = AsyncMock(return_value=old_model)
+    mock_evm_accounts_api.update_evm_account = AsyncMock(return_value=new_model)
+    account_cache = AccountCache()
+    client = EvmClient(api_clients=mock_api_clients, account_cache=account_cache)
+    await client.get_account(name="old-name")
+
+    await client.update_account(old_model.address, UpdateAccountOptions(name="new-name"))
+
+    assert account_cache.get(("evm", "name", "old-name")) is None
+    assert (await client.get_account(name="new-name")).name == "new-name"
+    assert (await client.get_account(address=old_model.address)).name == "new-name"
+    mock_evm_accounts_api.get_evm_account_by_name.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_account_populates_account_cache(server_account_model_factory):
+    """Test that created accounts are cached, so get_or_create_account needs no lookup."""
+    mock_evm_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_accounts = mock_evm_accounts_api
+    evm_server_account_model = server_account_model_factory()
+    mock_evm_accounts_api.create_evm_account = AsyncMock(return_value=evm_server_account_model)
+    client = EvmClient(api_clients=mock_api_clients, account_cache=AccountCache())
+
+    await client.create_account(name=evm_server_account_model.name)
+    result = await client.get_or_create_account(name=evm_server_account_model.name)
+
+    assert result.address == evm_server_account_model.address
+    mock_evm_accounts_api.get_evm_account_by_name.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_smart_account_uses_account_cache(smart_account_model_factory):
+    """Test that smart account lookups are served from the account cache."""
+    mock_evm_smart_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_smart_accounts = mock_evm_smart_accounts_api
+    evm_smart_account_model = smart_account_model_factory()
+    mock_evm_smart_accounts_api.get_evm_smart_account = AsyncMock(
+        return_value=evm_smart_account_model
+    )
+    client = EvmClient(api_clients=mock_api_clients, account_cache=AccountCache())
+
+    await client.get_smart_account(evm_smart_account_model.address)
+    result = await client.get_smart_account(evm_smart_account_model.address)
+
+    mock_evm_smart_accounts_api.get_evm_smart_account.assert_called_once()
+    assert result.address == evm_smart_account_model.address
+
+
+@pytest.mark.asyncio
+async def test_iter_token_balances(evm_token_balances_model_factory):
+    """Test iterating over EVM token balances across pages."""
+    mock_evm_token_balances_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.evm_token_balances = mock_evm_token_balances_api
+    mock_evm_token_balances_api.list_evm_token_balances = AsyncMock(
+        side_effect=[
+            evm_token_balances_model_factory(next_page_token="next-page-token"),
+            evm_token_balances_model_factory(next_page_token=None),
+        ]
+    )
+
+    client = EvmClient(api_clients=mock_api_clients)
+    test_address = "0x1234567890123456789012345678901234567890"
+
+    balances = [
+        balance
+        async for balance in client.iter_token_balances(
+            address=test_address, network="base-sepolia", page_size=50
+        )
+    ]
+
+    assert len(balances) == 2
+    assert balances[0].token.symbol == "TEST"
+    mock_evm_token_balances_api.list_evm_token_balances.assert_called_with(
+        address=test_address, network="base-sepolia", page_size=50, page_token="next-page-token"
+    )
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from cdp.actions.evm.fund.quote import Quote
+from cdp.actions.evm.transfer import smart_account_transfer_strategy
 from cdp.api_clients import ApiClients
 from cdp.evm_call_types import FunctionCall
 from cdp.evm_smart_account import EvmSmartAccount
@@ -114,23 +115,18 @@ async def test_list_token_balances(smart_account_factory, evm_token_balances_mod
 
 
 @pytest.mark.asyncio
-@patch("cdp.actions.evm.send_user_operation.Web3")
+@patch("cdp.actions.evm.send_user_operation.encode_function_call")
 @patch("cdp.actions.evm.send_user_operation.ensure_awaitable")
 @patch("cdp.cdp_client.ApiClients")
 async def test_send_user_operation(
     mock_api_clients,
     mock_ensure_awaitable,
-    mock_web3,
+    mock_encode_function_call,
     smart_account_model_factory,
     local_account_factory,
 ):
     """Test send_user_operation method."""
-    mock_contract = MagicMock()
-    mock_contract.encode_abi.return_value = "0x1234abcd"
-
-    mock_web3_instance = MagicMock()
-    mock_web3_instance.eth.contract.return_value = mock_contract
-    mock_web3.return_value = mock_web3_instance
+    mock_encode_function_call.return_value = "0x1234abcd"
 
     mock_user_op = MagicMock(spec=EvmUserOperation)
     mock_user_op.user_op_hash = "0xuserhash123"
@@ -257,6 +253,44 @@ async def test_request_faucet(smart_account_model_factory):
     assert result == "0x123"
 
 
+@pytest.mark.asyncio
+async def test_transfer_many(smart_account_model_factory, local_account_factory):
+    """Test transfer_many method resolves recipient accounts and delegates to the strategy."""
+    smart_account_model = smart_account_model_factory()
+    mock_api_clients = MagicMock(spec=ApiClients)
+    smart_account = EvmSmartAccount(
+        smart_account_model.address,
+        smart_account_model.owners[0],
+        smart_account_model.name,
+        mock_api_clients,
+    )
+    receiver = local_account_factory()
+
+    with patch.object(
+        smart_account_transfer_strategy,
+        "execute_transfer_many",
+        new_callable=AsyncMock,
+        return_value={},
+    ) as mock_execute_transfer_many:
+        await smart_account.transfer_many(
+            [(receiver, 1), ("0x2345678901234567890123456789012345678901", 2)],
+            token="usdc",
+            network="base-sepolia",
+            max_calls_per_user_operation=10,
+        )
+
+    mock_execute_transfer_many.assert_called_once_with(
+        api_clients=mock_api_clients,
+        from_account=smart_account,
+        transfers=[(receiver.address, 1), ("0x2345678901234567890123456789012345678901", 2)],
+        token="usdc",
+        network="base-sepolia",
+        paymaster_url=None,
+        max_calls_per_user_operation=10,
+        max_calldata_size=None,
+    )
+
+
 @pytest.mark.asyncio
 async def test_quote_fund_transfer_usdc(
     smart_account_factory, payment_transfer_model_factory, payment_method_model_factory
@@ -0,0 +1,210 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from eth_account.typed_transactions import DynamicFeeTransaction
+
+from cdp.actions.evm.send_transaction import send_transaction
+from cdp.evm_transaction_types import TransactionRequestEIP1559
+from cdp.nonce_manager import NonceManager
+from cdp.openapi_client.errors import ApiError
+from cdp.utils import serialize_unsigned_transaction
+
+ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+def _nonce_too_low():
+    return ApiError(400, "invalid_request", "nonce too low")
+
+
+@pytest.mark.asyncio
+async def test_allocates_consecutive_nonces_from_the_pending_count():
+    """Test that nonces are fetched once and then allocated locally."""
+    get_transaction_count = AsyncMock(return_value=7)
+    manager = NonceManager(get_transaction_count)
+
+    nonces = await asyncio.gather(*(manager.allocate(ADDRESS, "base") for _ in range(5)))
+
+    assert sorted(nonces) == [7, 8, 9, 10, 11]
+    get_transaction_count.assert_awaited_once_with(ADDRESS, "base")
+    assert await manager.allocate(ADDRESS, "base") == 12
+    assert await manager.allocate(ADDRESS, "base-sepolia") == 7
+
+
+@pytest.mark.asyncio
+async def test_released_nonces_are_allocated_again_first():
+    """Test that a released nonce fills the gap before new nonces are allocated."""
+    manager = NonceManager(AsyncMock(return_value=0))
+    for _ in range(4):
+        await manager.allocate(ADDRESS, "base")
+
+    manager.release(ADDRESS, "base", 1)
+    manager.release(ADDRESS, "base", 3)
+
+    assert [await manager.allocate(ADDRESS, "base") for _ in range(3)] == [1, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_send_pipelines_sends_with_distinct_nonces():
+    """Test that concurrent sends get distinct nonces and don't wait for each other."""
+    manager = NonceManager(AsyncMock(return_value=0))
+    in_flight = 0
+    max_in_flight = 0
+
+    async def send(nonce):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return nonce
+
+    nonces = await asyncio.gather(*(manager.send(ADDRESS, "base", send) for _ in range(10)))
+
+    assert sorted(nonces) == list(range(10))
+    assert max_in_flight == 10
+
+
+@pytest.mark.asyncio
+async def test_send_releases_the_nonce_of_a_failed_send():
+    """Test that a send that fails for another reason doesn't leave a gap."""
+    manager = NonceManager(AsyncMock(return_value=0))
+    send = AsyncMock(side_effect=ApiError(400, "invalid_request", "Insufficient funds"))
+
+    with pytest.raises(ApiError, match="Insufficient funds"):
+        await manager.send(ADDRESS, "base", send)
+
+    assert await manager.allocate(ADDRESS, "base") == 0
+
+
+@pytest.mark.asyncio
+async def test_send_resyncs_and_retries_after_a_nonce_error():
+    """Test that a rejected nonce resynchronizes from the pending count and retries."""
+    get_transaction_count = AsyncMock(side_effect=[0, 5])
+    manager = NonceManager(get_transaction_count)
+    await manager.allocate(ADDRESS, "base")
+    send = AsyncMock(side_effect=[_nonce_too_low(), "0xhash"])
+
+    assert await manager.send(ADDRESS, "base", send) == "0xhash"
+    assert [call.args[0] for call in send.call_args_list] == [1, 5]
+    assert await manager.allocate(ADDRESS, "base") == 6
+
+
+@pytest.mark.asyncio
+async def test_send_resyncs_once_for_concurrent_nonce_errors():
+    """Test that sends rejected together share a single resynchronization."""
+    get_transaction_count = AsyncMock(side_effect=[0, 3])
+    manager = NonceManager(get_transaction_count)
+    rejected = set()
+
+    async def send(nonce):
+        await asyncio.sleep(0)
+        if nonce < 3 and nonce not in rejected:
+            rejected.add(nonce)
+            raise _nonce_too_low()
+        return nonce
+
+    nonces = await asyncio.gather(*(manager.send(ADDRESS, "base", send) for _ in range(3)))
+
+    assert sorted(nonces) == [3, 4, 5]
+    assert get_transaction_count.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_send_gives_up_after_max_nonce_retries():
+    """Test that a nonce that keeps being rejected is raised."""
+    manager = NonceManager(AsyncMock(side_effect=[0, 1, 2]), max_nonce_retries=2)
+    send = AsyncMock(side_effect=_nonce_too_low())
+
+    with pytest.raises(ApiError, match="nonce too low"):
+        await manager.send(ADDRESS, "base", send)
+
+    assert send.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_send_doesnt_retry_when_the_pending_count_matches_the_nonce():
+    """Test that an error of a nonce error type isn't retried when the nonce was right."""
+    get_transaction_count = AsyncMock(return_value=0)
+    manager = NonceManager(get_transaction_count)
+    send = AsyncMock(side_effect=ApiError(400, "invalid_request", "Gas limit too low"))
+
+    with pytest.raises(ApiError, match="Gas limit too low"):
+        await manager.send(ADDRESS, "base", send)
+
+    assert send.await_count == 1
+    assert get_transaction_count.await_count == 2
+    assert await manager.allocate(ADDRESS, "base") == 0
+
+
+@pytest.mark.asyncio
+async def test_send_matches_nonce_errors_by_error_type():
+    """Test that only the configured error types are treated as nonce errors."""
+    get_transaction_count = AsyncMock(side_effect=[0, 5])
+    manager = NonceManager(get_transaction_count)
+    send = AsyncMock(side_effect=ApiError(403, "policy_violation", "nonce is not allowed"))
+
+    with pytest.raises(ApiError, match="nonce is not allowed"):
+        await manager.send(ADDRESS, "base", send)
+
+    assert send.await_count == 1
+    get_transaction_count.assert_awaited_once()
+    assert await manager.allocate(ADDRESS, "base") == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [
+        ApiError(503, "service_unavailable", "Service unavailable"),
+        ApiError(None, "network_timeout", "Request timed out"),
+        asyncio.TimeoutError(),
+    ],
+)
+async def test_send_resyncs_after_a_send_that_may_have_gone_through(error):
+    """Test that the nonce of a send without a definite answer isn't reused blindly."""
+    get_transaction_count = AsyncMock(side_effect=[0, 3])
+    manager = NonceManager(get_transaction_count)
+    await manager.allocate(ADDRESS, "base")
+    await manager.allocate(ADDRESS, "base")
+
+    with pytest.raises(type(error)):
+        await manager.send(ADDRESS, "base", AsyncMock(side_effect=error))
+
+    assert await manager.allocate(ADDRESS, "base") == 3
+    assert get_transaction_count.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_send_transaction_assigns_nonces_with_the_nonce_manager():
+    """Test that send_transaction sets the nonce of a transaction request without one."""
+    evm_accounts = MagicMock()
+    evm_accounts.send_evm_transaction = AsyncMock(
+        side_effect=[_nonce_too_low(), MagicMock(transaction_hash="0xhash")]
+    )
+    manager = NonceManager(AsyncMock(side_effect=[4, 9]))
+
+    transaction_hash = await send_transaction(
+        evm_accounts,
+        ADDRESS,
+        TransactionRequestEIP1559(to=ADDRESS, value=1),
+        "base-sepolia",
+        idempotency_key="key",
+        nonce_manager=manager,
+    )
+
+    calls = evm_accounts.send_evm_transaction.call_args_list
+    transactions = [call.kwargs["send_evm_transaction_request"].transaction for call in calls]
+    keys = [call.kwargs["x_idempotency_key"] for call in calls]
+
+    assert transaction_hash == "0xhash"
+    assert transactions == [
+        serialize_unsigned_transaction(
+            DynamicFeeTransaction.from_dict(
+                TransactionRequestEIP1559(to=ADDRESS, value=1, nonce=nonce).as_dict()
+            )
+        )
+        for nonce in [4, 9]
+    ]
+    assert keys[0] == "key"
+    assert keys[1] != "key"
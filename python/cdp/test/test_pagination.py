@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from cdp.pagination import paginate
+
+
+class _Page(BaseModel):
+    items: list[int]
+    next_page_token: str | None = None
+
+
+_PAGES = {
+    None: _Page(items=[1, 2], next_page_token="2"),
+    "2": _Page(items=[3, 4], next_page_token="3"),
+    "3": _Page(items=[5]),
+}
+
+
+@pytest.mark.asyncio
+async def test_paginate_follows_next_page_tokens():
+    """Test that every page is yielded in order until there is no next page token."""
+    tokens = []
+
+    async def fetch_page(page_token):
+        tokens.append(page_token)
+        return _PAGES[page_token]
+
+    pages = [page async for page in paginate(fetch_page)]
+
+    assert [page.items for page in pages] == [[1, 2], [3, 4], [5]]
+    assert tokens == [None, "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_paginate_starts_from_page_token():
+    """Test that iteration can start from a given page token."""
+
+    async def fetch_page(page_token):
+        return _PAGES[page_token]
+
+    pages = [page async for page in paginate(fetch_page, page_token="3")]
+
+    assert [page.items for page in pages] == [[5]]
+
+
+@pytest.mark.asyncio
+async def test_paginate_prefetches_next_page():
+    """Test that the next page is fetched while the caller processes the current one."""
+    events = []
+
+    async def fetch_page(page_token):
+        events.append(f"fetch {page_token}")
+        await asyncio.sleep(0.01)
+        return _PAGES[page_token]
+
+    async for page in paginate(fetch_page):
+        events.append(f"start {page.items}")
+        await asyncio.sleep(0.02)
+        events.append(f"end {page.items}")
+
+    assert events[:4] == ["fetch None", "start [1, 2]", "fetch 2", "end [1, 2]"]
+
+
+@pytest.mark.asyncio
+async def test_paginate_cancels_prefetch_when_closed():
+    """Test that closing the iterator early cancels the prefetched page."""
+    cancelled = asyncio.Event()
+
+    async def fetch_page(page_token):
+        if page_token is None:
+            return _PAGES[None]
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    pages = paginate(fetch_page)
+    first = await pages.__anext__()
+    await asyncio.sleep(0)
+    await pages.aclose()
+
+    assert first.items == [1, 2]
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_paginate_raises_fetch_errors():
+    """Test that an error fetching a page is raised to the caller."""
+
+    async def fetch_page(page_token):
+        if page_token is None:
+            return _PAGES[None]
+        raise ValueError("boom")
+
+    items = []
+    with pytest.raises(ValueError, match="boom"):
+        async for page in paginate(fetch_page):
+            items.extend(page.items)
+
+    assert items == [1, 2]
@@ -2,6 +2,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from cdp.account_cache import AccountCache
 from cdp.api_clients import ApiClients
 from cdp.openapi_client.cdp_api_client import CdpApiClient
 from cdp.openapi_client.models.create_policy_request import CreatePolicyRequest
@@ -188,3 +189,56 @@ async def test_list_policies(openapi_policy_model_factory, policy_model_factory)
     )
     assert result.policies == [policy_model]
     assert result.next_page_token is None
+
+
+@pytest.mark.asyncio
+async def test_iter_policies(openapi_policy_model_factory, policy_model_factory):
+    """Test iterating over policies across pages."""
+    openapi_policy_model = openapi_policy_model_factory()
+    mock_policies_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.policies = mock_policies_api
+    mock_policies_api.list_policies = AsyncMock(
+        side_effect=[
+            ListPolicies200Response(
+                policies=[openapi_policy_model], next_page_token="next-page-token"
+            ),
+            ListPolicies200Response(policies=[openapi_policy_model], next_page_token=None),
+        ]
+    )
+
+    client = PoliciesClient(api_clients=mock_api_clients)
+
+    policies = [policy async for policy in client.iter_policies(page_size=10, scope="project")]
+
+    assert policies == [policy_model_factory(), policy_model_factory()]
+    mock_policies_api.list_policies.assert_called_with(
+        page_size=10,
+        page_token="next-page-token",
+        scope="project",
+    )
+
+
+@pytest.mark.asyncio
+async def test_policy_changes_clear_account_cache(
+    openapi_policy_model_factory, policy_model_factory
+):
+    """Test that updating or deleting a policy clears the account cache."""
+    mock_policies_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.policies = mock_policies_api
+    mock_policies_api.update_policy = AsyncMock(return_value=openapi_policy_model_factory())
+    mock_policies_api.delete_policy = AsyncMock(return_value=None)
+    account_cache = AccountCache()
+    client = PoliciesClient(api_clients=mock_api_clients, account_cache=account_cache)
+    policy_model = policy_model_factory()
+
+    account_cache.set([("evm", "address", "0x1")], "account")
+    await client.update_policy(
+        "123", UpdatePolicyOptions(description=policy_model.description, rules=policy_model.rules)
+    )
+    assert len(account_cache) == 0
+
+    account_cache.set([("evm", "address", "0x1")], "account")
+    await client.delete_policy("123")
+    assert len(account_cache) == 0
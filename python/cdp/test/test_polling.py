@@ -0,0 +1,135 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from cdp.polling import poll_until
+
+
+def _scripted_poll(results):
+    """Return a poll function that returns the given results in order."""
+    return AsyncMock(side_effect=results)
+
+
+@pytest.mark.asyncio
+async def test_poll_until_backs_off_up_to_max_interval():
+    """Test that the interval grows by the backoff multiplier and is capped."""
+    poll = _scripted_poll(["pending"] * 5 + ["done"])
+
+    with patch("cdp.polling.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        result = await poll_until(
+            poll,
+            lambda status: status == "done",
+            timeout_seconds=60,
+            interval_seconds=1,
+            backoff_multiplier=2,
+            max_interval_seconds=5,
+        )
+
+    assert result == "done"
+    assert poll.call_count == 6
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2, 4, 5, 5]
+
+
+@pytest.mark.asyncio
+async def test_poll_until_applies_jitter():
+    """Test that each interval is randomly scaled by up to the jitter fraction."""
+    poll = _scripted_poll(["pending", "done"])
+
+    with (
+        patch("cdp.polling.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        patch("cdp.polling.random.uniform", return_value=1.2) as mock_uniform,
+    ):
+        await poll_until(
+            poll,
+            lambda status: status == "done",
+            timeout_seconds=60,
+            interval_seconds=1,
+            jitter=0.2,
+        )
+
+    mock_uniform.assert_called_once_with(0.8, 1.2)
+    mock_sleep.assert_called_once_with(1.2)
+
+
+@pytest.mark.asyncio
+async def test_poll_until_does_not_sleep_past_deadline():
+    """Test that the last wait is shortened so that the final poll happens at the deadline."""
+    poll = _scripted_poll(["pending"] * 3)
+
+    with (
+        patch("cdp.polling.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        patch("cdp.polling.time.monotonic", side_effect=[0, 0, 8, 10]),
+        pytest.raises(TimeoutError, match="still pending"),
+    ):
+        await poll_until(
+            poll,
+            lambda status: status == "done",
+            timeout_seconds=10,
+            interval_seconds=5,
+            timeout_message="still pending",
+        )
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [5, 2]
+    assert poll.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_poll_until_does_not_block_event_loop():
+    """Test that other coroutines keep running while waiting."""
+    ticks = []
+
+    async def ticker():
+        for _ in range(3):
+            ticks.append(len(ticks))
+            await asyncio.sleep(0.01)
+
+    poll = _scripted_poll(["pending", "done"])
+
+    await asyncio.gather(
+        poll_until(poll, lambda status: status == "done", timeout_seconds=1, interval_seconds=0.05),
+        ticker(),
+    )
+
+    assert ticks == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_poll_until_can_be_cancelled():
+    """Test that cancelling the waiting task stops polling."""
+
+    async def poll():
+        return "pending"
+
+    poll_mock = AsyncMock(side_effect=poll)
+    task = asyncio.create_task(
+        poll_until(
+            poll_mock, lambda status: status == "done", timeout_seconds=60, interval_seconds=10
+        )
+    )
+    await asyncio.sleep(0.01)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert poll_mock.call_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"interval_seconds": -1}, "interval_seconds must not be negative"),
+        ({"backoff_multiplier": 0.5}, "backoff_multiplier must be at least 1"),
+        ({"jitter": 1}, "jitter must be between 0 and 1"),
+    ],
+)
+async def test_poll_until_rejects_invalid_arguments(kwargs, message):
+    """Test that out-of-range arguments are rejected before polling."""
+    poll = _scripted_poll(["done"])
+    kwargs = {"timeout_seconds": 1, "interval_seconds": 1, **kwargs}
+
+    with pytest.raises(ValueError, match=message):
+        await poll_until(poll, lambda status: status == "done", **kwargs)
+
+    poll.assert_not_called()
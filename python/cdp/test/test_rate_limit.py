@@ -0,0 +1,157 @@
+import time
+
+import pytest
+from aiohttp import web
+from pydantic import ValidationError
+
+from cdp.openapi_client.cdp_api_client import CdpApiClient
+from cdp.openapi_client.configuration import Configuration
+from cdp.transport.rate_limit import (
+    AdaptiveRateLimiter,
+    RateLimiter,
+    get_endpoint_group,
+)
+from cdp.transport.rest import TransportRESTClientObject
+from cdp.transport_types import RateLimitOptions, TransportOptions
+
+
+@pytest.mark.parametrize(
+    "path, group",
+    [
+        ("/platform/v2/evm/accounts", "accounts"),
+        ("/platform/v2/evm/accounts/by-name/test", "accounts"),
+        ("/platform/v2/solana/accounts/abc", "accounts"),
+        ("/platform/v2/evm/smart-accounts/0x123/user-operations", "accounts"),
+        ("/platform/v2/evm/accounts/0x123/sign", "signing"),
+        ("/platform/v2/evm/accounts/0x123/sign/typed-data", "signing"),
+        ("/platform/v2/evm/accounts/0x123/send/transaction", "signing"),
+        ("/platform/v2/evm/smart-accounts/0x123/user-operations/0xabc/send", "signing"),
+        ("/platform/v2/solana/accounts/abc/sign/transaction", "signing"),
+        ("/platform/v2/policy-engine/policies/abc", "policies"),
+        ("/platform/v2/payments/transfers/abc/execute", "payments"),
+        ("/platform/v2/evm/faucet", "faucets"),
+        ("/platform/v2/evm/token-balances/base/0x123", "other"),
+    ],
+)
+def test_get_endpoint_group(path, group):
+    """Test that request paths are assigned to their endpoint group."""
+    assert get_endpoint_group(path) == group
+
+
+@pytest.mark.asyncio
+async def test_acquire_limits_rate_after_burst():
+    """Test that requests beyond the burst are spaced out at the current rate."""
+    limiter = AdaptiveRateLimiter(max_rate=50, burst=2)
+
+    start = time.monotonic()
+    for _ in range(5):
+        await limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    # 2 requests go out at once, the remaining 3 are spaced 20ms apart
+    assert elapsed >= 0.05
+
+
+def test_record_throttled_decreases_rate():
+    """Test that throttled responses shrink the rate multiplicatively, once per cooldown."""
+    limiter = AdaptiveRateLimiter(max_rate=100, min_rate=30, cooldown=60)
+
+    limiter.record(429)
+    assert limiter.rate == 50
+
+    limiter.record(503)
+    assert limiter.rate == 50
+
+    limiter._last_decrease -= 60
+    limiter.record(429)
+    assert limiter.rate == 30
+
+
+def test_record_success_increases_rate():
+    """Test that successful responses grow the rate back up to the maximum."""
+    limiter = AdaptiveRateLimiter(max_rate=10, increase_step=2)
+    limiter.record(429)
+    assert limiter.rate == 5
+
+    limiter.record(200)
+    assert limiter.rate == pytest.approx(5.4)
+
+    for _ in range(100):
+        limiter.record(201)
+    assert limiter.rate == 10
+
+
+def test_record_ignores_client_errors():
+    """Test that client errors other than 429 don't change the rate."""
+    limiter = AdaptiveRateLimiter(max_rate=10)
+    limiter.record(429)
+
+    limiter.record(404)
+
+    assert limiter.rate == 5
+
+
+def test_rate_limiter_rates():
+    """Test that the rate limiter reports the rate of each limited group."""
+    rate_limiter = RateLimiter(
+        {
+            "signing": AdaptiveRateLimiter(max_rate=20),
+            "accounts": AdaptiveRateLimiter(max_rate=5),
+        }
+    )
+
+    assert rate_limiter.rates == {"signing": 20, "accounts": 5}
+    assert (
+        rate_limiter.get_limiter("https://api.cdp.coinbase.com/platform/v2/evm/accounts/0x1/sign")
+        is rate_limiter.limiters["signing"]
+    )
+    assert rate_limiter.get_limiter("https://api.cdp.coinbase.com/platform/v2/evm/faucet") is None
+
+
+def test_transport_options_reject_unknown_group():
+    """Test that rate limits can only be configured for known endpoint groups."""
+    with pytest.raises(ValidationError, match="Unknown endpoint group: wallets"):
+        TransportOptions(rate_limits={"wallets": RateLimitOptions(max_rate=10)})
+
+
+def test_cdp_api_client_builds_rate_limiter():
+    """Test that the rate limits in the transport options configure the rate limiter."""
+    client = CdpApiClient(
+        api_key_id="test_api_key_id",
+        api_key_secret="test_api_key_secret",
+        transport_options=TransportOptions(
+            rate_limits={"signing": RateLimitOptions(max_rate=25, min_rate=2, burst=5)}
+        ),
+    )
+
+    limiter = client.rate_limiter.limiters["signing"]
+    assert client.rest_client.rate_limiter is client.rate_limiter
+    assert limiter.max_rate == 25
+    assert limiter.min_rate == 2
+    assert limiter.burst == 5
+    assert client.rate_limiter.rates == {"signing": 25}
+
+
+def test_cdp_api_client_rate_limiter_disabled_by_default():
+    """Test that requests aren't rate limited unless rate limits are configured."""
+    client = CdpApiClient(api_key_id="test_api_key_id", api_key_secret="test_api_key_secret")
+
+    assert client.rate_limiter is None
+
+
+@pytest.mark.asyncio
+async def test_request_adapts_rate_to_throttling(http_server_factory):
+    """Test that the transport shrinks the rate on 429 responses and waits for tokens."""
+
+    async def handler(request):
+        return web.Response(status=429, text="{}")
+
+    base_url = await http_server_factory(handler)
+    rate_limiter = RateLimiter({"accounts": AdaptiveRateLimiter(max_rate=40)})
+    rest_client = TransportRESTClientObject(Configuration(), rate_limiter=rate_limiter)
+
+    response = await rest_client.request("GET", f"{base_url}/v2/evm/accounts")
+
+    assert response.status == 429
+    assert rate_limiter.rates == {"accounts": 20}
+    await rest_client.close()
@@ -0,0 +1,186 @@
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from cdp.api_clients import ApiClients
+from cdp.openapi_client.api.evm_smart_accounts_api import EVMSmartAccountsApi
+from cdp.openapi_client.api.payments_alpha_api import PaymentsAlphaApi
+from cdp.openapi_client.cdp_api_client import CdpApiClient
+from cdp.openapi_client.models.evm_call import EvmCall
+from cdp.openapi_client.models.evm_user_operation import EvmUserOperation
+from cdp.result_cache import (
+    CachedEVMSmartAccountsApi,
+    CachedPaymentsAlphaApi,
+    InMemoryResultCache,
+    SqliteResultCache,
+)
+
+SMART_ACCOUNT_ADDRESS = "0x1234567890123456789012345678901234567890"
+USER_OP_HASH = "0x" + "ab" * 32
+
+
+def _create_user_operation(status: str) -> EvmUserOperation:
+    return EvmUserOperation(
+        network="base-sepolia",
+        user_op_hash=USER_OP_HASH,
+        calls=[EvmCall(to=SMART_ACCOUNT_ADDRESS, value="0", data="0x")],
+        status=status,
+    )
+
+
+@pytest.fixture
+def cdp_api_client():
+    """Create and return a CDP API client."""
+    return CdpApiClient(api_key_id="test_api_key_id", api_key_secret="test_api_key_secret")
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def result_cache(request, tmp_path):
+    """Create and return each kind of result cache."""
+    if request.param == "memory":
+        cache = InMemoryResultCache()
+    else:
+        cache = SqliteResultCache(str(tmp_path / "results.db"))
+    yield cache
+    cache.close()
+
+
+def test_get_and_set(result_cache):
+    """Test that results can be cached and read back."""
+    assert result_cache.get("key") is None
+
+    result_cache.set("key", '{"status": "complete"}')
+    result_cache.set("key", '{"status": "failed"}')
+
+    assert result_cache.get("key") == '{"status": "failed"}'
+    assert len(result_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_get_and_set(result_cache):
+    """Test that results can be cached and read back from a coroutine."""
+    assert await result_cache.aget("key") is None
+
+    await result_cache.aset("key", '{"status": "complete"}')
+
+    assert await result_cache.aget("key") == '{"status": "complete"}'
+    assert result_cache.get("key") == '{"status": "complete"}'
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_runs_queries_off_the_event_loop(tmp_path):
+    """Test that the SQLite cache doesn't block the event loop on its queries."""
+    cache = SqliteResultCache(str(tmp_path / "results.db"))
+    loop_thread = threading.get_ident()
+    query_threads = []
+    get = cache.get
+
+    def record_thread(key):
+        query_threads.append(threading.get_ident())
+        return get(key)
+
+    with patch.object(cache, "get", side_effect=record_thread):
+        await cache.aset("key", "value")
+        assert await cache.aget("key") == "value"
+
+    assert query_threads and loop_thread not in query_threads
+    cache.close()
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    """Test that the in-memory cache evicts the least recently used results when full."""
+    cache = InMemoryResultCache(max_size=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+
+
+def test_in_memory_cache_rejects_invalid_size():
+    """Test that the maximum size of the in-memory cache must be positive."""
+    with pytest.raises(ValueError, match="max_size must be positive"):
+        InMemoryResultCache(max_size=0)
+
+
+def test_sqlite_cache_persists_results(tmp_path):
+    """Test that results cached in SQLite are available to a new cache on the same file."""
+    path = str(tmp_path / "results.db")
+    cache = SqliteResultCache(path)
+    cache.set("key", "value")
+    cache.close()
+
+    cache = SqliteResultCache(path)
+    assert cache.get("key") == "value"
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_finished_user_operation_is_cached(cdp_api_client, result_cache):
+    """Test that a finished user operation is fetched once and then served from the cache."""
+    user_operation = _create_user_operation("complete")
+    api = CachedEVMSmartAccountsApi(cdp_api_client, result_cache)
+
+    with patch.object(
+        EVMSmartAccountsApi, "get_user_operation", AsyncMock(return_value=user_operation)
+    ) as mock_get_user_operation:
+        first = await api.get_user_operation(SMART_ACCOUNT_ADDRESS, USER_OP_HASH)
+        second = await api.get_user_operation(SMART_ACCOUNT_ADDRESS.upper(), USER_OP_HASH)
+
+    mock_get_user_operation.assert_called_once_with(SMART_ACCOUNT_ADDRESS, USER_OP_HASH)
+    assert first == user_operation
+    assert second == user_operation
+
+
+@pytest.mark.asyncio
+async def test_pending_user_operation_is_not_cached(cdp_api_client, result_cache):
+    """Test that user operations that may still change are always fetched."""
+    api = CachedEVMSmartAccountsApi(cdp_api_client, result_cache)
+
+    with patch.object(
+        EVMSmartAccountsApi,
+        "get_user_operation",
+        AsyncMock(return_value=_create_user_operation("broadcast")),
+    ) as mock_get_user_operation:
+        await api.get_user_operation(SMART_ACCOUNT_ADDRESS, USER_OP_HASH)
+        await api.get_user_operation(SMART_ACCOUNT_ADDRESS, USER_OP_HASH)
+
+    assert mock_get_user_operation.call_count == 2
+    assert len(result_cache) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, call_count", [("completed", 1), ("failed", 1), ("pending", 2)])
+async def test_payment_transfer_caching(
+    cdp_api_client, result_cache, payment_transfer_model_factory, status, call_count
+):
+    """Test that only completed or failed payment transfers are served from the cache."""
+    transfer = payment_transfer_model_factory(status=status)
+    api = CachedPaymentsAlphaApi(cdp_api_client, result_cache)
+
+    with patch.object(
+        PaymentsAlphaApi, "get_payment_transfer", AsyncMock(return_value=transfer)
+    ) as mock_get_payment_transfer:
+        await api.get_payment_transfer(transfer.id)
+        result = await api.get_payment_transfer(transfer.id)
+
+    assert mock_get_payment_transfer.call_count == call_count
+    assert result == transfer
+
+
+def test_api_clients_use_result_cache(cdp_api_client):
+    """Test that the API clients only serve results from the cache when one is configured."""
+    result_cache = InMemoryResultCache()
+
+    api_clients = ApiClients(cdp_api_client, result_cache)
+    assert isinstance(api_clients.evm_smart_accounts, CachedEVMSmartAccountsApi)
+    assert isinstance(api_clients.payments, CachedPaymentsAlphaApi)
+    assert api_clients.payments.result_cache is result_cache
+
+    api_clients = ApiClients(cdp_api_client)
+    assert not isinstance(api_clients.evm_smart_accounts, CachedEVMSmartAccountsApi)
+    assert not isinstance(api_clients.payments, CachedPaymentsAlphaApi)
@@ -0,0 +1,240 @@
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+
+from cdp.openapi_client.configuration import Configuration
+from cdp.transport.rest import TransportRESTClientObject
+from cdp.transport.retry import RetryPolicy, parse_retry_after
+
+
+def _create_rest_client(**kwargs) -> TransportRESTClientObject:
+    kwargs.setdefault("backoff_factor", 0)
+    return TransportRESTClientObject(Configuration(), RetryPolicy(**kwargs))
+
+
+def _scripted_handler(responses):
+    """Return a handler that replies with the given responses in order."""
+    calls = []
+
+    async def _handler(request):
+        calls.append(request.method)
+        status, headers = responses[min(len(calls), len(responses)) - 1]
+        return web.Response(status=status, headers=headers, text="{}")
+
+    return _handler, calls
+
+
+def test_get_backoff_uses_full_jitter():
+    """Test that the backoff is drawn between zero and the capped exponential delay."""
+    policy = RetryPolicy(backoff_factor=0.5, backoff_max=3)
+
+    with patch("cdp.transport.retry.random.uniform", side_effect=lambda a, b: b) as uniform:
+        delays = [policy.get_backoff(n) for n in range(5)]
+
+    assert delays == [0.5, 1.0, 2.0, 3, 3]
+    assert all(call.args[0] == 0 for call in uniform.call_args_list)
+
+
+def test_parse_retry_after():
+    """Test parsing Retry-After values in seconds and as HTTP dates."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(" 1.5 ") == 1.5
+    assert parse_retry_after("-2") == 0.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("Fri, 01 Jan 2100 00:00:00 GMT") > 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_state_respects_total():
+    """Test that a request is retried at most the configured number of times."""
+    policy = RetryPolicy(total=2, backoff_factor=0)
+    state = policy.new_state("GET")
+
+    assert state.get_status_delay(503) == 0
+    assert state.get_status_delay(503) == 0
+    assert state.get_status_delay(503) is None
+    assert policy.metrics.retries == 2
+    assert policy.metrics.exhausted == 1
+    assert policy.metrics.reasons == {"503": 2}
+
+
+def test_retry_state_ignores_other_statuses():
+    """Test that statuses outside of the status list are not retried."""
+    state = RetryPolicy(status_forcelist=[503]).new_state("GET")
+
+    assert state.get_status_delay(200) is None
+    assert state.get_status_delay(400) is None
+    assert state.get_status_delay(500) is None
+
+
+def test_retry_state_prefers_retry_after():
+    """Test that a Retry-After header replaces the computed backoff."""
+    policy = RetryPolicy(backoff_factor=10)
+    state = policy.new_state("GET")
+
+    assert state.get_status_delay(429, {"Retry-After": "2"}) == 2.0
+    assert policy.metrics.retry_after_waits == 1
+
+
+def test_retry_state_gives_up_on_long_retry_after():
+    """Test that a response asking for a delay longer than allowed is not retried."""
+    policy = RetryPolicy(max_retry_after=5)
+    state = policy.new_state("GET")
+
+    assert state.get_status_delay(503, {"Retry-After": "120"}) is None
+    assert policy.metrics.retries == 0
+    assert policy.metrics.exhausted == 1
+
+
+def test_retry_state_enforces_budget():
+    """Test that a request stops retrying once its total wait would exceed the budget."""
+    policy = RetryPolicy(total=10, retry_budget=5)
+    state = policy.new_state("GET")
+
+    assert state.get_status_delay(503, {"Retry-After": "3"}) == 3.0
+    assert state.get_status_delay(503, {"Retry-After": "3"}) is None
+    assert state.waited == 3.0
+
+
+def test_retry_budget_is_per_request():
+    """Test that each request gets its own retry budget."""
+    policy = RetryPolicy(total=1, backoff_factor=0)
+
+    assert policy.new_state("GET").get_status_delay(503) == 0
+    assert policy.new_state("GET").get_status_delay(503) == 0
+    assert policy.metrics.retries == 2
+
+
+def test_integer_retries_are_converted_to_policy():
+    """Test that a plain number of retries becomes a retry policy."""
+    rest_client = TransportRESTClientObject(Configuration(), 5)
+
+    assert isinstance(rest_client.retries, RetryPolicy)
+    assert rest_client.retries.total == 5
+
+
+@pytest.mark.asyncio
+async def test_request_retries_retryable_statuses(http_server_factory):
+    """Test that GET requests are retried until they succeed."""
+    handler, calls = _scripted_handler([(503, {}), (502, {}), (200, {})])
+    base_url = await http_server_factory(handler)
+    rest_client = _create_rest_client(total=3)
+
+    response = await rest_client.request("GET", f"{base_url}/v2/evm/accounts")
+
+    assert response.status == 200
+    assert len(calls) == 3
+    assert rest_client.retries.metrics.reasons == {"503": 1, "502": 1}
+    await rest_client.close()
+
+
+@pytest.mark.asyncio
+async def test_request_returns_last_response_when_exhausted(http_server_factory):
+    """Test that the last response is returned once the retries are used up."""
+    handler, calls = _scripted_handler([(503, {})])
+    base_url = await http_server_factory(handler)
+    rest_client = _create_rest_client(total=2)
+
+    response = await rest_client.request("GET", f"{base_url}/v2/evm/accounts")
+
+    assert response.status == 503
+    assert len(calls) == 3
+    assert rest_client.retries.metrics.exhausted == 1
+    await rest_client.close()
+
+
+@pytest.mark.asyncio
+async def test_request_waits_for_retry_after(http_server_factory):
+    """Test that the transport sleeps for the delay given by Retry-After."""
+    handler, calls = _scripted_handler([(429, {"Retry-After": "1"}), (200, {})])
+    base_url = await http_server_factory(handler)
+    rest_client = _create_rest_client()
+
+    with patch("cdp.transport.rest.asyncio.sleep") as mock_sleep:
+        response = await rest_client.request("GET", f"{base_url}/v2/evm/accounts")
+
+    assert response.status == 200
+    mock_sleep.assert_called_once_with(1.0)
+    await rest_client.close()
+
+
+@pytest.mark.asyncio
+async def test_request_does_not_retry_post(http_server_factory):
+    """Test that methods outside of the allowed methods are not retried."""
+    handler, calls = _scripted_handler([(503, {}), (200, {})])
+    base_url = await http_server_factory(handler)
+    rest_client = _create_rest_client()
+
+    response = await rest_client.request(
+        "POST", f"{base_url}/v2/evm/accounts", body={"name": "test"}
+    )
+
+    assert response.status == 503
+    assert calls == ["POST"]
+    assert rest_client.retries.metrics.retries == 0
+    await rest_client.close()
+
+
+@pytest.mark.asyncio
+async def test_request_retries_connection_errors():
+    """Test that connection errors are retried and re-raised once the retries are used up."""
+    rest_client = _create_rest_client(total=2)
+
+    with pytest.raises(Exception, match="Cannot connect"):
+        await rest_client.request("GET", "http://127.0.0.1:1/platform/v2/evm/accounts")
+
+    assert rest_client.retries.metrics.retries == 2
+    assert rest_client.retries.metrics.reasons == {"ClientConnectorError": 2}
+    await rest_client.close()
+
+
+def test_new_state_for_idempotent_requests():
+    """Test that requests with an idempotency key are only retried when enabled."""
+    headers = {"X-Idempotency-Key": "8e03978e-40d5-43e8-bc93-6894a57f9324"}
+
+    assert RetryPolicy().new_state("POST", headers) is None
+    assert RetryPolicy(retry_idempotent_requests=True).new_state("POST") is None
+    assert RetryPolicy(total=0, retry_idempotent_requests=True).new_state("POST", headers) is None
+
+    state = RetryPolicy(retry_idempotent_requests=True).new_state("POST", headers)
+    assert state.status_forcelist == {502, 503, 504}
+
+
+@pytest.mark.asyncio
+async def test_request_retries_post_with_idempotency_key(http_server_factory):
+    """Test that POST requests with an idempotency key are retried on gateway errors."""
+    handler, calls = _scripted_handler([(503, {}), (504, {}), (200, {})])
+    base_url = await http_server_factory(handler)
+    rest_client = _create_rest_client(retry_idempotent_requests=True)
+
+    response = await rest_client.request(
+        "POST",
+        f"{base_url}/v2/evm/accounts",
+        headers={"X-Idempotency-Key": "8e03978e-40d5-43e8-bc93-6894a57f9324"},
+        body={"name": "test"},
+    )
+
+    assert response.status == 200
+    assert calls == ["POST", "POST", "POST"]
+    await rest_client.close()
+
+
+@pytest.mark.asyncio
+async def test_request_does_not_retry_post_on_internal_error(http_server_factory):
+    """Test that POST requests with an idempotency key aren't retried on other statuses."""
+    handler, calls = _scripted_handler([(500, {}), (200, {})])
+    base_url = await http_server_factory(handler)
+    rest_client = _create_rest_client(retry_idempotent_requests=True)
+
+    response = await rest_client.request(
+        "POST",
+        f"{base_url}/v2/evm/accounts",
+        headers={"X-Idempotency-Key": "8e03978e-40d5-43e8-bc93-6894a57f9324"},
+        body={"name": "test"},
+    )
+
+    assert response.status == 500
+    assert calls == ["POST"]
+    await rest_client.close()
@@ -0,0 +1,118 @@
+import random
+
+import pytest
+from eth_account.typed_transactions import DynamicFeeTransaction, TypedTransaction
+from eth_utils import to_checksum_address
+
+from cdp.evm_transaction_types import TransactionRequestEIP1559
+from cdp.utils import (
+    serialize_eip1559_transaction,
+    serialize_eip1559_transaction_dict,
+    serialize_unsigned_transaction,
+)
+
+ADDRESS = "0x9F663335Cd6Ad02a37B633602E98866CF944124d"
+
+
+def _eth_account_serialize(transaction: TransactionRequestEIP1559) -> str:
+    return serialize_unsigned_transaction(DynamicFeeTransaction.from_dict(transaction.as_dict()))
+
+
+def _eth_account_serialize_dict(transaction: dict) -> str:
+    typed_tx = TypedTransaction.from_dict(transaction)
+    typed_tx.transaction.dictionary["v"] = 0
+    typed_tx.transaction.dictionary["r"] = 0
+    typed_tx.transaction.dictionary["s"] = 0
+    return "0x" + (bytes([typed_tx.transaction_type]) + typed_tx.transaction.payload()).hex()
+
+
+def _random_uint(rng: random.Random) -> int:
+    # Favour the boundaries of the RLP single-byte, short and long encodings.
+    bits = rng.choice([0, 1, 7, 8, 55 * 8, 56 * 8, 64, 256])
+    return rng.choice([0, 1, 0x7F, 0x80, 2**bits - 1, rng.getrandbits(max(bits, 1))])
+
+
+def _random_address(rng: random.Random) -> str:
+    return to_checksum_address(rng.randbytes(20))
+
+
+def _random_transaction(rng: random.Random, types=("0x2", "0x02", 2)) -> dict:
+    return {
+        "chainId": _random_uint(rng),
+        "nonce": _random_uint(rng),
+        "maxPriorityFeePerGas": _random_uint(rng),
+        "maxFeePerGas": _random_uint(rng),
+        "gas": _random_uint(rng),
+        "to": _random_address(rng),
+        "value": _random_uint(rng),
+        "data": "0x" + rng.randbytes(rng.choice([0, 1, 4, 55, 56, 68, 300, 70000])).hex(),
+        "accessList": [
+            {
+                "address": _random_address(rng),
+                "storageKeys": ["0x" + rng.randbytes(32).hex() for _ in range(rng.randrange(0, 4))],
+            }
+            for _ in range(rng.randrange(0, 3))
+        ],
+        "type": rng.choice(types),
+    }
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_serialize_eip1559_transaction_matches_eth_account(seed):
+    """Test that random transaction requests serialize byte-identically to eth-account."""
+    transaction = TransactionRequestEIP1559(
+        **_random_transaction(random.Random(seed), types=("0x2", "0x02"))
+    )
+
+    assert serialize_eip1559_transaction(transaction) == _eth_account_serialize(transaction)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_serialize_eip1559_transaction_dict_matches_eth_account(seed):
+    """Test that random transaction dicts serialize byte-identically to eth-account."""
+    transaction = _random_transaction(random.Random(seed))
+
+    assert serialize_eip1559_transaction_dict(transaction) == _eth_account_serialize_dict(
+        transaction
+    )
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"data": "abcd"},
+        {"data": "0xabc"},
+        {"accessList": [{"address": ADDRESS, "storageKeys": ["0x01"]}]},
+        {"to": ADDRESS.lower()},
+        {"value": None},
+        {"value": -1},
+        {"value": 2**256},
+        {"type": "0x1"},
+        {"type": None},
+    ],
+)
+def test_serialize_eip1559_transaction_falls_back_to_eth_account(fields):
+    """Test that requests outside the direct path serialize, or fail, like eth-account."""
+    transaction = TransactionRequestEIP1559(**{"to": ADDRESS, **fields})
+
+    try:
+        expected = _eth_account_serialize(transaction)
+    except Exception as e:
+        with pytest.raises(type(e)):
+            serialize_eip1559_transaction(transaction)
+    else:
+        assert serialize_eip1559_transaction(transaction) == expected
+
+
+@pytest.mark.parametrize(
+    "transaction",
+    [
+        {"to": ADDRESS, "value": 1, "type": 2},
+        {**_random_transaction(random.Random(0)), "from": ADDRESS},
+        {**_random_transaction(random.Random(0)), "nonce": "0x1"},
+        {**_random_transaction(random.Random(0)), "to": ADDRESS.lower()},
+    ],
+)
+def test_serialize_eip1559_transaction_dict_returns_none_outside_the_direct_path(transaction):
+    """Test that incomplete or non-canonical dicts are left to eth-account."""
+    assert serialize_eip1559_transaction_dict(transaction) is None
@@ -0,0 +1,236 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cdp.actions.evm.transfer.smart_account_transfer_strategy import (
+    SmartAccountTransferStrategy,
+    smart_account_transfer_strategy,
+)
+from cdp.api_clients import ApiClients
+from cdp.evm_smart_account import EvmSmartAccount
+
+USDC_BASE_SEPOLIA = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+
+
+def _mock_from_account():
+    mock_from_account = MagicMock(spec=EvmSmartAccount)
+    mock_from_account.address = "0x1234567890123456789012345678901234567890"
+    mock_from_account.owners = [MagicMock()]
+    return mock_from_account
+
+
+@pytest.mark.asyncio
+async def test_execute_transfer_eth():
+    """Test executing an ETH transfer from a smart account."""
+    with patch(
+        "cdp.actions.evm.transfer.smart_account_transfer_strategy.send_user_operation",
+        new_callable=AsyncMock,
+    ) as mock_send_user_operation:
+        strategy = SmartAccountTransferStrategy()
+        await strategy.execute_transfer(
+            api_clients=MagicMock(spec=ApiClients),
+            from_account=_mock_from_account(),
+            to="0x2345678901234567890123456789012345678901",
+            value=1000,
+            token="eth",
+            network="base-sepolia",
+            paymaster_url=None,
+        )
+
+    calls = mock_send_user_operation.call_args.kwargs["calls"]
+    assert len(calls) == 1
+    assert calls[0].to == "0x2345678901234567890123456789012345678901"
+    assert calls[0].value == 1000
+
+
+@pytest.mark.asyncio
+async def test_execute_transfer_erc20():
+    """Test executing an ERC20 transfer from a smart account sends only the transfer."""
+    with patch(
+        "cdp.actions.evm.transfer.smart_account_transfer_strategy.send_user_operation",
+        new_callable=AsyncMock,
+    ) as mock_send_user_operation:
+        strategy = SmartAccountTransferStrategy()
+        await strategy.execute_transfer(
+            api_clients=MagicMock(spec=ApiClients),
+            from_account=_mock_from_account(),
+            to="0x2345678901234567890123456789012345678901",
+            value=1000000,
+            token="usdc",
+            network="base-sepolia",
+            paymaster_url=None,
+        )
+
+    mock_send_user_operation.assert_called_once()
+    calls = mock_send_user_operation.call_args.kwargs["calls"]
+    assert len(calls) == 1
+    assert calls[0].to == USDC_BASE_SEPOLIA
+    assert calls[0].data.startswith("0xa9059cbb")  # transfer(address,uint256)
+
+
+@pytest.mark.asyncio
+async def test_execute_transfer_erc20_with_approve():
+    """Test executing an ERC20 transfer from a smart account with the opt-in approve."""
+    with patch(
+        "cdp.actions.evm.transfer.smart_account_transfer_strategy.send_user_operation",
+        new_callable=AsyncMock,
+    ) as mock_send_user_operation:
+        strategy = SmartAccountTransferStrategy()
+        await strategy.execute_transfer(
+            api_clients=MagicMock(spec=ApiClients),
+            from_account=_mock_from_account(),
+            to="0x2345678901234567890123456789012345678901",
+            value=1000000,
+            token="usdc",
+            network="base-sepolia",
+            paymaster_url=None,
+            approve=True,
+        )
+
+    calls = mock_send_user_operation.call_args.kwargs["calls"]
+    assert [call.data[:10] for call in calls] == ["0x095ea7b3", "0xa9059cbb"]
+
+
+def _recipient(i):
+    return f"0x{i + 1:040x}"
+
+
+@pytest.mark.asyncio
+async def test_execute_transfer_many_chunks_erc20_transfers():
+    """Test that many ERC20 transfers are packed into chunked user operations."""
+    user_operations = [MagicMock(name=f"user_operation_{i}") for i in range(3)]
+    with patch(
+        "cdp.actions.evm.transfer.smart_account_transfer_strategy.send_user_operation",
+        new_callable=AsyncMock,
+    ) as mock_send_user_operation:
+        mock_send_user_operation.side_effect = lambda **kwargs: user_operations[
+            int(kwargs["calls"][0].data[-64:], 16) // 2
+        ]
+        results = await smart_account_transfer_strategy.execute_transfer_many(
+            api_clients=MagicMock(spec=ApiClients),
+            from_account=_mock_from_account(),
+            transfers=[(_recipient(i), i) for i in range(5)],
+            token="usdc",
+            network="base-sepolia",
+            paymaster_url=None,
+            max_calls_per_user_operation=2,
+        )
+
+    chunks = [call.kwargs["calls"] for call in mock_send_user_operation.call_args_list]
+    assert sorted(len(calls) for calls in chunks) == [1, 2, 2]
+    assert all(call.to == USDC_BASE_SEPOLIA for calls in chunks for call in calls)
+    assert all(call.data.startswith("0xa9059cbb") for calls in chunks for call in calls)
+    assert list(results) == [_recipient(i) for i in range(5)]
+    assert [results[_recipient(i)] for i in range(5)] == [
+        user_operations[0],
+        user_operations[0],
+        user_operations[1],
+        user_operations[1],
+        user_operations[2],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_transfer_many_chunks_by_calldata_size():
+    """Test that user operations are also limited by the size of their calldata."""
+    with patch(
+        "cdp.actions.evm.transfer.smart_account_transfer_strategy.send_user_operation",
+        new_callable=AsyncMock,
+    ) as mock_send_user_operation:
+        await smart_account_transfer_strategy.execute_transfer_many(
+            api_clients=MagicMock(spec=ApiClients),
+            from_account=_mock_from_account(),
+            transfers=[(_recipient(i), i) for i in range(5)],
+            token="usdc",
+            network="base-sepolia",
+            paymaster_url=None,
+            max_calldata_size=3 * 68,
+        )
+
+    chunks = [call.kwargs["calls"] for call in mock_send_user_operation.call_args_list]
+    assert sorted(len(calls) for calls in chunks) == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_execute_transfer_many_reports_failed_user_operations():
+    """Test that the recipients of a failed user operation map to its error."""
+    error = ValueError("boom")
+
+    async def send_user_operation(**kwargs):
+        if kwargs["calls"][0].to == _recipient(0):
+            raise error
+        return MagicMock()
+
+    with patch(
+        "cdp.actions.evm.transfer.smart_account_transfer_strategy.send_user_operation",
+        side_effect=send_user_operation,
+    ):
+        results = await smart_account_transfer_strategy.execute_transfer_many(
+            api_clients=MagicMock(spec=ApiClients),
+            from_account=_mock_from_account(),
+            transfers=[(_recipient(i), 1000) for i in range(4)],
+            token="eth",
+            network="base-sepolia",
+            paymaster_url=None,
+            max_calls_per_user_operation=2,
+        )
+
+    assert results[_recipient(0)] is error
+    assert results[_recipient(1)] is error
+    assert not isinstance(results[_recipient(2)], Exception)
+    assert not isinstance(results[_recipient(3)], Exception)
+
+
+@pytest.mark.asyncio
+async def test_execute_transfer_many_rejects_duplicate_recipients():
+    """Test that a recipient can only be paid once per call."""
+    with pytest.raises(ValueError, match="Duplicate recipient"):
+        await smart_account_transfer_strategy.execute_transfer_many(
+            api_clients=MagicMock(spec=ApiClients),
+            from_account=_mock_from_account(),
+            transfers=[
+                (USDC_BASE_SEPOLIA, 1),
+                (USDC_BASE_SEPOLIA.lower(), 2),
+            ],
+            token="eth",
+            network="base-sepolia",
+            paymaster_url=None,
+        )
+
+
+@pytest.mark.asyncio
+async def test_execute_transfer_many_submits_user_operations_sequentially():
+    """Test that a user operation is only prepared once the previous one was submitted."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def send_user_operation(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return MagicMock()
+
+    with patch(
+        "cdp.actions.evm.transfer.smart_account_transfer_strategy.send_user_operation",
+        side_effect=send_user_operation,
+    ) as mock_send_user_operation:
+        await smart_account_transfer_strategy.execute_transfer_many(
+            api_clients=MagicMock(spec=ApiClients),
+            from_account=_mock_from_account(),
+            transfers=[(_recipient(i), 1000) for i in range(6)],
+            token="eth",
+            network="base-sepolia",
+            paymaster_url=None,
+            max_calls_per_user_operation=2,
+        )
+
+    assert mock_send_user_operation.call_count == 3
+    assert max_in_flight == 1
+
+
+def test_singleton_instance():
+    """Test that smart_account_transfer_strategy is an instance of SmartAccountTransferStrategy."""
+    assert isinstance(smart_account_transfer_strategy, SmartAccountTransferStrategy)
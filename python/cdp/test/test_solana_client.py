@@ -2,6 +2,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from cdp.account_cache import AccountCache
 from cdp.openapi_client.errors import ApiError
 from cdp.openapi_client.models.create_solana_account_request import (
     CreateSolanaAccountRequest,
@@ -31,6 +32,7 @@ from cdp.openapi_client.models.solana_account import SolanaAccount as SolanaAcco
 from cdp.openapi_client.models.update_solana_account_request import UpdateSolanaAccountRequest
 from cdp.solana_client import SolanaClient
 from cdp.update_account_types import UpdateAccountOptions
+from cdp.utils import derive_idempotency_key
 
 
 @pytest.mark.asyncio
@@ -61,6 +63,73 @@ async def test_create_account():
     assert result.name == mock_sol_account.name
 
 
+@pytest.mark.asyncio
+async def test_create_accounts():
+    """Test creating many Solana accounts with deterministic idempotency keys."""
+    mock_solana_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.solana_accounts = mock_solana_accounts_api
+
+    async def create_solana_account(x_idempotency_key, create_solana_account_request):
+        return SolanaAccountModel(
+            address="14grJpemFaf88c8tiVb77W7TYg2W3ir6pfkKz3YjhhZ5",
+            name=create_solana_account_request.name,
+        )
+
+    mock_solana_accounts_api.create_solana_account = AsyncMock(side_effect=create_solana_account)
+
+    client = SolanaClient(api_clients=mock_api_clients)
+
+    operation = client.create_accounts(names=["alice", "bob"], concurrency=1)
+    results = dict([result async for result in operation])
+    keys = {
+        call.kwargs["x_idempotency_key"]
+        for call in mock_solana_accounts_api.create_solana_account.call_args_list
+    }
+
+    assert results[0].name == "alice"
+    assert results[1].name == "bob"
+    assert keys == {
+        derive_idempotency_key("solana", "create_account", None, name, None)
+        for name in ["alice", "bob"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_accounts():
+    """Test getting many Solana accounts by name, using the account cache first."""
+    cached = SolanaAccountModel(
+        address="14grJpemFaf88c8tiVb77W7TYg2W3ir6pfkKz3YjhhZ5", name="cached"
+    )
+    account_cache = AccountCache()
+    account_cache.set([("solana", "name", "cached")], cached)
+
+    mock_solana_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.solana_accounts = mock_solana_accounts_api
+    mock_solana_accounts_api.get_solana_account_by_name = AsyncMock(
+        side_effect=ApiError(404, "not_found", "Account not found")
+    )
+    mock_solana_accounts_api.create_solana_account = AsyncMock(
+        return_value=SolanaAccountModel(
+            address="9ZNTfG4NyQgxy2SWjSiQoUyBPEvXT2xo7fKc5hPYYJ7b", name="new"
+        )
+    )
+
+    client = SolanaClient(api_clients=mock_api_clients, account_cache=account_cache)
+
+    accounts = await client.get_or_create_accounts(["cached", "new"])
+
+    assert accounts["cached"].address == cached.address
+    assert accounts["new"].name == "new"
+    mock_solana_accounts_api.get_solana_account_by_name.assert_called_once_with("new")
+    mock_solana_accounts_api.list_solana_accounts.assert_not_called()
+    mock_solana_accounts_api.create_solana_account.assert_called_once()
+    assert mock_solana_accounts_api.create_solana_account.call_args.kwargs[
+        "x_idempotency_key"
+    ] == derive_idempotency_key("solana", "create_account", None, "new", None)
+
+
 @pytest.mark.asyncio
 async def test_create_account_with_policy():
     """Test creating a Solana account with a policy."""
@@ -218,6 +287,67 @@ async def test_list_accounts():
     assert result.accounts[1].address == "bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb"
 
 
+@pytest.mark.asyncio
+async def test_iter_accounts():
+    """Test iterating over Solana accounts across pages."""
+    mock_solana_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.solana_accounts = mock_solana_accounts_api
+    mock_solana_accounts_api.list_solana_accounts = AsyncMock(
+        side_effect=[
+            ListSolanaAccountsResponse(
+                accounts=[SolanaAccountModel(address="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa")],
+                next_page_token="next-page-token",
+            ),
+            ListSolanaAccountsResponse(
+                accounts=[SolanaAccountModel(address="bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb")],
+            ),
+        ]
+    )
+
+    client = SolanaClient(api_clients=mock_api_clients)
+
+    accounts = [account async for account in client.iter_accounts(page_size=1)]
+
+    assert [account.address for account in accounts] == [
+        "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        "bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb",
+    ]
+    mock_solana_accounts_api.list_solana_accounts.assert_called_with(
+        page_size=1, page_token="next-page-token"
+    )
+
+
+@pytest.mark.asyncio
+async def test_sign_message_many():
+    """Test signing many Solana messages in input order."""
+    mock_solana_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.solana_accounts = mock_solana_accounts_api
+
+    test_address = "14grJpemFaf88c8tiVb77W7TYg2W3ir6pfkKz3YjhhZ5"
+
+    async def sign_solana_message(address, sign_solana_message_request, x_idempotency_key):
+        return SignSolanaMessageResponse(signature=f"sig-{sign_solana_message_request.message}")
+
+    mock_solana_accounts_api.sign_solana_message = AsyncMock(side_effect=sign_solana_message)
+
+    client = SolanaClient(api_clients=mock_api_clients)
+
+    operation = client.sign_message_many(test_address, ["one", "two", "three"], concurrency=2)
+    responses = await operation.collect()
+
+    assert [response.signature for response in responses] == ["sig-one", "sig-two", "sig-three"]
+    assert operation.errors == []
+    assert {
+        call.kwargs["x_idempotency_key"]
+        for call in mock_solana_accounts_api.sign_solana_message.call_args_list
+    } == {
+        derive_idempotency_key("solana", "sign_message", None, test_address, index, message)
+        for index, message in enumerate(["one", "two", "three"])
+    }
+
+
 @pytest.mark.asyncio
 async def test_sign_message():
     """Test signing a Solana message."""
@@ -342,3 +472,54 @@ async def test_update_account(server_account_model_factory):
         ),
         x_idempotency_key=test_idempotency_key,
     )
+
+
+@pytest.mark.asyncio
+async def test_get_account_uses_account_cache():
+    """Test that Solana account lookups are served from the account cache."""
+    mock_solana_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.solana_accounts = mock_solana_accounts_api
+    sol_account = SolanaAccountModel(
+        address="14grJpemFaf88c8tiVb77W7TYg2W3ir6pfkKz3YjhhZ5", name="test-sol-account"
+    )
+    mock_solana_accounts_api.get_solana_account_by_name = AsyncMock(return_value=sol_account)
+    account_cache = AccountCache()
+    client = SolanaClient(api_clients=mock_api_clients, account_cache=account_cache)
+
+    await client.get_account(name="test-sol-account")
+    result = await client.get_account(address="14grJpemFaf88c8tiVb77W7TYg2W3ir6pfkKz3YjhhZ5")
+
+    mock_solana_accounts_api.get_solana_account_by_name.assert_called_once()
+    mock_solana_accounts_api.get_solana_account.assert_not_called()
+    assert result.address == "14grJpemFaf88c8tiVb77W7TYg2W3ir6pfkKz3YjhhZ5"
+    assert account_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_update_account_refreshes_account_cache():
+    """Test that updating a Solana account replaces its cached entry."""
+    mock_solana_accounts_api = AsyncMock()
+    mock_api_clients = AsyncMock()
+    mock_api_clients.solana_accounts = mock_solana_accounts_api
+    old_account = SolanaAccountModel(
+        address="14grJpemFaf88c8tiVb77W7TYg2W3ir6pfkKz3YjhhZ5", name="old-name"
+    )
+    new_account = SolanaAccountModel(
+        address="14grJpemFaf88c8tiVb77W7TYg2W3ir6pfkKz3YjhhZ5", name="new-name"
+    )
+    mock_solana_accounts_api.create_solana_account = AsyncMock(return_value=old_account)
+    mock_solana_accounts_api.update_solana_account = AsyncMock(return_value=new_account)
+    account_cache = AccountCache()
+    client = SolanaClient(api_clients=mock_api_clients, account_cache=account_cache)
+    await client.create_account(name="old-name")
+
+    await client.update_account(
+        "14grJpemFaf88c8tiVb77W7TYg2W3ir6pfkKz3YjhhZ5", UpdateAccountOptions(name="new-name")
+    )
+
+    assert account_cache.get(("solana", "name", "old-name")) is None
+    assert (
+        await client.get_account(address="14grJpemFaf88c8tiVb77W7TYg2W3ir6pfkKz3YjhhZ5")
+    ).name == "new-name"
+    mock_solana_accounts_api.get_solana_account.assert_not_called()
@@ -0,0 +1,250 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+
+from cdp.evm_client import EvmClient
+from cdp.openapi_client.errors import ApiError
+from cdp.openapi_client.exceptions import ApiException
+from cdp.openapi_client.models.evm_call import EvmCall
+from cdp.openapi_client.models.evm_user_operation import EvmUserOperation
+from cdp.user_operation_tracker import UserOperationTracker
+
+SMART_ACCOUNT_ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+def _user_op_hash(index: int) -> str:
+    return "0x" + f"{index:064x}"
+
+
+def _create_user_operation(user_op_hash: str, status: str) -> EvmUserOperation:
+    return EvmUserOperation(
+        network="base-sepolia",
+        user_op_hash=user_op_hash,
+        calls=[EvmCall(to=SMART_ACCOUNT_ADDRESS, value="0", data="0x")],
+        status=status,
+    )
+
+
+def _create_api_clients(statuses: dict[str, list[str]]):
+    """Return API clients whose user operations go through the given statuses in order."""
+    api_clients = MagicMock()
+    calls = []
+
+    async def get_user_operation(address, user_op_hash):
+        calls.append(user_op_hash)
+        remaining = statuses[user_op_hash]
+        status = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        return _create_user_operation(user_op_hash, status)
+
+    api_clients.evm_smart_accounts.get_user_operation = AsyncMock(side_effect=get_user_operation)
+    return api_clients, calls
+
+
+@pytest.mark.asyncio
+async def test_wait_resolves_when_user_operation_finishes():
+    """Test that waiting resolves to the user operation once it is complete."""
+    user_op_hash = _user_op_hash(1)
+    api_clients, calls = _create_api_clients({user_op_hash: ["pending", "broadcast", "complete"]})
+    tracker = UserOperationTracker(api_clients, interval_seconds=0)
+
+    result = await tracker.wait(SMART_ACCOUNT_ADDRESS, user_op_hash, timeout_seconds=1)
+
+    assert result.status == "complete"
+    assert len(calls) == 3
+    assert tracker.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_track_returns_same_future_for_same_user_operation():
+    """Test that tracking a user operation twice shares one future and one poll per round."""
+    user_op_hash = _user_op_hash(1)
+    api_clients, calls = _create_api_clients({user_op_hash: ["complete"]})
+    tracker = UserOperationTracker(api_clients, interval_seconds=0)
+
+    first = tracker.track(SMART_ACCOUNT_ADDRESS, user_op_hash)
+    second = tracker.track(SMART_ACCOUNT_ADDRESS.upper(), user_op_hash)
+
+    assert first is second
+    assert (await first).status == "complete"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_polls_least_recently_polled_user_operations_within_concurrency_budget():
+    """Test that each round polls at most max_concurrency user operations, in turn."""
+    hashes = [_user_op_hash(i) for i in range(5)]
+    api_clients, calls = _create_api_clients({h: ["pending", "complete"] for h in hashes})
+    in_flight = 0
+    max_in_flight = 0
+    get_user_operation = api_clients.evm_smart_accounts.get_user_operation.side_effect
+
+    async def counting_get_user_operation(address, user_op_hash):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return await get_user_operation(address, user_op_hash)
+
+    api_clients.evm_smart_accounts.get_user_operation.side_effect = counting_get_user_operation
+    tracker = UserOperationTracker(api_clients, max_concurrency=2, interval_seconds=0)
+
+    futures = [tracker.track(SMART_ACCOUNT_ADDRESS, h) for h in hashes]
+    results = await asyncio.gather(*futures)
+
+    assert [result.status for result in results] == ["complete"] * 5
+    assert max_in_flight == 2
+    assert calls[:6] == [hashes[0], hashes[1], hashes[2], hashes[3], hashes[4], hashes[0]]
+
+
+@pytest.mark.asyncio
+async def test_stuck_user_operations_dont_starve_newer_ones():
+    """Test that user operations that stay pending don't block the ones tracked after them."""
+    stuck = [_user_op_hash(i) for i in range(2)]
+    newer = _user_op_hash(2)
+    api_clients, _ = _create_api_clients(
+        {**{h: ["pending"] for h in stuck}, newer: ["pending", "complete"]}
+    )
+    tracker = UserOperationTracker(api_clients, max_concurrency=2, interval_seconds=0)
+
+    for h in stuck:
+        tracker.track(SMART_ACCOUNT_ADDRESS, h)
+    result = await tracker.wait(SMART_ACCOUNT_ADDRESS, newer, timeout_seconds=1)
+
+    assert result.status == "complete"
+    assert tracker.pending == 2
+    await tracker.close()
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried():
+    """Test that a poll failing with a transient error is retried instead of failing."""
+    user_op_hash = _user_op_hash(1)
+    api_clients, _ = _create_api_clients({user_op_hash: ["complete"]})
+    get_user_operation = api_clients.evm_smart_accounts.get_user_operation.side_effect
+    errors = [ApiError(503, "service_unavailable", "Service unavailable."), aiohttp.ClientError()]
+
+    async def get_user_operation_or_fail(address, user_op_hash):
+        if errors:
+            raise errors.pop(0)
+        return await get_user_operation(address, user_op_hash)
+
+    api_clients.evm_smart_accounts.get_user_operation.side_effect = get_user_operation_or_fail
+    tracker = UserOperationTracker(api_clients, interval_seconds=0.001)
+
+    result = await tracker.wait(SMART_ACCOUNT_ADDRESS, user_op_hash, timeout_seconds=1)
+
+    assert result.status == "complete"
+    assert not errors
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_fail_after_max_poll_retries():
+    """Test that a user operation fails once its transient errors exceed the retry budget."""
+    api_clients = MagicMock()
+    api_clients.evm_smart_accounts.get_user_operation = AsyncMock(
+        side_effect=ApiError(429, "rate_limit_exceeded", "Rate limit exceeded.")
+    )
+    tracker = UserOperationTracker(api_clients, interval_seconds=0.001, max_poll_retries=2)
+
+    with pytest.raises(ApiError, match="Rate limit exceeded"):
+        await tracker.wait(SMART_ACCOUNT_ADDRESS, _user_op_hash(1), timeout_seconds=1)
+
+    assert api_clients.evm_smart_accounts.get_user_operation.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_events_report_status_changes():
+    """Test that subscribers receive an event for every status change."""
+    user_op_hash = _user_op_hash(1)
+    api_clients, _ = _create_api_clients(
+        {user_op_hash: ["pending", "pending", "broadcast", "complete"]}
+    )
+    tracker = UserOperationTracker(api_clients, interval_seconds=0)
+    statuses = []
+
+    async def collect():
+        async for event in tracker.events():
+            assert event.smart_account_address == SMART_ACCOUNT_ADDRESS
+            assert event.user_op_hash == user_op_hash
+            statuses.append(event.status)
+
+    collector = asyncio.create_task(collect())
+    await asyncio.sleep(0)
+    await tracker.wait(SMART_ACCOUNT_ADDRESS, user_op_hash, timeout_seconds=1)
+    await tracker.close()
+    await collector
+
+    assert statuses == ["pending", "broadcast", "complete"]
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_fail_the_user_operation():
+    """Test that a non-retryable error while polling fails that user operation only."""
+    failing_hash = _user_op_hash(1)
+    complete_hash = _user_op_hash(2)
+    api_clients, _ = _create_api_clients({complete_hash: ["complete"]})
+    get_user_operation = api_clients.evm_smart_accounts.get_user_operation.side_effect
+
+    async def get_user_operation_or_fail(address, user_op_hash):
+        if user_op_hash == failing_hash:
+            raise ApiException(status=404, reason="User operation not found")
+        return await get_user_operation(address, user_op_hash)
+
+    api_clients.evm_smart_accounts.get_user_operation.side_effect = get_user_operation_or_fail
+    tracker = UserOperationTracker(api_clients, interval_seconds=0)
+
+    failing = tracker.track(SMART_ACCOUNT_ADDRESS, failing_hash)
+    complete = tracker.track(SMART_ACCOUNT_ADDRESS, complete_hash)
+
+    with pytest.raises(ApiException):
+        await failing
+    assert (await complete).status == "complete"
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out_and_keeps_tracking():
+    """Test that a timed out wait raises TimeoutError without untracking the user operation."""
+    user_op_hash = _user_op_hash(1)
+    api_clients, _ = _create_api_clients({user_op_hash: ["pending"]})
+    tracker = UserOperationTracker(api_clients, interval_seconds=0.01)
+
+    with pytest.raises(TimeoutError, match="User Operation timed out"):
+        await tracker.wait(SMART_ACCOUNT_ADDRESS, user_op_hash, timeout_seconds=0.05)
+
+    assert tracker.pending == 1
+    await tracker.close()
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_pending_user_operations():
+    """Test that closing the tracker stops polling and cancels pending futures."""
+    user_op_hash = _user_op_hash(1)
+    api_clients, calls = _create_api_clients({user_op_hash: ["pending"]})
+    tracker = UserOperationTracker(api_clients, interval_seconds=0.01)
+
+    future = tracker.track(SMART_ACCOUNT_ADDRESS, user_op_hash)
+    await asyncio.sleep(0.03)
+    await tracker.close()
+    polls = len(calls)
+    await asyncio.sleep(0.03)
+
+    assert future.cancelled()
+    assert tracker.pending == 0
+    assert len(calls) == polls
+
+
+def test_tracker_rejects_invalid_arguments():
+    """Test that the concurrency budget must be positive."""
+    with pytest.raises(ValueError, match="max_concurrency must be positive"):
+        UserOperationTracker(MagicMock(), max_concurrency=0)
+
+
+def test_evm_client_shares_tracker():
+    """Test that the EVM client creates one tracker on first access."""
+    client = EvmClient(api_clients=MagicMock())
+
+    assert client.user_operation_tracker is client.user_operation_tracker
+    assert client.user_operation_tracker.api_clients is client.api_clients
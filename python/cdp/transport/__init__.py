@@ -0,0 +1,11 @@
+from .rate_limit import AdaptiveRateLimiter, RateLimiter
+from .rest import TransportRESTClientObject
+from .retry import RetryMetrics, RetryPolicy
+
+__all__ = [
+    "AdaptiveRateLimiter",
+    "RateLimiter",
+    "RetryMetrics",
+    "RetryPolicy",
+    "TransportRESTClientObject",
+]
@@ -0,0 +1,158 @@
+import asyncio
+import re
+import time
+from collections.abc import Mapping
+from urllib.parse import urlparse
+
+ENDPOINT_GROUPS = ("accounts", "signing", "policies", "payments", "faucets", "other")
+THROTTLED_STATUSES = frozenset({429, 503})
+
+_SIGNING_PATH = re.compile(r"/(sign|send)(/|$)")
+
+
+def get_endpoint_group(path: str) -> str:
+    """Get the endpoint group a request path belongs to.
+
+    Args:
+        path (str): The request path.
+
+    Returns:
+        str: The endpoint group, one of ENDPOINT_GROUPS.
+
+    """
+    if "/policy-engine/" in path:
+        return "policies"
+    if "/payments/" in path:
+        return "payments"
+    if path.endswith("/faucet"):
+        return "faucets"
+    if _SIGNING_PATH.search(path):
+        return "signing"
+    if "/accounts" in path or "/smart-accounts" in path:
+        return "accounts"
+    return "other"
+
+
+class AdaptiveRateLimiter:
+    """A token bucket whose rate adapts to throttling with AIMD.
+
+    The rate starts at ``max_rate``. Each 429 or 503 response multiplies it by
+    ``decrease_factor``, at most once per ``cooldown`` seconds, and each successful response
+    adds to it so that, under full load, it grows by about ``increase_step`` requests per
+    second every second until it reaches ``max_rate`` again.
+    """
+
+    def __init__(
+        self,
+        max_rate: float,
+        min_rate: float = 1.0,
+        burst: int | None = None,
+        decrease_factor: float = 0.5,
+        increase_step: float = 1.0,
+        cooldown: float = 1.0,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            max_rate (float): The maximum and initial rate, in requests per second.
+            min_rate (float): The rate, in requests per second, the limiter never shrinks below.
+            burst (int, optional): The number of requests that may be sent at once after an
+                idle period. Defaults to max_rate, rounded down, and at least 1.
+            decrease_factor (float): The factor the rate is multiplied by when throttled.
+            increase_step (float): How much the rate grows per second under full load.
+            cooldown (float): The minimum time, in seconds, between two decreases.
+
+        """
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.burst = burst if burst is not None else max(1, int(max_rate))
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.cooldown = cooldown
+
+        self._rate = max_rate
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._last_decrease = float("-inf")
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Get the current rate.
+
+        Returns:
+            float: The current rate in requests per second.
+
+        """
+        return self._rate
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent under the current rate."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def record(self, status: int) -> None:
+        """Adapt the rate to the status of a response.
+
+        Args:
+            status (int): The HTTP status code of the response.
+
+        """
+        if status in THROTTLED_STATUSES:
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._refill()
+            self._last_decrease = now
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+        elif status < 400:
+            self._rate = min(self.max_rate, self._rate + self.increase_step / self._rate)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+
+class RateLimiter:
+    """Rate limiters for the endpoint groups of the CDP APIs.
+
+    Requests to groups without a limiter are not limited.
+    """
+
+    def __init__(self, limiters: Mapping[str, AdaptiveRateLimiter]) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            limiters (Mapping[str, AdaptiveRateLimiter]): The rate limiter of each endpoint group.
+
+        """
+        self.limiters = dict(limiters)
+
+    @property
+    def rates(self) -> dict[str, float]:
+        """Get the current rate of each limited endpoint group.
+
+        Returns:
+            dict[str, float]: The rate in requests per second, keyed by endpoint group.
+
+        """
+        return {group: limiter.rate for group, limiter in self.limiters.items()}
+
+    def get_limiter(self, url: str) -> AdaptiveRateLimiter | None:
+        """Get the rate limiter for a request.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            AdaptiveRateLimiter | None: The rate limiter, or None if the request isn't limited.
+
+        """
+        return self.limiters.get(get_endpoint_group(urlparse(url).path))
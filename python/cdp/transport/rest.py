@@ -0,0 +1,273 @@
+import asyncio
+import json
+import re
+
+import aiohttp
+
+from cdp.openapi_client.exceptions import ApiException, ApiValueError
+from cdp.openapi_client.rest import RESTClientObject, RESTResponse
+from cdp.transport.rate_limit import RateLimiter
+from cdp.transport.retry import RetryPolicy
+
+RETRYABLE_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+BODY_METHODS = frozenset({"POST", "PUT", "PATCH", "OPTIONS", "DELETE"})
+
+
+class TransportRESTClientObject(RESTClientObject):
+    """The REST client of the generated API client, with the SDK's HTTP transport.
+
+    It keeps the generated client's request building, and adds a shared connection pool with
+    keep-alive and DNS caching, configurable timeouts, retries driven by a RetryPolicy,
+    client-side rate limiting and connection warm-up. Keeping these here rather than in the
+    generated ``rest`` module means regenerating the client doesn't drop them.
+    """
+
+    def __init__(
+        self,
+        configuration,
+        retries: RetryPolicy | int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        *,
+        connection_pool_size: int | None = None,
+        connections_per_host: int = 0,
+        keepalive_timeout: float = 15,
+        dns_cache_ttl: int | None = 10,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        request_timeout: float | None = 300,
+    ) -> None:
+        """Initialize the REST client.
+
+        Args:
+            configuration (Configuration): The configuration of the generated API client.
+            retries (RetryPolicy | int | None): The retry policy, or a number of retries.
+                Defaults to None, for no retries.
+            rate_limiter (RateLimiter | None): The client-side rate limiter applied to every
+                request. Defaults to None, for no rate limiting.
+            connection_pool_size (int | None): The maximum number of simultaneous connections,
+                0 for no limit. Defaults to the configuration's connection_pool_maxsize.
+            connections_per_host (int): The maximum number of simultaneous connections to a
+                single host, 0 for no limit. Defaults to 0.
+            keepalive_timeout (float): How long, in seconds, an idle connection is kept open
+                for reuse. Defaults to 15.
+            dns_cache_ttl (int | None): How long, in seconds, resolved host addresses are
+                cached, None for the lifetime of the client. Defaults to 10.
+            connect_timeout (float | None): The default timeout, in seconds, to establish a
+                connection. Defaults to None, for no separate limit.
+            read_timeout (float | None): The default timeout, in seconds, between reads of a
+                response. Defaults to None, for no separate limit.
+            request_timeout (float | None): The default total timeout, in seconds, of a
+                request. Defaults to 300.
+
+        """
+        super().__init__(configuration)
+
+        if connection_pool_size is not None:
+            self.maxsize = connection_pool_size
+        self.maxsize_per_host = connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = aiohttp.ClientTimeout(
+            total=request_timeout,
+            sock_connect=connect_timeout,
+            sock_read=read_timeout,
+        )
+
+        if isinstance(retries, int):
+            retries = RetryPolicy(total=retries)
+        self.retries: RetryPolicy | None = retries
+        self.rate_limiter = rate_limiter
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: The session.
+
+        """
+        if self.pool_manager is None:
+            self.pool_manager = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.maxsize or 0,
+                    limit_per_host=self.maxsize_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    ssl=self.ssl_context,
+                ),
+                timeout=self.timeout,
+                trust_env=True,
+            )
+        return self.pool_manager
+
+    async def warm_up(self, url: str, connections: int = 1) -> int:
+        """Open pooled keep-alive connections to a host ahead of the first request.
+
+        The connections are opened concurrently with lightweight HEAD requests, which resolve
+        the host and complete the TLS handshakes. Their responses are read in full so that each
+        connection is returned to the pool for reuse.
+
+        Args:
+            url (str): The URL of the host to connect to.
+            connections (int): The number of connections to open. Defaults to 1.
+
+        Returns:
+            int: The number of connections that were opened.
+
+        """
+        session = self._get_session()
+        if self.maxsize:
+            connections = min(connections, self.maxsize)
+        if self.maxsize_per_host:
+            connections = min(connections, self.maxsize_per_host)
+
+        args = {"timeout": self.timeout, **self._get_proxy_args()}
+
+        async def connect() -> None:
+            async with session.head(url, **args) as response:
+                await response.read()
+
+        results = await asyncio.gather(
+            *(connect() for _ in range(connections)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, aiohttp.ClientError | asyncio.TimeoutError
+            ):
+                raise result
+        return sum(1 for result in results if result is None)
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> RESTResponse:
+        """Execute a request, retrying it according to the retry policy.
+
+        Args:
+            method: The HTTP method.
+            url: The request URL, including the query string.
+            headers: The request headers.
+            body: The JSON body. A ``str`` or ``bytes`` body is sent as is, so that a body
+                serialized for signing is sent byte for byte.
+            post_params: The form parameters, for ``application/x-www-form-urlencoded`` and
+                ``multipart/form-data`` requests.
+            _request_timeout: The timeout of this request: a total timeout in seconds, a
+                (connect, read) tuple, or an aiohttp.ClientTimeout. Defaults to the
+                configured timeouts.
+
+        Returns:
+            RESTResponse: The response.
+
+        """
+        method = method.upper()
+        if post_params and body:
+            raise ApiValueError("body parameter cannot be used with post_params parameter.")
+
+        headers = headers or {}
+        headers.setdefault("Content-Type", "application/json")
+        args = {
+            "method": method,
+            "url": url,
+            "timeout": self._get_timeout(_request_timeout),
+            "headers": headers,
+            **self._get_proxy_args(),
+        }
+        if method in BODY_METHODS:
+            args["data"] = self._get_data(headers, body, post_params or {})
+
+        session = self._get_session()
+
+        # Form data is consumed when it is sent, so it can't be retried.
+        retry_state = None
+        if self.retries is not None and not isinstance(args.get("data"), aiohttp.FormData):
+            retry_state = self.retries.new_state(method, headers)
+
+        if retry_state is None:
+            return RESTResponse(await self._send(session, args))
+
+        while True:
+            try:
+                response = await self._send(session, args)
+            except RETRYABLE_ERRORS as e:
+                delay = retry_state.get_error_delay(e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+
+            delay = retry_state.get_status_delay(response.status, response.headers)
+            if delay is None:
+                return RESTResponse(response)
+            response.release()
+            await asyncio.sleep(delay)
+
+    async def _send(self, session: aiohttp.ClientSession, args: dict) -> aiohttp.ClientResponse:
+        """Send a single request, waiting for the rate limiter first."""
+        limiter = self.rate_limiter.get_limiter(args["url"]) if self.rate_limiter else None
+        if limiter is None:
+            return await session.request(**args)
+
+        await limiter.acquire()
+        response = await session.request(**args)
+        limiter.record(response.status)
+        return response
+
+    def _get_timeout(self, request_timeout) -> aiohttp.ClientTimeout:
+        if isinstance(request_timeout, aiohttp.ClientTimeout):
+            return request_timeout
+        if isinstance(request_timeout, tuple):
+            return aiohttp.ClientTimeout(
+                total=self.timeout.total,
+                sock_connect=request_timeout[0],
+                sock_read=request_timeout[1],
+            )
+        if request_timeout:
+            return aiohttp.ClientTimeout(
+                total=request_timeout,
+                sock_connect=self.timeout.sock_connect,
+                sock_read=self.timeout.sock_read,
+            )
+        return self.timeout
+
+    def _get_proxy_args(self) -> dict:
+        args = {}
+        if self.proxy:
+            args["proxy"] = self.proxy
+        if self.proxy_headers:
+            args["proxy_headers"] = self.proxy_headers
+        return args
+
+    def _get_data(self, headers: dict, body, post_params):
+        """Build the request data the way the generated REST client does."""
+        content_type = headers["Content-Type"]
+        if re.search("json", content_type, re.IGNORECASE):
+            if body is not None and not isinstance(body, str | bytes):
+                body = json.dumps(body)
+            return body
+        if content_type == "application/x-www-form-urlencoded":
+            return aiohttp.FormData(post_params)
+        if content_type == "multipart/form-data":
+            # aiohttp sets the Content-Type, with the boundary, itself.
+            del headers["Content-Type"]
+            data = aiohttp.FormData()
+            for key, value in post_params:
+                if isinstance(value, tuple) and len(value) == 3:
+                    data.add_field(key, value=value[1], filename=value[0], content_type=value[2])
+                else:
+                    if isinstance(value, dict):
+                        value = json.dumps(value)
+                    elif isinstance(value, int):
+                        value = str(value)
+                    data.add_field(key, value)
+            return data
+        if isinstance(body, str | bytes):
+            return body
+        raise ApiException(
+            status=0,
+            reason="Cannot prepare a request message for provided arguments. Please check "
+            "that your arguments match declared content type.",
+        )
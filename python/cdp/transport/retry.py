@@ -0,0 +1,316 @@
+import random
+import threading
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_RETRY_METHODS = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE"})
+DEFAULT_IDEMPOTENT_RETRY_STATUSES = frozenset({502, 503, 504})
+IDEMPOTENCY_KEY_HEADER = "X-Idempotency-Key"
+
+
+class RetryMetrics:
+    """Counters for the retries taken by a client.
+
+    The counters are shared by every request made through the client, so they can be read
+    at any time to monitor retry rates.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reasons: Counter[str] = Counter()
+        self._retries = 0
+        self._retry_after_waits = 0
+        self._backoff_seconds = 0.0
+        self._exhausted = 0
+
+    @property
+    def retries(self) -> int:
+        """Get the total number of retries taken.
+
+        Returns:
+            int: The number of retries.
+
+        """
+        return self._retries
+
+    @property
+    def retry_after_waits(self) -> int:
+        """Get the number of retries that waited for a Retry-After header.
+
+        Returns:
+            int: The number of retries that honored Retry-After.
+
+        """
+        return self._retry_after_waits
+
+    @property
+    def backoff_seconds(self) -> float:
+        """Get the total time spent waiting between retries.
+
+        Returns:
+            float: The total backoff time in seconds.
+
+        """
+        return self._backoff_seconds
+
+    @property
+    def exhausted(self) -> int:
+        """Get the number of requests that failed after using up their retry budget.
+
+        Returns:
+            int: The number of requests that gave up retrying.
+
+        """
+        return self._exhausted
+
+    @property
+    def reasons(self) -> dict[str, int]:
+        """Get the number of retries taken per reason.
+
+        The reason is the HTTP status code, or the exception class name for network errors.
+
+        Returns:
+            dict[str, int]: The number of retries per reason.
+
+        """
+        with self._lock:
+            return dict(self._reasons)
+
+    def snapshot(self) -> dict:
+        """Get a copy of all counters.
+
+        Returns:
+            dict: The counters, keyed by name.
+
+        """
+        with self._lock:
+            return {
+                "retries": self._retries,
+                "retry_after_waits": self._retry_after_waits,
+                "backoff_seconds": self._backoff_seconds,
+                "exhausted": self._exhausted,
+                "reasons": dict(self._reasons),
+            }
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self._reasons.clear()
+            self._retries = 0
+            self._retry_after_waits = 0
+            self._backoff_seconds = 0.0
+            self._exhausted = 0
+
+    def _record_retry(self, reason: str, delay: float, retry_after: bool) -> None:
+        with self._lock:
+            self._reasons[reason] += 1
+            self._retries += 1
+            self._backoff_seconds += delay
+            if retry_after:
+                self._retry_after_waits += 1
+
+    def _record_exhausted(self) -> None:
+        with self._lock:
+            self._exhausted += 1
+
+
+class RetryPolicy:
+    """A retry policy for the async HTTP transport.
+
+    Retries use exponential backoff with full jitter: the delay before retry ``n`` is drawn
+    uniformly from ``[0, min(backoff_max, backoff_factor * 2 ** n)]``. A ``Retry-After``
+    header on a retryable response takes precedence over the computed delay.
+
+    Requests with other methods, such as POST, are only retried when
+    ``retry_idempotent_requests`` is enabled and they carry an idempotency key, and then only
+    for the statuses in ``idempotent_status_forcelist``.
+    """
+
+    def __init__(
+        self,
+        total: int = 3,
+        status_forcelist: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        allowed_methods: Iterable[str] = DEFAULT_RETRY_METHODS,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 20.0,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        retry_budget: float | None = 60.0,
+        retry_on_connection_errors: bool = True,
+        retry_idempotent_requests: bool = False,
+        idempotent_status_forcelist: Iterable[int] = DEFAULT_IDEMPOTENT_RETRY_STATUSES,
+        metrics: RetryMetrics | None = None,
+    ) -> None:
+        """Initialize the retry policy.
+
+        Args:
+            total (int): The maximum number of retries per request. Defaults to 3.
+            status_forcelist (Iterable[int]): The HTTP status codes to retry.
+            allowed_methods (Iterable[str]): The HTTP methods that may be retried.
+            backoff_factor (float): The base delay, in seconds, of the exponential backoff.
+            backoff_max (float): The maximum backoff delay, in seconds, before a single retry.
+            respect_retry_after (bool): Whether to wait for the delay given by a Retry-After
+                header instead of the computed backoff.
+            max_retry_after (float): The longest Retry-After delay, in seconds, that is waited
+                for. Responses asking for a longer delay are returned without retrying.
+            retry_budget (float, optional): The maximum total time, in seconds, a single
+                request may spend waiting between retries. None means no limit.
+            retry_on_connection_errors (bool): Whether to retry connection errors and timeouts.
+            retry_idempotent_requests (bool): Whether to retry requests with an idempotency key
+                regardless of their method.
+            idempotent_status_forcelist (Iterable[int]): The HTTP status codes to retry for
+                requests that are only retried because of their idempotency key.
+            metrics (RetryMetrics, optional): The metrics to record retries in.
+
+        """
+        self.total = total
+        self.status_forcelist = frozenset(status_forcelist)
+        self.allowed_methods = frozenset(method.upper() for method in allowed_methods)
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.retry_budget = retry_budget
+        self.retry_on_connection_errors = retry_on_connection_errors
+        self.retry_idempotent_requests = retry_idempotent_requests
+        self.idempotent_status_forcelist = frozenset(idempotent_status_forcelist)
+        self.metrics = metrics or RetryMetrics()
+
+    def get_backoff(self, retry_number: int) -> float:
+        """Get a jittered backoff delay.
+
+        Args:
+            retry_number (int): The zero-based number of the retry.
+
+        Returns:
+            float: The delay in seconds.
+
+        """
+        cap = min(self.backoff_max, self.backoff_factor * (2**retry_number))
+        return random.uniform(0, cap)
+
+    def new_state(
+        self, method: str, headers: Mapping[str, str] | None = None
+    ) -> "RetryState | None":
+        """Start tracking the retries of a single request.
+
+        Args:
+            method (str): The HTTP method of the request.
+            headers (Mapping[str, str], optional): The request headers.
+
+        Returns:
+            RetryState | None: The retry state for the request, or None if the request may not
+                be retried.
+
+        """
+        if self.total <= 0:
+            return None
+        if method.upper() in self.allowed_methods:
+            return RetryState(self, self.status_forcelist)
+        if self.retry_idempotent_requests and headers and headers.get(IDEMPOTENCY_KEY_HEADER):
+            return RetryState(self, self.idempotent_status_forcelist)
+        return None
+
+
+class RetryState:
+    """The retry budget of a single request."""
+
+    def __init__(self, policy: RetryPolicy, status_forcelist: frozenset[int]) -> None:
+        """Initialize the retry state.
+
+        Args:
+            policy (RetryPolicy): The policy the request is retried under.
+            status_forcelist (frozenset[int]): The HTTP status codes to retry.
+
+        """
+        self.policy = policy
+        self.status_forcelist = status_forcelist
+        self.retries = 0
+        self.waited = 0.0
+
+    def get_status_delay(
+        self, status: int, headers: Mapping[str, str] | None = None
+    ) -> float | None:
+        """Get the delay before retrying a response.
+
+        Args:
+            status (int): The HTTP status code of the response.
+            headers (Mapping[str, str], optional): The response headers.
+
+        Returns:
+            float | None: The delay in seconds, or None if the response should not be retried.
+
+        """
+        if status not in self.status_forcelist:
+            return None
+
+        retry_after = None
+        if self.policy.respect_retry_after and headers is not None:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None and retry_after > self.policy.max_retry_after:
+                self.policy.metrics._record_exhausted()
+                return None
+
+        return self._next_delay(str(status), retry_after)
+
+    def get_error_delay(self, error: BaseException) -> float | None:
+        """Get the delay before retrying a request that failed with a network error.
+
+        Args:
+            error (BaseException): The error raised by the transport.
+
+        Returns:
+            float | None: The delay in seconds, or None if the request should not be retried.
+
+        """
+        if not self.policy.retry_on_connection_errors:
+            return None
+        return self._next_delay(type(error).__name__, None)
+
+    def _next_delay(self, reason: str, retry_after: float | None) -> float | None:
+        if self.retries >= self.policy.total:
+            self.policy.metrics._record_exhausted()
+            return None
+
+        delay = retry_after if retry_after is not None else self.policy.get_backoff(self.retries)
+        if self.policy.retry_budget is not None and self.waited + delay > self.policy.retry_budget:
+            self.policy.metrics._record_exhausted()
+            return None
+
+        self.retries += 1
+        self.waited += delay
+        self.policy.metrics._record_retry(reason, delay, retry_after is not None)
+        return delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header value.
+
+    Args:
+        value (str, optional): The header value, either a number of seconds or an HTTP date.
+
+    Returns:
+        float | None: The delay in seconds, or None if the value is missing or invalid.
+
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = retry_at.timestamp() - datetime.now(timezone.utc).timestamp()
+
+    if seconds != seconds or seconds == float("inf"):
+        return None
+    return max(0.0, seconds)
@@ -0,0 +1,159 @@
+from pydantic import BaseModel, Field, field_validator
+
+from cdp.transport.rate_limit import ENDPOINT_GROUPS
+
+
+class RetryOptions(BaseModel):
+    """Options for retrying failed requests to the CDP APIs.
+
+    The number of retries is set with ``max_network_retries`` on the client.
+    """
+
+    retry_statuses: list[int] = Field(
+        default=[429, 500, 502, 503, 504],
+        description="The HTTP status codes that are retried.",
+    )
+    backoff_factor: float = Field(
+        default=0.5,
+        ge=0,
+        description="The base delay, in seconds, of the exponential backoff. Each delay is "
+        "drawn at random between 0 and backoff_factor * 2 ** retry_number.",
+    )
+    backoff_max: float = Field(
+        default=20,
+        ge=0,
+        description="The maximum delay, in seconds, before a single retry.",
+    )
+    respect_retry_after: bool = Field(
+        default=True,
+        description="Whether to wait for the delay given by a Retry-After response header.",
+    )
+    max_retry_after: float = Field(
+        default=60,
+        ge=0,
+        description="The longest Retry-After delay, in seconds, that is waited for. Responses "
+        "asking for a longer delay are not retried.",
+    )
+    retry_budget: float | None = Field(
+        default=60,
+        ge=0,
+        description="The maximum total time, in seconds, a single request may spend waiting "
+        "between retries. None means no limit.",
+    )
+    retry_on_connection_errors: bool = Field(
+        default=True,
+        description="Whether to retry connection errors and timeouts.",
+    )
+
+
+class RateLimitOptions(BaseModel):
+    """Options for the client-side rate limit of an endpoint group.
+
+    The rate starts at max_rate, shrinks when the API responds with 429 or 503 and grows
+    back on successful responses.
+    """
+
+    max_rate: float = Field(
+        gt=0,
+        description="The maximum and initial number of requests per second.",
+    )
+    min_rate: float = Field(
+        default=1,
+        gt=0,
+        description="The number of requests per second the rate never shrinks below.",
+    )
+    burst: int | None = Field(
+        default=None,
+        ge=1,
+        description="The number of requests that may be sent at once after an idle period. "
+        "Defaults to max_rate.",
+    )
+    decrease_factor: float = Field(
+        default=0.5,
+        gt=0,
+        lt=1,
+        description="The factor the rate is multiplied by when the API throttles requests.",
+    )
+    increase_step: float = Field(
+        default=1,
+        gt=0,
+        description="How much the rate, in requests per second, grows per second of "
+        "successful requests.",
+    )
+
+
+class TransportOptions(BaseModel):
+    """Options for tuning the HTTP transport used to call the CDP APIs."""
+
+    connection_pool_size: int = Field(
+        default=100,
+        ge=0,
+        description="The maximum number of simultaneous connections. 0 means no limit.",
+    )
+    connections_per_host: int = Field(
+        default=0,
+        ge=0,
+        description="The maximum number of simultaneous connections to a single host. "
+        "0 means no limit beyond connection_pool_size.",
+    )
+    keepalive_timeout: float = Field(
+        default=15,
+        gt=0,
+        description="How long, in seconds, an idle connection is kept open for reuse.",
+    )
+    dns_cache_ttl: int | None = Field(
+        default=10,
+        ge=0,
+        description="How long, in seconds, resolved host addresses are cached. "
+        "None caches them for the lifetime of the client.",
+    )
+    connect_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="The maximum time, in seconds, to establish a new connection. "
+        "None means no separate limit.",
+    )
+    read_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="The maximum time, in seconds, to wait between reads of the response. "
+        "None means no separate limit.",
+    )
+    request_timeout: float | None = Field(
+        default=300,
+        gt=0,
+        description="The maximum total time, in seconds, for a request. None means no limit.",
+    )
+    retry_options: RetryOptions = Field(
+        default_factory=RetryOptions,
+        description="Backoff, Retry-After and retry budget settings for failed requests.",
+    )
+    rate_limits: dict[str, RateLimitOptions] | None = Field(
+        default=None,
+        description="Client-side rate limits keyed by endpoint group: accounts, signing, "
+        "policies, payments, faucets or other. Groups without a limit are not limited.",
+    )
+
+    @field_validator("rate_limits")
+    @classmethod
+    def validate_rate_limits(
+        cls, v: dict[str, RateLimitOptions] | None
+    ) -> dict[str, RateLimitOptions] | None:
+        """Validate the endpoint groups of the rate limits.
+
+        Args:
+            v: The rate limits to validate.
+
+        Returns:
+            The validated rate limits.
+
+        Raises:
+            ValueError: If an endpoint group is unknown.
+
+        """
+        for group in v or {}:
+            if group not in ENDPOINT_GROUPS:
+                raise ValueError(
+                    f"Unknown endpoint group: {group}. Must be one of: {', '.join(ENDPOINT_GROUPS)}"
+                )
+        return v
@@ -0,0 +1,293 @@
+import asyncio
+import contextlib
+import random
+import time
+from collections.abc import AsyncIterator
+
+import aiohttp
+from pydantic import BaseModel, Field
+
+from cdp.api_clients import ApiClients
+from cdp.constants import USER_OPERATION_FINAL_STATUSES
+from cdp.openapi_client.errors import ApiError
+from cdp.openapi_client.exceptions import ApiException
+from cdp.openapi_client.models.evm_user_operation import EvmUserOperation as EvmUserOperationModel
+from cdp.transport.retry import DEFAULT_RETRY_STATUSES
+
+
+class UserOperationStatusEvent(BaseModel):
+    """A change in the status of a tracked user operation."""
+
+    smart_account_address: str = Field(description="The address of the smart account.")
+    user_op_hash: str = Field(description="The hash of the user operation.")
+    user_operation: EvmUserOperationModel = Field(description="The user operation.")
+
+    @property
+    def status(self) -> str:
+        """Get the new status of the user operation.
+
+        Returns:
+            str: The status of the user operation.
+
+        """
+        return self.user_operation.status
+
+
+class _TrackedUserOperation:
+    """A user operation that is being tracked."""
+
+    __slots__ = (
+        "failures",
+        "future",
+        "last_polled_at",
+        "next_poll_at",
+        "registered_at",
+        "smart_account_address",
+        "status",
+        "user_op_hash",
+    )
+
+    def __init__(self, smart_account_address: str, user_op_hash: str, future: asyncio.Future):
+        self.smart_account_address = smart_account_address
+        self.user_op_hash = user_op_hash
+        self.future = future
+        self.registered_at = time.monotonic()
+        self.last_polled_at = float("-inf")
+        self.next_poll_at = float("-inf")
+        self.failures = 0
+        self.status: str | None = None
+
+
+class UserOperationTracker:
+    """Tracks the status of many pending user operations with a single polling loop.
+
+    Each round polls, concurrently, at most ``max_concurrency`` of the tracked user
+    operations, those polled least recently first, and rounds are ``interval_seconds`` apart,
+    so the request rate stays bounded no matter how many user operations are pending and
+    every one of them keeps being polled. A user operation stops being tracked once it is
+    ``complete`` or ``failed``. Polls that fail with a transient error, such as a 429, a 5xx
+    or a network error, are retried after an exponential backoff. Other errors, or
+    ``max_poll_retries`` transient errors in a row, fail the user operation.
+    """
+
+    def __init__(
+        self,
+        api_clients: ApiClients,
+        max_concurrency: int = 10,
+        interval_seconds: float = 1.0,
+        max_poll_retries: int = 10,
+        max_backoff_seconds: float = 30.0,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            api_clients (ApiClients): The API clients.
+            max_concurrency (int): The maximum number of user operations polled per round.
+                Defaults to 10.
+            interval_seconds (float): The time between polling rounds in seconds.
+                Defaults to 1.
+            max_poll_retries (int): How many transient errors in a row a user operation is
+                retried after before it fails. Defaults to 10.
+            max_backoff_seconds (float): The maximum backoff before retrying a user operation
+                after a transient error, in seconds. Defaults to 30.
+
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if interval_seconds < 0:
+            raise ValueError("interval_seconds must not be negative")
+
+        self.api_clients = api_clients
+        self.max_concurrency = max_concurrency
+        self.interval_seconds = interval_seconds
+        self.max_poll_retries = max_poll_retries
+        self.max_backoff_seconds = max_backoff_seconds
+        self._tracked: dict[tuple[str, str], _TrackedUserOperation] = {}
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        """Get the number of tracked user operations.
+
+        Returns:
+            int: The number of user operations that haven't finished yet.
+
+        """
+        return len(self._tracked)
+
+    def track(self, smart_account_address: str, user_op_hash: str) -> asyncio.Future:
+        """Start tracking a user operation.
+
+        Tracking the same user operation again returns the same future.
+
+        Args:
+            smart_account_address (str): The address of the smart account that sent the operation.
+            user_op_hash (str): The hash of the user operation.
+
+        Returns:
+            asyncio.Future: A future that resolves to the user operation once it is complete or
+                failed, or raises the error that prevented fetching it.
+
+        """
+        key = _user_operation_key(smart_account_address, user_op_hash)
+        tracked = self._tracked.get(key)
+        if tracked is None:
+            future = asyncio.get_running_loop().create_future()
+            tracked = _TrackedUserOperation(smart_account_address, user_op_hash, future)
+            self._tracked[key] = tracked
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return tracked.future
+
+    def untrack(self, smart_account_address: str, user_op_hash: str) -> None:
+        """Stop tracking a user operation and cancel its future.
+
+        Args:
+            smart_account_address (str): The address of the smart account that sent the operation.
+            user_op_hash (str): The hash of the user operation.
+
+        """
+        tracked = self._tracked.pop(_user_operation_key(smart_account_address, user_op_hash), None)
+        if tracked is not None:
+            tracked.future.cancel()
+
+    async def wait(
+        self,
+        smart_account_address: str,
+        user_op_hash: str,
+        timeout_seconds: float | None = None,
+    ) -> EvmUserOperationModel:
+        """Track a user operation and wait for it to complete or fail.
+
+        The user operation is still tracked after a timeout.
+
+        Args:
+            smart_account_address (str): The address of the smart account that sent the operation.
+            user_op_hash (str): The hash of the user operation.
+            timeout_seconds (float, optional): Maximum time to wait in seconds. Defaults to no
+                timeout.
+
+        Returns:
+            EvmUserOperationModel: The complete or failed user operation.
+
+        Raises:
+            TimeoutError: If the operation doesn't finish within the specified timeout.
+
+        """
+        future = self.track(smart_account_address, user_op_hash)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout_seconds)
+        except asyncio.TimeoutError:
+            raise TimeoutError("User Operation timed out") from None
+
+    async def events(self) -> AsyncIterator[UserOperationStatusEvent]:
+        """Iterate over the status changes of all tracked user operations.
+
+        The iteration ends when the tracker is closed.
+
+        Yields:
+            UserOperationStatusEvent: A status change, including the first status observed
+                for each user operation.
+
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.add(queue)
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    return
+                yield event
+        finally:
+            self._subscribers.discard(queue)
+
+    async def close(self) -> None:
+        """Stop polling, cancel the futures of all tracked user operations and end the events."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        for tracked in self._tracked.values():
+            tracked.future.cancel()
+        self._tracked.clear()
+
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+
+    async def _run(self) -> None:
+        while True:
+            for key, tracked in list(self._tracked.items()):
+                if tracked.future.done():
+                    del self._tracked[key]
+            if not self._tracked:
+                return
+
+            now = time.monotonic()
+            due = [item for item in self._tracked.items() if item[1].next_poll_at <= now]
+            batch = sorted(due, key=lambda item: (item[1].last_polled_at, item[1].registered_at))[
+                : self.max_concurrency
+            ]
+            for _, tracked in batch:
+                tracked.last_polled_at = now
+            await asyncio.gather(*(self._poll(key, tracked) for key, tracked in batch))
+
+            if self._tracked:
+                delay = self.interval_seconds
+                if not batch:
+                    # Every user operation is backing off, so wait for the first to be due.
+                    next_poll_at = min(tracked.next_poll_at for tracked in self._tracked.values())
+                    delay = max(delay, next_poll_at - now)
+                await asyncio.sleep(delay)
+
+    async def _poll(self, key: tuple[str, str], tracked: _TrackedUserOperation) -> None:
+        try:
+            user_operation = await self.api_clients.evm_smart_accounts.get_user_operation(
+                tracked.smart_account_address, tracked.user_op_hash
+            )
+        except Exception as e:
+            if _is_transient_error(e) and tracked.failures < self.max_poll_retries:
+                backoff = min(self.max_backoff_seconds, self.interval_seconds * 2**tracked.failures)
+                tracked.next_poll_at = time.monotonic() + random.uniform(backoff / 2, backoff)
+                tracked.failures += 1
+                return
+            self._remove(key, tracked)
+            if not tracked.future.done():
+                tracked.future.set_exception(e)
+            return
+
+        tracked.failures = 0
+
+        if user_operation.status != tracked.status:
+            tracked.status = user_operation.status
+            event = UserOperationStatusEvent(
+                smart_account_address=tracked.smart_account_address,
+                user_op_hash=tracked.user_op_hash,
+                user_operation=user_operation,
+            )
+            for queue in self._subscribers:
+                queue.put_nowait(event)
+
+        if user_operation.status in USER_OPERATION_FINAL_STATUSES:
+            self._remove(key, tracked)
+            if not tracked.future.done():
+                tracked.future.set_result(user_operation)
+
+    def _remove(self, key: tuple[str, str], tracked: _TrackedUserOperation) -> None:
+        if self._tracked.get(key) is tracked:
+            del self._tracked[key]
+
+
+def _is_transient_error(error: Exception) -> bool:
+    if isinstance(error, ApiError):
+        return error.http_code in DEFAULT_RETRY_STATUSES
+    if isinstance(error, ApiException):
+        return error.status in DEFAULT_RETRY_STATUSES
+    return isinstance(error, aiohttp.ClientError | asyncio.TimeoutError | ConnectionError)
+
+
+def _user_operation_key(smart_account_address: str, user_op_hash: str) -> tuple[str, str]:
+    return smart_account_address.lower(), user_op_hash.lower()
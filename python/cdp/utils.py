@@ -1,7 +1,29 @@
+import hashlib
 import inspect
 import re
+import uuid
+from collections.abc import Mapping
+from typing import Any
 
 from eth_account.typed_transactions import DynamicFeeTransaction
+from eth_utils import is_checksum_address
+
+from cdp.evm_transaction_types import TransactionRequestEIP1559
+
+_EIP1559_FIELDS = frozenset(
+    {
+        "chainId",
+        "nonce",
+        "maxPriorityFeePerGas",
+        "maxFeePerGas",
+        "gas",
+        "to",
+        "value",
+        "data",
+        "accessList",
+        "type",
+    }
+)
 
 
 async def ensure_awaitable(func, *args, **kwargs):
@@ -25,6 +47,23 @@ async def ensure_awaitable(func, *args, **kwargs):
     return result
 
 
+def derive_idempotency_key(*parts: Any) -> str:
+    """Derive a deterministic idempotency key from the parts that identify a request.
+
+    The key is formatted as a UUID v4, as the CDP APIs expect, so the same parts always
+    produce the same key and a rerun of the same request is deduplicated by the API.
+
+    Args:
+        *parts (Any): The values that identify the request.
+
+    Returns:
+        str: The idempotency key.
+
+    """
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode()).digest()
+    return str(uuid.UUID(bytes=digest[:16], version=4))
+
+
 def serialize_unsigned_transaction(transaction: DynamicFeeTransaction) -> str:
     """Serialize an unsigned transaction.
 
@@ -43,6 +82,159 @@ def serialize_unsigned_transaction(transaction: DynamicFeeTransaction) -> str:
     return f"0x{serialized_tx.hex()}"
 
 
+def serialize_eip1559_transaction(transaction: TransactionRequestEIP1559) -> str:
+    """Serialize an unsigned EIP-1559 transaction request.
+
+    The output is the same as ``serialize_unsigned_transaction`` of a ``DynamicFeeTransaction``
+    built from the request, but a well-formed request is RLP-encoded directly, without
+    eth-account's validation and intermediate objects. Other requests, such as ones with a
+    non-checksummed address, go through eth-account so that they fail the same way.
+
+    Args:
+        transaction: The transaction request to serialize
+
+    Returns: The serialized transaction
+
+    """
+    serialized_tx = _serialize_eip1559_fields(
+        transaction.chainId,
+        transaction.nonce,
+        transaction.maxPriorityFeePerGas,
+        transaction.maxFeePerGas,
+        transaction.gas,
+        transaction.to,
+        transaction.value,
+        transaction.data,
+        transaction.accessList,
+        transaction.type,
+    )
+    if serialized_tx is None:
+        serialized_tx = serialize_unsigned_transaction(
+            DynamicFeeTransaction.from_dict(transaction.as_dict())
+        )
+    return serialized_tx
+
+
+def serialize_eip1559_transaction_dict(transaction: Mapping[str, Any]) -> str | None:
+    """Serialize an unsigned EIP-1559 transaction dict directly, if it is well-formed.
+
+    Args:
+        transaction: The transaction dict
+
+    Returns: The serialized transaction, or None if the dict doesn't have exactly the fields of
+        an EIP-1559 transaction in their canonical form and must be serialized by eth-account
+
+    """
+    if transaction.keys() != _EIP1559_FIELDS:
+        return None
+    return _serialize_eip1559_fields(
+        transaction["chainId"],
+        transaction["nonce"],
+        transaction["maxPriorityFeePerGas"],
+        transaction["maxFeePerGas"],
+        transaction["gas"],
+        transaction["to"],
+        transaction["value"],
+        transaction["data"],
+        transaction["accessList"],
+        transaction["type"],
+    )
+
+
+def _serialize_eip1559_fields(
+    chain_id: Any,
+    nonce: Any,
+    max_priority_fee_per_gas: Any,
+    max_fee_per_gas: Any,
+    gas: Any,
+    to: Any,
+    value: Any,
+    data: Any,
+    access_list: Any,
+    transaction_type: Any,
+) -> str | None:
+    if transaction_type not in (2, "0x2", "0x02"):
+        return None
+    integers = (chain_id, nonce, max_priority_fee_per_gas, max_fee_per_gas, gas)
+    if not all(_is_uint(integer) for integer in (*integers, value)):
+        return None
+    to_bytes = _address_bytes(to)
+    data_bytes = _hex_bytes(data)
+    if to_bytes is None or data_bytes is None or not isinstance(access_list, list):
+        return None
+
+    access_list_items = []
+    for entry in access_list:
+        if not isinstance(entry, dict) or entry.keys() != {"address", "storageKeys"}:
+            return None
+        address = _address_bytes(entry["address"])
+        if address is None or not isinstance(entry["storageKeys"], list):
+            return None
+        storage_keys = []
+        for storage_key in entry["storageKeys"]:
+            key = _hex_bytes(storage_key)
+            if key is None or len(key) != 32:
+                return None
+            storage_keys.append(_rlp_encode_bytes(key))
+        access_list_items.append(
+            _rlp_encode_list([_rlp_encode_bytes(address), _rlp_encode_list(storage_keys)])
+        )
+
+    payload = _rlp_encode_list(
+        [
+            *(_rlp_encode_int(integer) for integer in integers),
+            _rlp_encode_bytes(to_bytes),
+            _rlp_encode_int(value),
+            _rlp_encode_bytes(data_bytes),
+            _rlp_encode_list(access_list_items),
+            # The unsigned transaction has zero signature fields.
+            b"\x80\x80\x80",
+        ]
+    )
+    return "0x02" + payload.hex()
+
+
+def _is_uint(value: Any) -> bool:
+    return type(value) is int and value >= 0
+
+
+def _address_bytes(address: Any) -> bytes | None:
+    if not isinstance(address, str) or not is_checksum_address(address):
+        return None
+    return bytes.fromhex(address[2:])
+
+
+def _hex_bytes(value: Any) -> bytes | None:
+    if not isinstance(value, str) or not value.startswith("0x"):
+        return None
+    try:
+        return bytes.fromhex(value[2:])
+    except ValueError:
+        return None
+
+
+def _rlp_encode_length(length: int, offset: int) -> bytes:
+    if length < 56:
+        return bytes([offset + length])
+    length_bytes = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([offset + 55 + len(length_bytes)]) + length_bytes
+
+
+def _rlp_encode_bytes(value: bytes) -> bytes:
+    if len(value) == 1 and value[0] < 0x80:
+        return value
+    return _rlp_encode_length(len(value), 0x80) + value
+
+
+def _rlp_encode_int(value: int) -> bytes:
+    return _rlp_encode_bytes(value.to_bytes((value.bit_length() + 7) // 8, "big"))
+
+
+def _rlp_encode_list(items: list[bytes]) -> bytes:
+    payload = b"".join(items)
+    return _rlp_encode_length(len(payload), 0xC0) + payload
+
+
 class InvalidDecimalNumberError(Exception):
     """Exception raised for invalid decimal number strings.
 